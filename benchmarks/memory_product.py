@@ -0,0 +1,137 @@
+"""
+Замер памяти на один товар: прежняя раскладка с __dict__ против текущей на __slots__.
+
+Отдельно замеряются товары, добавленные в категорию: Category подписывается на каждый свой товар,
+и стоимость подписки входит в память товара.
+
+Запуск:
+    python -m benchmarks.memory_product --count 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from src.model import Category, Product, Smartphone
+
+COLORS = ["Серый", "Синий", "Gray space", "Черный"]
+MODELS = ["S23 Ultra", "15", "Note 11"]
+
+
+class LegacyProduct:
+    """Копия Product до перехода на __slots__ (атрибуты в __dict__)."""
+
+    def __init__(self, name: str, description: str, price: float, quantity: int) -> None:
+        self.name = name
+        self.description = description
+        self._price = price
+        self._quantity = quantity
+
+
+class LegacySmartphone(LegacyProduct):
+    """Копия Smartphone до перехода на __slots__ (без интернирования строк)."""
+
+    def __init__(self, name: str, description: str, price: float, quantity: int,
+                 efficiency: float, model: str, memory: int, color: str) -> None:
+        super().__init__(name, description, price, quantity)
+        self.efficiency = efficiency
+        self.model = model
+        self.memory = memory
+        self.color = color
+
+
+def _fresh(value: str) -> str:
+    """Возвращает новую копию строки, как если бы она была заново прочитана из JSON."""
+    return value.encode("utf-8").decode("utf-8")
+
+
+def measure(factory: Callable[[int], Any], count: int) -> float:
+    """
+    Возвращает средний прирост памяти в байтах на один созданный объект.
+
+    Args:
+        factory (Callable[[int], Any]): Функция, создающая объект по порядковому номеру.
+        count (int): Количество создаваемых объектов.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects: List[Any] = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def _in_category(count: int) -> float:
+    """Байты на товар, добавленный в категорию через add_product (вместе со ссылкой в списке категории)."""
+    category = Category("Замер", "", [])
+
+    def factory(i: int) -> Product:
+        prod = Product(f"Товар {i}", "Описание", 100.0, i)
+        category.add_product(prod)
+        return prod
+
+    return measure(factory, count)
+
+
+def _legacy_in_category(count: int) -> float:
+    """Байты на товар прежней раскладки в списке категории (до подписок категории на товары)."""
+    products: List[LegacyProduct] = []
+
+    def factory(i: int) -> LegacyProduct:
+        prod = LegacyProduct(f"Товар {i}", "Описание", 100.0, i)
+        products.append(prod)
+        return prod
+
+    return measure(factory, count)
+
+
+def run(count: int) -> Dict[str, Dict[str, float]]:
+    """
+    Замеряет память для Product и Smartphone в старой и новой раскладке.
+
+    Args:
+        count (int): Количество объектов в каждом замере.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Байты на объект по классам: {"Product": {"before": ..., "after": ...}, ...}.
+    """
+    results = {
+        "Product": {
+            "before": measure(lambda i: LegacyProduct(f"Товар {i}", "Описание", 100.0, i), count),
+            "after": measure(lambda i: Product(f"Товар {i}", "Описание", 100.0, i), count),
+        },
+        "Product в категории": {"before": _legacy_in_category(count), "after": _in_category(count)},
+        "Smartphone": {
+            "before": measure(
+                lambda i: LegacySmartphone(
+                    f"Телефон {i}", "Описание", 100.0, i, 90.0,
+                    _fresh(MODELS[i % len(MODELS)]), 256, _fresh(COLORS[i % len(COLORS)]),
+                ),
+                count,
+            ),
+            "after": measure(
+                lambda i: Smartphone(
+                    f"Телефон {i}", "Описание", 100.0, i, 90.0,
+                    _fresh(MODELS[i % len(MODELS)]), 256, _fresh(COLORS[i % len(COLORS)]),
+                ),
+                count,
+            ),
+        },
+    }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Замер памяти на один товар")
+    parser.add_argument("--count", type=int, default=100_000, help="Количество объектов в замере")
+    args = parser.parse_args()
+    for cls_name, result in run(args.count).items():
+        saved = 100 * (1 - result["after"] / result["before"])
+        print(f"{cls_name}: до {result['before']:.1f} байт, после {result['after']:.1f} байт (экономия {saved:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""
+Бенчмарки горячих путей src/model.py на синтетических каталогах.
+
+Для каждого сценария и размера каталога измеряются операции в секунду и пиковая память (tracemalloc),
+результаты записываются в JSON и при необходимости сравниваются с сохраненным базовым прогоном.
+
+Запуск:
+    python -m benchmarks.model_bench --sizes 1000 100000 1000000 --output bench.json
+    python -m benchmarks.model_bench --sizes 1000 --baseline bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.exporter import write_jsonl
+from src.factory import ProductFactory
+from src.loader import stream_categories
+from src.model import Category, Product, ProductRegistry
+from src.search import SearchIndex
+from src.valuation import value_catalog
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+# Поиск дубликатов по списку квадратичен, поэтому этот сценарий ограничен по размеру.
+LIST_SCAN_LIMIT = 10_000
+
+Case = Callable[[int], Tuple[Callable[[], Any], int]]
+
+
+def make_records(size: int, duplicate_ratio: float = 0.1) -> List[Dict[str, Any]]:
+    """
+    Создает словари товаров; примерно duplicate_ratio из них повторяют названия других товаров.
+
+    Args:
+        size (int): Количество словарей.
+        duplicate_ratio (float): Доля дубликатов.
+    """
+    unique = max(1, int(size * (1 - duplicate_ratio)))
+    return [
+        {"name": f"Товар {i % unique}", "description": "Описание товара", "price": 100.0 + i % 97, "quantity": i % 50}
+        for i in range(size)
+    ]
+
+
+def make_products(size: int) -> List[Product]:
+    """Создает size различных товаров."""
+    return [Product(f"Товар {i}", "Описание товара", 100.0 + i % 97, i % 50) for i in range(size)]
+
+
+def case_new_product_list(size: int) -> Tuple[Callable[[], Any], int]:
+    records = make_records(size)
+
+    def run() -> Any:
+        existing: List[Product] = []
+        for record in records:
+            Product.new_product(record, existing)
+
+    return run, size
+
+
+def case_new_product_registry(size: int) -> Tuple[Callable[[], Any], int]:
+    records = make_records(size)
+
+    def run() -> Any:
+        ProductRegistry().upsert_many(records)
+
+    return run, size
+
+
+def case_factory_build(size: int) -> Tuple[Callable[[], Any], int]:
+    records = make_records(size)
+    factory = ProductFactory()
+
+    def run() -> Any:
+        factory.build_many(records, ProductRegistry(), pause_gc=True)
+
+    return run, size
+
+
+def case_add_product(size: int) -> Tuple[Callable[[], Any], int]:
+    products = make_products(size)
+
+    def run() -> Any:
+        category = Category("Бенчмарк", "", [])
+        for prod in products:
+            category.add_product(prod)
+
+    return run, size
+
+
+def case_products_render(size: int) -> Tuple[Callable[[], Any], int]:
+    products = make_products(size)
+    category = Category("Бенчмарк", "", products)
+
+    def run() -> Any:
+        # Замеряется только построение строки: кэши товаров и категории сбрасываются без пересоздания категории.
+        for prod in products:
+            prod._str_cache = prod._line_cache = None
+        category._products_cache = None
+        _ = category.products
+
+    return run, size
+
+
+def case_iterator(size: int) -> Tuple[Callable[[], Any], int]:
+    category = Category("Бенчмарк", "", make_products(size))
+
+    def run() -> Any:
+        for _ in category:
+            pass
+
+    return run, size
+
+
+def case_add_valuation(size: int) -> Tuple[Callable[[], Any], int]:
+    products = make_products(size)
+    pairs = list(zip(products[::2], products[1::2]))
+
+    def run() -> Any:
+        total = 0.0
+        for a, b in pairs:
+            total += a + b
+        return total
+
+    return run, len(pairs)
+
+
+def case_catalog_valuation(size: int) -> Tuple[Callable[[], Any], int]:
+    products = make_products(size)
+    per_category = min(size, 1000)
+    categories = [
+        Category("Бенчмарк", "", products[start : start + per_category]) for start in range(0, size, per_category)
+    ]
+
+    def run() -> Any:
+        return value_catalog(categories, exact=True)
+
+    return run, size
+
+
+def case_search_fuzzy(size: int) -> Tuple[Callable[[], Any], int]:
+    """Нечеткий поиск среди названий с общим префиксом («Товар 0», «Товар 1», ...): триграммы почти не сужают."""
+    index = SearchIndex([Category("Бенчмарк", "", make_products(size))])
+    step = max(1, size // 100)
+    queries = [f"Товар {i}" for i in range(0, size, step)] + [f"Тавар {i}" for i in range(step // 2, size, step)]
+    index.fuzzy(queries[0])
+
+    def run() -> Any:
+        for query in queries:
+            index.fuzzy(query)
+
+    return run, len(queries)
+
+
+_catalog_files: Dict[int, str] = {}
+
+
+def _write_catalog(size: int) -> str:
+    """Записывает (один раз на размер) временный JSON-каталог из категорий по 1000 товаров."""
+    if size not in _catalog_files:
+        per_category = min(size, 1000)
+        data = [
+            {"name": f"Категория {start}", "description": "Описание", "products": make_records(per_category)}
+            for start in range(0, size, per_category)
+        ]
+        fd, path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        _catalog_files[size] = path
+    return _catalog_files[size]
+
+
+def _remove_catalogs() -> None:
+    while _catalog_files:
+        os.remove(_catalog_files.popitem()[1])
+
+
+def case_parser_json(size: int) -> Tuple[Callable[[], Any], int]:
+    path = _write_catalog(size)
+
+    def run() -> Any:
+        Category("", "", []).parser_json(path)
+
+    return run, size
+
+
+def case_stream_categories(size: int) -> Tuple[Callable[[], Any], int]:
+    path = _write_catalog(size)
+
+    def run() -> Any:
+        for _ in stream_categories(path):
+            pass
+
+    return run, size
+
+
+def case_export_jsonl(size: int) -> Tuple[Callable[[], Any], int]:
+    category = Category("Бенчмарк", "", make_products(size))
+
+    def run() -> Any:
+        with open(os.devnull, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+            write_jsonl([category], f)
+
+    return run, size
+
+
+CASES: Dict[str, Case] = {
+    "new_product_list": case_new_product_list,
+    "new_product_registry": case_new_product_registry,
+    "factory_build": case_factory_build,
+    "add_product": case_add_product,
+    "products_render": case_products_render,
+    "iterator": case_iterator,
+    "add_valuation": case_add_valuation,
+    "catalog_valuation": case_catalog_valuation,
+    "parser_json": case_parser_json,
+    "stream_categories": case_stream_categories,
+    "export_jsonl": case_export_jsonl,
+    "search_fuzzy": case_search_fuzzy,
+}
+
+
+def measure(case: Case, size: int, repeat: int = 3, memory: bool = True) -> Dict[str, Any]:
+    """
+    Выполняет сценарий и возвращает лучшее время из repeat запусков и пиковую память.
+
+    Args:
+        case (Case): Сценарий: по размеру возвращает (функция запуска, число операций).
+        size (int): Размер каталога.
+        repeat (int): Количество запусков для замера времени.
+        memory (bool): Замерять ли пиковую память (отдельным запуском под tracemalloc).
+    """
+    run, ops = case(size)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    peak: Optional[int] = None
+    if memory:
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"size": size, "ops": ops, "seconds": best, "ops_per_sec": ops / best if best else None, "peak_bytes": peak}
+
+
+def run_suite(
+    sizes: List[int], cases: Optional[List[str]] = None, repeat: int = 3, memory: bool = True
+) -> Dict[str, Any]:
+    """
+    Прогоняет выбранные сценарии на всех размерах.
+
+    Returns:
+        Dict[str, Any]: {"meta": {...}, "results": {"сценарий": {"размер": {...}}}}.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        for name in cases or list(CASES):
+            results[name] = {}
+            for size in sizes:
+                if name == "new_product_list" and size > LIST_SCAN_LIMIT:
+                    continue
+                results[name][str(size)] = measure(CASES[name], size, repeat, memory)
+    finally:
+        _remove_catalogs()
+    meta = {"python": sys.version.split()[0], "platform": platform.platform(), "time": time.time()}
+    return {"meta": meta, "results": results}
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2) -> List[str]:
+    """
+    Сравнивает прогон с базовым и возвращает описания регрессий.
+
+    Регрессией считается падение ops/sec больше чем на долю threshold. Сценарии и размеры,
+    отсутствующие в одном из прогонов, не сравниваются.
+
+    Args:
+        current (Dict[str, Any]): Текущий прогон (результат run_suite).
+        baseline (Dict[str, Any]): Базовый прогон.
+        threshold (float): Допустимая доля падения производительности.
+    """
+    regressions = []
+    for name, by_size in current["results"].items():
+        for size, result in by_size.items():
+            base = baseline["results"].get(name, {}).get(size)
+            if not base or not base.get("ops_per_sec") or not result.get("ops_per_sec"):
+                continue
+            ratio = result["ops_per_sec"] / base["ops_per_sec"]
+            if ratio < 1 - threshold:
+                regressions.append(f"{name}[{size}]: {ratio:.2f}x от базового ({base['ops_per_sec']:.0f} ops/s)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки src/model.py")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Размеры каталога")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), help="Сценарии (по умолчанию все)")
+    parser.add_argument("--repeat", type=int, default=3, help="Количество запусков для замера времени")
+    parser.add_argument("--no-memory", action="store_true", help="Не замерять пиковую память")
+    parser.add_argument("--output", help="Файл для записи результатов в JSON")
+    parser.add_argument("--baseline", help="JSON базового прогона для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Допустимая доля падения ops/sec")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.sizes, args.cases, args.repeat, not args.no_memory)
+    for name, by_size in report["results"].items():
+        for size, result in by_size.items():
+            peak = result["peak_bytes"]
+            memory = f", пик {peak / 1024 / 1024:.1f} МБ" if peak is not None else ""
+            print(f"{name:<22} {size:>9}: {result['ops_per_sec']:>14,.0f} ops/s{memory}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"РЕГРЕССИЯ {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import itertools
+import threading
+import weakref
+from typing import Any, Dict, List
+
+
+class _CellHolder:
+    """Держатель ячейки в threading.local: исчезает вместе с потоком и запускает перенос его ячейки."""
+
+    __slots__ = ("cell", "__weakref__")
+
+    def __init__(self, cell: List[int]) -> None:
+        self.cell = cell
+
+
+class ShardedCounter:
+    """
+    Счетчик, разделенный на ячейки по потокам.
+
+    Каждый поток увеличивает только собственную ячейку, поэтому add не требует общей блокировки
+    и не теряет обновления при одновременной работе нескольких потоков. Значение счетчика — сумма ячеек.
+    Когда поток завершается, его ячейка прибавляется к базовому значению и удаляется, поэтому число ячеек
+    не превышает числа живых потоков, обращавшихся к счетчику.
+    """
+
+    def __init__(self, value: int = 0) -> None:
+        """
+        Инициализирует счетчик начальным значением.
+
+        Args:
+            value (int): Начальное значение.
+        """
+        self._base: int = value
+        self._cells: Dict[int, List[int]] = {}
+        self._keys = itertools.count()
+        self._local = threading.local()
+        self._register_lock = threading.Lock()
+
+    def _cell(self) -> List[int]:
+        """Возвращает ячейку текущего потока, создавая ее при первом обращении."""
+        try:
+            return self._local.holder.cell  # type: ignore[no-any-return]
+        except AttributeError:
+            cell = [0]
+            holder = _CellHolder(cell)
+            with self._register_lock:
+                key = next(self._keys)
+                self._cells[key] = cell
+            # threading.local освобождает holder при завершении потока.
+            weakref.finalize(holder, self._retire, key)
+            self._local.holder = holder
+            return cell
+
+    def _retire(self, key: int) -> None:
+        """Переносит значение ячейки завершившегося потока в базовое значение."""
+        with self._register_lock:
+            cell = self._cells.pop(key, None)
+            if cell is not None:
+                self._base += cell[0]
+
+    def add(self, amount: int = 1) -> None:
+        """
+        Увеличивает счетчик на amount.
+
+        Args:
+            amount (int): Величина приращения.
+        """
+        self._cell()[0] += amount
+
+    @property
+    def value(self) -> int:
+        """Возвращает текущее значение счетчика (сумму по всем потокам)."""
+        with self._register_lock:
+            return self._base + sum(cell[0] for cell in self._cells.values())
+
+    def reset(self, value: int = 0) -> None:
+        """
+        Устанавливает значение счетчика. Не предназначен для вызова одновременно с add.
+
+        Args:
+            value (int): Новое значение.
+        """
+        with self._register_lock:
+            self._base = value
+            for cell in self._cells.values():
+                cell[0] = 0
+
+
+class StripedLock:
+    """
+    Набор блокировок, распределяющий объекты по полосам (stripes) по id объекта.
+
+    Потоки, работающие с разными объектами, как правило, получают разные блокировки и не мешают друг другу,
+    при этом не требуется отдельная блокировка на каждый объект.
+    """
+
+    def __init__(self, stripes: int = 64) -> None:
+        """
+        Инициализирует набор блокировок.
+
+        Args:
+            stripes (int): Количество полос.
+
+        Raises:
+            ValueError: Если stripes меньше 1.
+        """
+        if stripes < 1:
+            raise ValueError("Количество полос должно быть не меньше 1")
+        self._locks = [threading.RLock() for _ in range(stripes)]
+
+    def get(self, obj: Any) -> Any:
+        """
+        Возвращает блокировку (threading.RLock) для объекта.
+
+        Args:
+            obj (Any): Защищаемый объект.
+        """
+        return self._locks[(id(obj) >> 4) % len(self._locks)]
@@ -0,0 +1,131 @@
+import json
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, List
+
+from src.model import Category, Product
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+_encoder = json.JSONEncoder(ensure_ascii=False)
+
+
+def product_record(prod: Product) -> Dict[str, Any]:
+    """
+    Возвращает товар в виде словаря формата data/products.json с полем "type" (имя класса).
+
+    Атрибуты наследников (Smartphone.memory, LawnGrass.country, ...) берутся из Product.to_dict,
+    поэтому src.loader восстанавливает товар того же класса.
+    """
+    return {"type": type(prod).__name__, **prod.to_dict()}
+
+
+def _chunks(category: Category, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Выдает словари товаров категории порциями по chunk_size (обход по версии состава категории)."""
+    products = (product_record(p) for p in category.snapshot() if isinstance(p, Product))
+    while True:
+        chunk = list(islice(products, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_jsonl(categories: Iterable[Category], f: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Записывает категории в открытый текстовый файл в формате JSON Lines.
+
+    Для каждой категории пишется строка {"category": название, "description": описание}, затем по строке
+    на каждый товар. Товары кодируются и записываются порциями по chunk_size.
+
+    Args:
+        categories (Iterable[Category]): Категории.
+        f (IO[str]): Файл, открытый на запись.
+        chunk_size (int): Количество товаров в одной порции записи.
+
+    Returns:
+        int: Количество записанных товаров.
+    """
+    encode = _encoder.encode
+    written = 0
+    for category in categories:
+        f.write(encode({"category": category.name, "description": category.description}) + "\n")
+        for chunk in _chunks(category, chunk_size):
+            f.write("\n".join(map(encode, chunk)) + "\n")
+            written += len(chunk)
+    return written
+
+
+def write_json(categories: Iterable[Category], f: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Записывает категории в открытый текстовый файл в формате data/products.json.
+
+    Документ пишется потоково: открывающие и закрывающие скобки категорий выводятся отдельно, а товары
+    кодируются порциями по chunk_size одним вызовом кодировщика на порцию.
+
+    Args:
+        categories (Iterable[Category]): Категории.
+        f (IO[str]): Файл, открытый на запись.
+        chunk_size (int): Количество товаров в одной порции записи.
+
+    Returns:
+        int: Количество записанных товаров.
+    """
+    encode = _encoder.encode
+    written = 0
+    f.write("[")
+    for index, category in enumerate(categories):
+        name, description = encode(category.name), encode(category.description)
+        f.write(f'{", " if index else ""}{{"name": {name}, "description": {description}, "products": [')
+        separator = ""
+        for chunk in _chunks(category, chunk_size):
+            # Список словарей кодируется целиком, внешние скобки списка отбрасываются.
+            f.write(separator + encode(chunk)[1:-1])
+            separator = ", "
+            written += len(chunk)
+        f.write("]}")
+    f.write("]")
+    return written
+
+
+def export_jsonl(
+    categories: Iterable[Category],
+    file_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> int:
+    """
+    Экспортирует категории в файл JSON Lines (читается src.loader.stream_categories_jsonl).
+
+    Args:
+        categories (Iterable[Category]): Категории.
+        file_path (str): Путь к файлу.
+        chunk_size (int): Количество товаров в одной порции записи.
+        buffer_size (int): Размер буфера файла в байтах.
+
+    Returns:
+        int: Количество записанных товаров.
+    """
+    with open(file_path, "w", encoding="utf-8", buffering=buffer_size) as f:
+        return write_jsonl(categories, f, chunk_size)
+
+
+def export_json(
+    categories: Iterable[Category],
+    file_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> int:
+    """
+    Экспортирует категории в файл формата data/products.json (читается src.loader и Category.parser_json).
+
+    Args:
+        categories (Iterable[Category]): Категории.
+        file_path (str): Путь к файлу.
+        chunk_size (int): Количество товаров в одной порции записи.
+        buffer_size (int): Размер буфера файла в байтах.
+
+    Returns:
+        int: Количество записанных товаров.
+    """
+    with open(file_path, "w", encoding="utf-8", buffering=buffer_size) as f:
+        return write_json(categories, f, chunk_size)
@@ -0,0 +1,214 @@
+import gc
+import inspect
+from contextlib import contextmanager, nullcontext
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+from src.model import Product, ProductRegistry
+
+_UNSET = object()
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Приостанавливает циклический сборщик мусора на время массового создания объектов.
+
+    Сборки поколения 0 запускаются каждые несколько сотен созданных объектов и при загрузке больших
+    партий занимают заметную часть времени. Приостановка действует на весь процесс: пока партия
+    создается, сборщик не работает и в других потоках, а циклические ссылки (например, между
+    категориями и их подписчиками) освобождаются только после ее завершения.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class ProductSchema:
+    """
+    Скомпилированная схема класса товара.
+
+    Поля конструктора определяются один раз по сигнатуре __init__, после чего словарь превращается
+    в позиционные аргументы одним вызовом operator.itemgetter (без построения множеств ключей
+    и распаковки **kwargs на каждый товар). Лишние ключи словаря (например, "type") игнорируются.
+
+    Атрибуты:
+        cls (Type[Product]): Класс товара.
+        fields (Tuple[str, ...]): Параметры конструктора в порядке вызова.
+    """
+
+    def __init__(self, cls: Type[Product]) -> None:
+        """
+        Компилирует схему класса.
+
+        Args:
+            cls (Type[Product]): Product или его наследник.
+
+        Raises:
+            TypeError: Если cls не является наследником Product.
+        """
+        if not (isinstance(cls, type) and issubclass(cls, Product)):
+            raise TypeError("Схема строится только для классов Product и его наследников")
+        self.cls = cls
+        self.fields: Tuple[str, ...] = tuple(inspect.signature(cls.__init__).parameters)[1:]
+        getter = itemgetter(*self.fields)
+        self._values: Callable[[Dict[str, Any]], Tuple[Any, ...]] = (
+            getter if len(self.fields) > 1 else lambda data: (getter(data),)
+        )
+        self._price = self.fields.index("price")
+        self._quantity = self.fields.index("quantity")
+
+    def values(self, data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Возвращает аргументы конструктора из словаря.
+
+        Raises:
+            ValueError: Если отсутствуют обязательные ключи.
+        """
+        try:
+            return self._values(data)
+        except KeyError:
+            raise ValueError("Отсутствуют обязательные ключи") from None
+
+    def is_valid(self, values: Sequence[Any]) -> bool:
+        """Проверяет аргументы конструктора по правилам Product.new_product (цена и количество не меньше 0)."""
+        return bool(values[self._price] >= 0 and values[self._quantity] >= 0)
+
+    def build(self, data: Dict[str, Any]) -> Product:
+        """
+        Создает товар из словаря.
+
+        Raises:
+            ValueError: Если отсутствуют обязательные ключи.
+        """
+        return self.cls(*self.values(data))
+
+
+class ProductFactory:
+    """
+    Фабрика товаров для массовой десериализации каталогов со смешанными типами.
+
+    Класс товара выбирается по полю-дискриминатору (по умолчанию "type" с именем класса, как в
+    src.journal и src.snapshot); записи без этого поля создаются как default. Схемы классов
+    (ProductSchema) компилируются при первом обращении и переиспользуются. Известные классы берутся
+    из реестра Product.type_for, поэтому новые наследники Product доступны без регистрации.
+
+    Правила совпадают с Product.new_product: записи с отрицательной ценой или количеством пропускаются,
+    а при переданном реестре ProductRegistry одноименные товары объединяются.
+
+    Атрибуты:
+        type_field (str): Имя поля-дискриминатора.
+        default (Type[Product]): Класс для записей без дискриминатора.
+    """
+
+    def __init__(self, type_field: str = "type", default: Type[Product] = Product) -> None:
+        """
+        Инициализирует фабрику.
+
+        Args:
+            type_field (str): Имя поля-дискриминатора.
+            default (Type[Product]): Класс для записей без дискриминатора.
+        """
+        self.type_field = type_field
+        self.default = default
+        self._schemas: Dict[Any, ProductSchema] = {}
+
+    def schema(self, type_name: Optional[str] = None) -> ProductSchema:
+        """
+        Возвращает скомпилированную схему класса по имени (None — класс по умолчанию).
+
+        Raises:
+            ValueError: Если тип товара неизвестен.
+        """
+        schema = self._schemas.get(type_name)
+        if schema is None:
+            cls = self.default if type_name is None else Product.type_for(type_name)
+            schema = self._schemas[type_name] = ProductSchema(cls)
+        return schema
+
+    def build(self, data: Dict[str, Any]) -> Product:
+        """
+        Создает товар из словаря, выбирая класс по дискриминатору.
+
+        Raises:
+            ValueError: Если тип товара неизвестен или отсутствуют обязательные ключи.
+        """
+        return self.schema(data.get(self.type_field)).build(data)
+
+    def build_many(
+        self, records: Iterable[Dict[str, Any]], registry: Optional[ProductRegistry] = None, pause_gc: bool = False
+    ) -> List[Product]:
+        """
+        Создает товары из словарей.
+
+        Args:
+            records (Iterable[Dict[str, Any]]): Словари товаров с необязательным дискриминатором.
+            registry (Optional[ProductRegistry]): Реестр для объединения дубликатов (как в new_product).
+            pause_gc (bool): Приостановить циклический сборщик мусора на время создания партии
+                (во всем процессе, см. _gc_paused).
+
+        Returns:
+            List[Product]: Созданные или обновленные товары в порядке записей (без не прошедших проверку).
+
+        Raises:
+            ValueError: Если тип товара неизвестен или отсутствуют обязательные ключи.
+        """
+        with _gc_paused() if pause_gc else nullcontext():
+            return self._build_many(records, registry)
+
+    def _build_many(self, records: Iterable[Dict[str, Any]], registry: Optional[ProductRegistry]) -> List[Product]:
+        schemas = self._schemas
+        type_field = self.type_field
+        result: List[Product] = []
+        append = result.append
+        schema: Optional[ProductSchema] = None
+        last_type: Any = _UNSET
+        for data in records:
+            type_name = data.get(type_field)
+            if type_name != last_type:
+                # Записи одного типа обычно идут подряд: схема ищется только при смене типа.
+                schema = schemas.get(type_name) or self.schema(type_name)
+                cls, values_of, price, quantity = schema.cls, schema._values, schema._price, schema._quantity
+                last_type = type_name
+            try:
+                values = values_of(data)
+            except KeyError:
+                raise ValueError("Отсутствуют обязательные ключи") from None
+            if values[price] < 0 or values[quantity] < 0:
+                continue
+            append(cls(*values) if registry is None else registry.add(cls(*values)))
+        return result
+
+    def build_rows(
+        self, rows: Iterable[Sequence[Any]], type_name: Optional[str] = None, pause_gc: bool = False
+    ) -> List[Product]:
+        """
+        Создает товары одного класса из кортежей аргументов в порядке ProductSchema.fields.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): Кортежи аргументов конструктора.
+            type_name (Optional[str]): Имя класса (None — класс по умолчанию).
+            pause_gc (bool): Приостановить циклический сборщик мусора на время создания партии
+                (во всем процессе, см. _gc_paused).
+
+        Returns:
+            List[Product]: Созданные товары (без строк с отрицательной ценой или количеством).
+
+        Raises:
+            ValueError: Если тип неизвестен или длина строки не совпадает с числом полей схемы.
+        """
+        schema = self.schema(type_name)
+        size = len(schema.fields)
+        cls = schema.cls
+        result = []
+        with _gc_paused() if pause_gc else nullcontext():
+            for row in rows:
+                if len(row) != size:
+                    raise ValueError(f"Ожидается {size} полей для {cls.__name__}, получено {len(row)}")
+                if schema.is_valid(row):
+                    result.append(cls(*row))
+        return result
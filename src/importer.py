@@ -0,0 +1,103 @@
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.loader import iter_events
+from src.model import Category, Product, ProductRegistry
+
+ParsedCategory = Tuple[str, str, List[Product]]
+
+
+@dataclass
+class ImportResult:
+    """
+    Результат пакетного импорта каталогов.
+
+    Атрибуты:
+        categories (List[Category]): Объединенные категории из всех успешно разобранных файлов.
+        errors (Dict[str, str]): Ошибки разбора по путям файлов.
+        imported_files (List[str]): Пути успешно разобранных файлов.
+    """
+
+    categories: List[Category] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    imported_files: List[str] = field(default_factory=list)
+
+
+def parse_file(file_path: str) -> Tuple[str, List[ParsedCategory], Optional[str]]:
+    """
+    Разбирает один файл формата data/products.json в рабочем процессе.
+
+    Дубликаты внутри одной категории файла объединяются по правилам Product.new_product.
+    Объекты Category здесь не создаются: они собираются в основном процессе после слияния.
+
+    Args:
+        file_path (str): Путь к JSON-файлу.
+
+    Returns:
+        Tuple[str, List[ParsedCategory], Optional[str]]: Путь, список (название, описание, товары) категорий
+            и текст ошибки (None при успехе; при ошибке список категорий пуст).
+    """
+    parsed: List[ParsedCategory] = []
+    registry = ProductRegistry()
+    try:
+        for kind, payload in iter_events(file_path):
+            if kind == "product":
+                if not isinstance(payload, dict):
+                    raise TypeError(f"Товар должен быть объектом JSON, получено: {payload!r}")
+                cls, params = Product.split_type(payload)
+                registry.upsert(params, cls)
+            else:
+                parsed.append((payload.get("name", ""), payload.get("description", ""), list(registry)))
+                registry = ProductRegistry()
+    except (OSError, json.JSONDecodeError, ValueError, KeyError, TypeError) as e:
+        return file_path, [], f"{type(e).__name__}: {e}"
+    return file_path, parsed, None
+
+
+def import_catalogs(
+    file_paths: Iterable[str], max_workers: Optional[int] = None, executor: Optional[Executor] = None
+) -> ImportResult:
+    """
+    Импортирует несколько файлов каталога, разбирая их параллельно в пуле процессов.
+
+    Категории с одинаковым названием из разных файлов объединяются, а одноименные товары внутри них
+    сливаются по правилам Product.new_product: количество суммируется, цена становится максимальной.
+    Файлы сливаются в порядке file_paths, поэтому результат не зависит от порядка завершения процессов.
+    Ошибка в файле не прерывает импорт: файл пропускается целиком, а ошибка попадает в ImportResult.errors.
+
+    Args:
+        file_paths (Iterable[str]): Пути к JSON-файлам.
+        max_workers (Optional[int]): Количество процессов (по умолчанию — число ядер).
+        executor (Optional[Executor]): Готовый пул; если задан, max_workers игнорируется и пул не закрывается.
+
+    Returns:
+        ImportResult: Объединенные категории и ошибки по файлам.
+    """
+    paths = list(file_paths)
+    merged: Dict[str, Tuple[str, ProductRegistry]] = {}
+    result = ImportResult()
+
+    own_executor = executor is None
+    pool = ProcessPoolExecutor(max_workers=max_workers) if executor is None else executor
+    try:
+        for path, parsed, error in pool.map(parse_file, paths):
+            if error is not None:
+                result.errors[path] = error
+                continue
+            result.imported_files.append(path)
+            for name, description, products in parsed:
+                if name not in merged:
+                    merged[name] = (description, ProductRegistry())
+                registry = merged[name][1]
+                for prod in products:
+                    registry.add(prod)
+    finally:
+        if own_executor:
+            pool.shutdown()
+
+    result.categories = [
+        Category(name, description, list(registry)) for name, (description, registry) in merged.items()
+    ]
+    return result
@@ -0,0 +1,195 @@
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from src.model import Category, Product
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 1.0)
+
+ItemsCounter = Callable[[Tuple[Any, ...], Any], int]
+
+# Точки входа: (класс-владелец, атрибут, имя операции, подсчет обработанных элементов по аргументам и результату).
+TARGETS: List[Tuple[type, str, str, ItemsCounter]] = [
+    (Product, "new_product", "new_product", lambda args, result: 0 if result is None else 1),
+    (Product, "set_price", "set_price", lambda args, result: 1 if result else 0),
+    (Product, "set_quantity", "set_quantity", lambda args, result: 1 if result else 0),
+    (Category, "add_product", "add_product", lambda args, result: 1),
+    (Category, "products", "render_products", lambda args, result: args[0].item_count),
+]
+
+
+class Metric:
+    """
+    Метрика одной операции: число вызовов, суммарное время, число элементов и гистограмма длительностей.
+
+    Атрибуты:
+        calls (int): Количество вызовов.
+        seconds (float): Суммарное время вызовов в секундах.
+        items (int): Количество обработанных элементов.
+        buckets (List[int]): Число вызовов по корзинам гистограммы (не накопительно, последняя — +Inf).
+    """
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self._bounds = bounds
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.seconds = 0.0
+        self.items = 0
+        self.buckets = [0] * (len(bounds) + 1)
+
+    def observe(self, seconds: float, items: int) -> None:
+        """Учитывает один вызов длительностью seconds, обработавший items элементов."""
+        bucket = bisect_left(self._bounds, seconds)
+        with self._lock:
+            self.calls += 1
+            self.seconds += seconds
+            self.items += items
+            self.buckets[bucket] += 1
+
+
+class Instrumentation:
+    """
+    Включаемые по требованию замеры горячих путей модели.
+
+    При enable() методы Product.new_product, Product.set_price, Product.set_quantity (через них работают
+    сеттеры price и quantity), Category.add_product и свойство Category.products заменяются обертками,
+    а при disable() восстанавливаются. Пока замеры выключены, модель работает с исходными методами
+    без каких-либо накладных расходов. Наследники (Smartphone, LawnGrass) замеряются через методы
+    базового класса; если наследник переопределяет метод, оборачивается и его версия.
+
+    Одновременно может быть включен только один экземпляр.
+    """
+
+    _active: Optional["Instrumentation"] = None
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Инициализирует набор метрик.
+
+        Args:
+            buckets (Sequence[float]): Верхние границы корзин гистограммы в секундах (по возрастанию).
+        """
+        self.bucket_bounds: Tuple[float, ...] = tuple(buckets)
+        self.metrics: Dict[str, Metric] = {}
+        self._patched: List[Tuple[type, str, Any]] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Обнуляет все метрики."""
+        self.metrics = {name: Metric(self.bucket_bounds) for _, _, name, _ in TARGETS}
+
+    @property
+    def enabled(self) -> bool:
+        """Возвращает True, если замеры включены."""
+        return bool(self._patched)
+
+    def enable(self) -> None:
+        """
+        Включает замеры.
+
+        Raises:
+            RuntimeError: Если уже включен другой экземпляр Instrumentation.
+        """
+        if Instrumentation._active is self:
+            return
+        if Instrumentation._active is not None:
+            raise RuntimeError("Замеры уже включены другим экземпляром Instrumentation")
+        for owner, attr, name, count_items in TARGETS:
+            for cls in [owner, *_subclasses(owner)]:
+                if attr in cls.__dict__:
+                    original = cls.__dict__[attr]
+                    setattr(cls, attr, self._wrap(original, name, count_items))
+                    self._patched.append((cls, attr, original))
+        Instrumentation._active = self
+
+    def disable(self) -> None:
+        """Выключает замеры и восстанавливает исходные методы. Собранные метрики сохраняются."""
+        if Instrumentation._active is not self:
+            return
+        while self._patched:
+            cls, attr, original = self._patched.pop()
+            setattr(cls, attr, original)
+        Instrumentation._active = None
+
+    def __enter__(self) -> "Instrumentation":
+        self.enable()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.disable()
+
+    def _wrap(self, descriptor: Any, name: str, count_items: ItemsCounter) -> Any:
+        metric = self.metrics[name]
+
+        def timed(func: Callable[..., Any]) -> Callable[..., Any]:
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                result = func(*args, **kwargs)
+                metric.observe(time.perf_counter() - start, count_items(args, result))
+                return result
+
+            return wrapper
+
+        if isinstance(descriptor, classmethod):
+            return classmethod(timed(descriptor.__func__))
+        if isinstance(descriptor, property):
+            if descriptor.fget is None:
+                return descriptor
+            return property(timed(descriptor.fget), descriptor.fset, descriptor.fdel, descriptor.__doc__)
+        return timed(descriptor)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Возвращает метрики в виде словаря.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: По имени операции: calls, seconds, items, avg_seconds
+                и histogram — список пар (верхняя граница, число вызовов), последняя граница — inf.
+        """
+        result = {}
+        for name, metric in self.metrics.items():
+            bounds = list(self.bucket_bounds) + [float("inf")]
+            result[name] = {
+                "calls": metric.calls,
+                "seconds": metric.seconds,
+                "items": metric.items,
+                "avg_seconds": metric.seconds / metric.calls if metric.calls else 0.0,
+                "histogram": list(zip(bounds, metric.buckets)),
+            }
+        return result
+
+    def to_prometheus(self, prefix: str = "candy_shop") -> str:
+        """
+        Возвращает метрики в текстовом формате Prometheus.
+
+        Args:
+            prefix (str): Префикс имен метрик.
+        """
+        lines = [
+            f"# TYPE {prefix}_calls_total counter",
+            *(f'{prefix}_calls_total{{op="{name}"}} {m.calls}' for name, m in self.metrics.items()),
+            f"# TYPE {prefix}_items_total counter",
+            *(f'{prefix}_items_total{{op="{name}"}} {m.items}' for name, m in self.metrics.items()),
+            f"# TYPE {prefix}_duration_seconds histogram",
+        ]
+        for name, metric in self.metrics.items():
+            cumulative = 0
+            for bound, count in zip(list(self.bucket_bounds) + [float("inf")], metric.buckets):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_duration_seconds_bucket{{op="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_duration_seconds_sum{{op="{name}"}} {metric.seconds!r}')
+            lines.append(f'{prefix}_duration_seconds_count{{op="{name}"}} {metric.calls}')
+        return "\n".join(lines) + "\n"
+
+
+def _subclasses(cls: Type[Any]) -> List[Type[Any]]:
+    """Возвращает всех наследников класса (рекурсивно)."""
+    result: List[Type[Any]] = []
+    for sub in cls.__subclasses__():
+        result.append(sub)
+        result.extend(_subclasses(sub))
+    return result
@@ -0,0 +1,167 @@
+import math
+import operator
+from array import array
+from functools import partial
+from itertools import compress
+from typing import Dict, Iterable, List, Tuple
+
+from src.model import Category, Product
+
+
+class InventoryStore:
+    """
+    Колоночное хранилище остатков для массовых расчетов стоимости.
+
+    Цены, количества и идентификаторы категорий хранятся в непрерывных типизированных массивах array.array,
+    поэтому оценка, фильтрация и агрегация проходят по всему каталогу циклами на уровне C
+    (map, compress, fsum) без обращения к атрибутам объектов Product.
+
+    Хранятся только базовые поля Product; дополнительные атрибуты наследников (Smartphone, LawnGrass)
+    при обратном преобразовании не восстанавливаются.
+
+    Атрибуты:
+        prices (array): Цены товаров ('d').
+        quantities (array): Количество товаров ('q').
+        category_ids (array): Индекс категории каждого товара ('I').
+        names (List[str]): Названия товаров.
+        descriptions (List[str]): Описания товаров.
+        categories (List[Tuple[str, str]]): Названия и описания категорий по индексу.
+        category_values (array): Стоимость остатков каждой категории ('d'), обновляется в add.
+
+    Массивы изменяются только через add и add_product: при записи в prices или quantities напрямую
+    category_values перестает соответствовать строкам.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустое хранилище."""
+        self.prices: array = array("d")
+        self.quantities: array = array("q")
+        self.category_ids: array = array("I")
+        self.names: List[str] = []
+        self.descriptions: List[str] = []
+        self.categories: List[Tuple[str, str]] = []
+        self.category_values: array = array("d")
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def add_category(self, name: str, description: str = "") -> int:
+        """
+        Регистрирует категорию и возвращает ее индекс.
+
+        Args:
+            name (str): Название категории.
+            description (str): Описание категории.
+        """
+        self.categories.append((name, description))
+        self.category_values.append(0.0)
+        return len(self.categories) - 1
+
+    def add(self, name: str, description: str, price: float, quantity: int, category_id: int) -> int:
+        """
+        Добавляет строку товара и возвращает ее индекс.
+
+        Args:
+            name (str): Название товара.
+            description (str): Описание товара.
+            price (float): Цена товара.
+            quantity (int): Количество товара.
+            category_id (int): Индекс категории, полученный из add_category.
+
+        Raises:
+            IndexError: Если категории с таким индексом нет.
+        """
+        if not 0 <= category_id < len(self.categories):
+            raise IndexError(f"Неизвестная категория {category_id}")
+        self.prices.append(price)
+        self.quantities.append(quantity)
+        self.category_ids.append(category_id)
+        self.names.append(name)
+        self.descriptions.append(description)
+        self.category_values[category_id] += price * quantity
+        return len(self.prices) - 1
+
+    def add_product(self, prod: Product, category_id: int) -> int:
+        """
+        Добавляет объект продукта и возвращает индекс его строки.
+
+        Args:
+            prod (Product): Объект продукта.
+            category_id (int): Индекс категории.
+        """
+        return self.add(prod.name, prod.description, prod.price, prod.quantity, category_id)
+
+    @classmethod
+    def from_categories(cls, categories: Iterable[Category]) -> "InventoryStore":
+        """
+        Строит хранилище по категориям. Элементы категорий, не являющиеся Product, пропускаются.
+
+        Args:
+            categories (Iterable[Category]): Категории с товарами.
+        """
+        store = cls()
+        for category in categories:
+            category_id = store.add_category(category.name, category.description)
+            for prod in category:
+                if isinstance(prod, Product):
+                    store.add_product(prod, category_id)
+        return store
+
+    def product(self, index: int) -> Product:
+        """Создает объект Product по индексу строки."""
+        return Product(self.names[index], self.descriptions[index], self.prices[index], self.quantities[index])
+
+    def to_products(self) -> List[Product]:
+        """Создает объекты Product для всех строк хранилища."""
+        return list(map(Product, self.names, self.descriptions, self.prices, self.quantities))
+
+    def to_categories(self) -> List[Category]:
+        """Создает объекты Category с товарами в порядке регистрации категорий."""
+        grouped: List[List[Product]] = [[] for _ in self.categories]
+        for category_id, prod in zip(self.category_ids, self.to_products()):
+            grouped[category_id].append(prod)
+        return [
+            Category(name, description, products) for (name, description), products in zip(self.categories, grouped)
+        ]
+
+    def total_value(self) -> float:
+        """Возвращает суммарную стоимость остатков (цена * количество) по всему каталогу."""
+        return math.fsum(map(operator.mul, self.prices, self.quantities))
+
+    def total_quantity(self) -> int:
+        """Возвращает суммарное количество единиц товара."""
+        return sum(self.quantities)
+
+    def value_by_category(self) -> Dict[str, float]:
+        """
+        Возвращает стоимость остатков по названиям категорий (одноименные категории суммируются).
+
+        Стоимость каждой категории накапливается в category_values при добавлении строк, поэтому расчет
+        не обходит товары и стоит O(число категорий).
+        """
+        result: Dict[str, float] = {}
+        for (name, _), total in zip(self.categories, self.category_values):
+            result[name] = result.get(name, 0.0) + total
+        return result
+
+    def low_stock(self, threshold: int) -> List[int]:
+        """
+        Возвращает индексы строк, количество в которых меньше порога.
+
+        Args:
+            threshold (int): Порог количества.
+        """
+        return list(compress(range(len(self.quantities)), map(partial(operator.gt, threshold), self.quantities)))
+
+    def filter_price(self, min_price: float = 0.0, max_price: float = math.inf) -> List[int]:
+        """
+        Возвращает индексы строк с ценой в диапазоне [min_price, max_price].
+
+        Args:
+            min_price (float): Нижняя граница цены.
+            max_price (float): Верхняя граница цены.
+        """
+        above = map(partial(operator.le, min_price), self.prices)
+        below = map(partial(operator.ge, max_price), self.prices)
+        mask = map(operator.and_, above, below)
+        return list(compress(range(len(self.prices)), mask))
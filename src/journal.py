@@ -0,0 +1,361 @@
+import json
+import os
+import threading
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.model import Category, Product
+
+
+def category_to_dict(category: Category) -> Dict[str, Any]:
+    """
+    Возвращает категорию в виде словаря формата data/products.json.
+
+    У каждого товара дополнительно сохраняется поле "type" с именем класса, чтобы наследники Product
+    восстанавливались со своими атрибутами. Элементы, не являющиеся Product, пропускаются.
+    """
+    return {
+        "name": category.name,
+        "description": category.description,
+        "products": [{"type": type(p).__name__, **p.to_dict()} for p in category if isinstance(p, Product)],
+    }
+
+
+def product_from_dict(data: Dict[str, Any]) -> Product:
+    """
+    Создает продукт из словаря с необязательным полем "type" (по умолчанию Product).
+
+    Raises:
+        ValueError: Если тип товара неизвестен.
+    """
+    cls, params = Product.split_type(data)
+    return cls(**params)
+
+
+def load_snapshot(snapshot_path: str) -> Tuple[List[Category], int]:
+    """
+    Загружает базовый снимок, записанный ChangeJournal.compact.
+
+    Returns:
+        Tuple[List[Category], int]: Категории и номер последней записи журнала, учтенной в снимке.
+    """
+    with open(snapshot_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    categories = [
+        Category(c["name"], c["description"], [product_from_dict(p) for p in c["products"]])
+        for c in data["categories"]
+    ]
+    return categories, data["seq"]
+
+
+def apply_record(categories: Dict[str, Category], record: Dict[str, Any]) -> None:
+    """
+    Применяет одну запись журнала к категориям (по названиям). Новые категории добавляются в словарь.
+
+    Args:
+        categories (Dict[str, Category]): Категории по названиям.
+        record (Dict[str, Any]): Запись журнала.
+
+    Raises:
+        ValueError: Если тип записи неизвестен.
+    """
+    op = record["op"]
+    if op == "category":
+        if record["name"] not in categories:
+            categories[record["name"]] = Category(record["name"], record["description"], [])
+    elif op == "add":
+        categories[record["category"]].add_product(product_from_dict(record["product"]))
+    elif op == "set":
+        for name in record["categories"]:
+            for prod in categories[name]:
+                if isinstance(prod, Product) and prod.name == record["product"]:
+                    _set_field(prod, record["field"], record["value"])
+                    break
+    else:
+        raise ValueError(f"Неизвестная запись журнала: {op}")
+
+
+def _set_field(prod: Product, field: str, value: Any) -> None:
+    if field == "price":
+        prod.set_price(value)
+    elif field == "quantity":
+        prod.set_quantity(value)
+    else:
+        prod.name = value
+
+
+def read_records(journal_path: str, after_seq: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Читает записи журнала с номером больше after_seq.
+
+    Args:
+        journal_path (str): Путь к файлу журнала.
+        after_seq (int): Номер последней уже примененной записи.
+    """
+    if not os.path.exists(journal_path):
+        return
+    with open(journal_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                if record["seq"] > after_seq:
+                    yield record
+
+
+def rebuild(snapshot_path: Optional[str], journal_path: str) -> List[Category]:
+    """
+    Восстанавливает каталог из базового снимка и записей журнала после него.
+
+    Args:
+        snapshot_path (Optional[str]): Путь к снимку или None, если журнал ведется с пустого каталога.
+        journal_path (str): Путь к журналу.
+
+    Returns:
+        List[Category]: Категории в порядке появления.
+    """
+    seq = 0
+    categories: Dict[str, Category] = {}
+    if snapshot_path is not None and os.path.exists(snapshot_path):
+        loaded, seq = load_snapshot(snapshot_path)
+        categories = {c.name: c for c in loaded}
+    for record in read_records(journal_path, seq):
+        apply_record(categories, record)
+    return list(categories.values())
+
+
+class ChangeJournal:
+    """
+    Журнал изменений каталога (JSON Lines, только дозапись).
+
+    Записывает добавление товаров в отслеживаемые категории (add_product) и изменения названия, цены
+    и количества их товаров (сеттеры, set_price, set_quantity). Слияния Product.new_product проходят
+    через сеттеры и попадают в журнал как изменения количества и цены. Товар в записях изменений
+    определяется по названию и категориям, в которые он входит.
+
+    Состояние восстанавливается функцией rebuild из базового снимка и записей журнала после него.
+    Метод compact записывает новый снимок и очищает журнал; при compact_every он вызывается автоматически.
+    """
+
+    def __init__(
+        self, journal_path: str, snapshot_path: Optional[str] = None, compact_every: Optional[int] = None
+    ) -> None:
+        """
+        Открывает журнал для дозаписи. Нумерация продолжается с последней записи журнала или снимка.
+
+        Args:
+            journal_path (str): Путь к файлу журнала.
+            snapshot_path (Optional[str]): Путь к базовому снимку (нужен для compact).
+            compact_every (Optional[int]): Автоматически сжимать журнал после стольких записей.
+
+        Raises:
+            ValueError: Если compact_every задан без snapshot_path.
+        """
+        if compact_every is not None and snapshot_path is None:
+            raise ValueError("Для автоматического сжатия нужен путь к снимку")
+        self.journal_path = journal_path
+        self.snapshot_path = snapshot_path
+        self.compact_every = compact_every
+        self._lock = threading.RLock()
+        self._categories: List[Category] = []
+        self._memberships: Dict[Product, List[str]] = {}
+        self._since_compact = 0
+        self.seq = self._last_seq()
+        self._file: IO[str] = open(journal_path, "a", encoding="utf-8")
+
+    def _last_seq(self) -> int:
+        seq = 0
+        if self.snapshot_path is not None and os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                seq = json.load(f)["seq"]
+        for record in read_records(self.journal_path, seq):
+            seq = record["seq"]
+        return seq
+
+    def watch(self, category: Category, record: bool = True) -> None:
+        """
+        Начинает отслеживать категорию.
+
+        Args:
+            category (Category): Категория.
+            record (bool): Записать ли в журнал саму категорию и ее текущие товары. False — если категория
+                уже есть в базовом снимке или восстановлена из журнала.
+        """
+        category.subscribe(self._on_product_added)
+        products = [prod for prod in category.snapshot() if isinstance(prod, Product)]
+        self._subscribe(products)
+        with self._lock:
+            self._categories.append(category)
+            if record:
+                self._write({"op": "category", "name": category.name, "description": category.description})
+            for prod in products:
+                self._track(category, prod, record)
+            self._maybe_compact()
+
+    def watch_all(self, categories: Iterable[Category], record: bool = True) -> None:
+        """Начинает отслеживать несколько категорий."""
+        for category in categories:
+            self.watch(category, record)
+
+    def _subscribe(self, products: Iterable[Product]) -> None:
+        """
+        Подписывается на изменения товаров, которые журнал еще не отслеживает.
+
+        Вызывается без self._lock: Product.subscribe берет блокировку товара, а уведомления об изменениях
+        приходят под ней и берут блокировку журнала, поэтому порядок всегда «товар, затем журнал».
+        Изменение, пришедшее до записи товара в журнал, записывается без категорий и при восстановлении
+        пропускается, а запись "add" уже содержит новое значение.
+        """
+        new = []
+        with self._lock:
+            for prod in products:
+                if prod not in self._memberships:
+                    self._memberships[prod] = []
+                    new.append(prod)
+        for prod in new:
+            prod.subscribe(self._on_product_changed)
+
+    def _track(self, category: Category, prod: Product, record: bool) -> None:
+        self._memberships[prod].append(category.name)
+        if record:
+            product = {"type": type(prod).__name__, **prod.to_dict()}
+            self._write({"op": "add", "category": category.name, "product": product})
+
+    def _on_product_added(self, category: Category, prod: Product) -> None:
+        self._subscribe([prod])
+        with self._lock:
+            self._track(category, prod, True)
+            self._maybe_compact()
+
+    def _on_product_changed(self, prod: Product, field: str, old: Any, new: Any) -> None:
+        with self._lock:
+            name = old if field == "name" else prod.name
+            record = {"op": "set", "field": field, "product": name, "value": new}
+            record["categories"] = list(self._memberships.get(prod, []))
+            self._write(record)
+            self._maybe_compact()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self.seq += 1
+        self._file.write(json.dumps({"seq": self.seq, **record}, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._since_compact += 1
+
+    def _maybe_compact(self) -> None:
+        """Сжимает журнал, если с прошлого сжатия накопилось compact_every записей."""
+        if self.compact_every is not None and self._since_compact >= self.compact_every:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Записывает базовый снимок отслеживаемых категорий и очищает журнал.
+
+        Снимок сначала пишется во временный файл и затем атомарно заменяет прежний.
+
+        Raises:
+            ValueError: Если путь к снимку не задан.
+        """
+        if self.snapshot_path is None:
+            raise ValueError("Путь к снимку не задан")
+        with self._lock:
+            data = {"seq": self.seq, "categories": [category_to_dict(c) for c in self._categories]}
+            tmp_path = self.snapshot_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.snapshot_path)
+            # Новый журнал подменяет старый файл целиком, чтобы реплики заметили смену файла.
+            self._file.close()
+            open(tmp_path, "w", encoding="utf-8").close()
+            os.replace(tmp_path, self.journal_path)
+            self._file = open(self.journal_path, "a", encoding="utf-8")
+            self._since_compact = 0
+
+    def close(self) -> None:
+        """Закрывает файл журнала."""
+        self._file.close()
+
+    def __enter__(self) -> "ChangeJournal":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class JournalFollower:
+    """
+    Реплика, следующая за журналом: применяет к своим категориям только новые записи.
+
+    Журнал читается с позиции, на которой остановилось предыдущее чтение, поэтому poll обрабатывает
+    только дописанные строки. После сжатия журнала (новый файл) чтение начинается с начала.
+
+    Атрибуты:
+        categories (Dict[str, Category]): Категории реплики по названиям.
+        seq (int): Номер последней примененной записи.
+    """
+
+    def __init__(self, journal_path: str, snapshot_path: Optional[str] = None) -> None:
+        """
+        Загружает базовый снимок (если он есть) и применяет журнал.
+
+        Args:
+            journal_path (str): Путь к журналу.
+            snapshot_path (Optional[str]): Путь к базовому снимку.
+        """
+        self.journal_path = journal_path
+        self.snapshot_path = snapshot_path
+        self.categories: Dict[str, Category] = {}
+        self.seq = 0
+        self._offset = 0
+        self._inode = -1
+        self.reload()
+
+    def reload(self) -> None:
+        """Перезагружает состояние из снимка и журнала целиком."""
+        self.categories = {}
+        self.seq = 0
+        self._offset = 0
+        if self.snapshot_path is not None and os.path.exists(self.snapshot_path):
+            loaded, self.seq = load_snapshot(self.snapshot_path)
+            self.categories = {c.name: c for c in loaded}
+        self.poll()
+
+    def _snapshot_seq(self) -> int:
+        if self.snapshot_path is None or not os.path.exists(self.snapshot_path):
+            return 0
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            return int(json.load(f)["seq"])
+
+    def poll(self) -> int:
+        """
+        Применяет новые записи журнала.
+
+        Если журнал был сжат и часть записей, еще не примененных репликой, попала только в снимок,
+        состояние перезагружается из снимка.
+
+        Returns:
+            int: Количество примененных записей.
+        """
+        if not os.path.exists(self.journal_path):
+            return 0
+        applied = 0
+        with open(self.journal_path, "rb") as f:
+            inode = os.fstat(f.fileno()).st_ino
+            if inode != self._inode:
+                self._inode = inode
+                self._offset = 0
+                if self._snapshot_seq() > self.seq:
+                    self.reload()
+                    return applied
+            f.seek(self._offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                self._offset += len(line)
+                record = json.loads(line)
+                if record["seq"] <= self.seq:
+                    continue
+                if record["seq"] != self.seq + 1:
+                    self.reload()
+                    return applied
+                apply_record(self.categories, record)
+                self.seq = record["seq"]
+                applied += 1
+        return applied
@@ -0,0 +1,233 @@
+import json
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from src.model import Category, Product, ProductRegistry
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Символы, которые могут следовать за числом в корректном JSON.
+_NUMBER_END = frozenset(" \t\n\r,]}")
+
+
+class _JsonStream:
+    """
+    Инкрементальный читатель JSON-текста из файла.
+
+    Держит в памяти только небольшой буфер: значения разбираются через json.JSONDecoder.raw_decode,
+    а буфер дочитывается порциями по chunk_size символов, когда очередного значения в нем не хватает.
+    """
+
+    def __init__(self, f: IO[str], chunk_size: int) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Дочитывает следующую порцию файла. Возвращает False, если файл закончился."""
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Возвращает следующий непробельный символ, не поглощая его ("" в конце файла)."""
+        while True:
+            buf = self._buf
+            n = len(buf)
+            pos = self._pos
+            while pos < n and buf[pos] in " \t\n\r":
+                pos += 1
+            self._pos = pos
+            if pos < n:
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """
+        Поглощает следующий непробельный символ, если он входит в chars.
+
+        Raises:
+            json.JSONDecodeError: Если встречен другой символ или файл закончился.
+        """
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise json.JSONDecodeError(f"Ожидался один из символов {chars!r}", self._buf, self._pos)
+        self._pos += 1
+        return ch
+
+    def value(self) -> Any:
+        """
+        Разбирает и возвращает очередное JSON-значение целиком.
+
+        Raises:
+            json.JSONDecodeError: Если значение некорректно или файл закончился раньше времени.
+        """
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # Число на границе буфера могло быть прочитано не полностью (например, "1." или "1.5e"):
+            # буфер дочитывается, пока за числом не окажется разделитель.
+            if isinstance(obj, (int, float)) and not isinstance(obj, bool):
+                if (end == len(self._buf) or self._buf[end] not in _NUMBER_END) and self._fill():
+                    continue
+            elif end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+def iter_events(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Потоково разбирает файл формата data/products.json и выдает события по мере чтения.
+
+    События:
+        ("product", dict) — очередной товар текущей категории;
+        ("category", dict) — конец категории, словарь ее полей без "products".
+
+    Товары категории выдаются раньше события "category" этой категории.
+
+    Args:
+        file_path (str): Путь к JSON-файлу.
+        chunk_size (int): Размер порции чтения в символах.
+
+    Raises:
+        FileNotFoundError: Если файл не найден.
+        json.JSONDecodeError: Если данные некорректны.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        stream = _JsonStream(f, chunk_size)
+        stream.expect("[")
+        if stream.peek() == "]":
+            return
+        while True:
+            stream.expect("{")
+            fields: Dict[str, Any] = {}
+            if stream.peek() != "}":
+                while True:
+                    key = stream.value()
+                    stream.expect(":")
+                    if key == "products" and stream.peek() == "[":
+                        stream.expect("[")
+                        if stream.peek() != "]":
+                            while True:
+                                yield "product", stream.value()
+                                if stream.expect(",]") == "]":
+                                    break
+                        else:
+                            stream.expect("]")
+                    else:
+                        fields[key] = stream.value()
+                    if stream.expect(",}") == "}":
+                        break
+            else:
+                stream.expect("}")
+            yield "category", fields
+            if stream.expect(",]") == "]":
+                break
+
+
+def stream_products(
+    file_path: str, product_cls: Type[Product] = Product, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Product]:
+    """
+    Выдает объекты продуктов из файла по одному, не загружая файл целиком.
+
+    Товары, не прошедшие валидацию Product.new_product (отрицательные цена или количество), пропускаются.
+    Дубликаты не объединяются, поэтому расход памяти не зависит от размера файла.
+    Товары с полем "type" (например, записанные src.exporter) создаются классом с этим именем.
+
+    Args:
+        file_path (str): Путь к JSON-файлу.
+        product_cls (Type[Product]): Класс продуктов без поля "type".
+        chunk_size (int): Размер порции чтения в символах.
+
+    Raises:
+        ValueError: Если у товара отсутствуют обязательные ключи или тип товара неизвестен.
+    """
+    for kind, payload in iter_events(file_path, chunk_size):
+        if kind == "product":
+            cls, params = product_cls.split_type(payload)
+            prod = cls.new_product(params)
+            if prod is not None:
+                yield prod
+
+
+def stream_categories(
+    file_path: str, product_cls: Type[Product] = Product, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Category]:
+    """
+    Выдает объекты Category по мере чтения файла.
+
+    Каждая категория создается сразу после разбора ее товаров, поэтому в памяти одновременно находится
+    не больше одной недочитанной категории. Дубликаты внутри категории объединяются по правилам
+    Product.new_product через ProductRegistry. Товары с полем "type" создаются классом с этим именем.
+
+    Args:
+        file_path (str): Путь к JSON-файлу.
+        product_cls (Type[Product]): Класс продуктов без поля "type".
+        chunk_size (int): Размер порции чтения в символах.
+
+    Raises:
+        ValueError: Если у товара отсутствуют обязательные ключи или тип товара неизвестен.
+    """
+    registry = ProductRegistry()
+    for kind, payload in iter_events(file_path, chunk_size):
+        if kind == "product":
+            cls, params = product_cls.split_type(payload)
+            registry.upsert(params, cls)
+        else:
+            products: List[Product] = list(registry)
+            yield Category(payload.get("name", ""), payload.get("description", ""), products)
+            registry = ProductRegistry()
+
+
+def stream_categories_jsonl(file_path: str, product_cls: Type[Product] = Product) -> Iterator[Category]:
+    """
+    Выдает объекты Category из файла JSON Lines, записанного src.exporter.export_jsonl.
+
+    Строка с ключом "category" начинает новую категорию ({"category": название, "description": описание}),
+    остальные строки — товары этой категории (с необязательным полем "type"). Пустые строки пропускаются.
+    Дубликаты внутри категории объединяются, как в stream_categories.
+
+    Args:
+        file_path (str): Путь к файлу.
+        product_cls (Type[Product]): Класс продуктов без поля "type".
+
+    Raises:
+        FileNotFoundError: Если файл не найден.
+        json.JSONDecodeError: Если строка некорректна.
+        ValueError: Если товар встречен до первой категории, у него отсутствуют обязательные ключи
+            или его тип неизвестен.
+    """
+    header: Optional[Dict[str, Any]] = None
+    registry = ProductRegistry()
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "category" in record:
+                if header is not None:
+                    yield Category(header["category"], header.get("description", ""), list(registry))
+                header = record
+                registry = ProductRegistry()
+            elif header is None:
+                raise ValueError("Товар указан до первой категории")
+            else:
+                cls, params = product_cls.split_type(record)
+                registry.upsert(params, cls)
+    if header is not None:
+        yield Category(header["category"], header.get("description", ""), list(registry))
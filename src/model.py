@@ -1,5 +1,85 @@
 import json
-from typing import Any, Dict, List, Optional, Iterator, cast
+import sys
+import weakref
+from contextlib import nullcontext
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from src.concurrency import ShardedCounter, StripedLock
+
+ProductListener = Callable[["Product", str, Any, Any], None]
+CategoryListener = Callable[["Category", "Product"], None]
+
+_NO_LOCK: ContextManager[Any] = nullcontext()
+_product_locks: Optional[StripedLock] = None
+_category_locks: Optional[StripedLock] = None
+
+
+def set_thread_safe(enabled: bool = True) -> None:
+    """
+    Включает или выключает потокобезопасный режим модели.
+
+    В потокобезопасном режиме изменения продукта (сеттеры, set_price, set_quantity, subscribe) выполняются
+    под блокировкой продукта, а add_product и обновление агрегатов категории — под блокировкой категории.
+    Блокировки берутся из наборов StripedLock, поэтому потоки, работающие с разными объектами,
+    не конкурируют за одну общую блокировку. Порядок захвата всегда «продукт, затем категория».
+    Счетчики Category.category_count и Category.product_count потокобезопасны в любом режиме.
+
+    Args:
+        enabled (bool): True — включить режим, False — выключить.
+    """
+    global _product_locks, _category_locks
+    _product_locks = StripedLock() if enabled else None
+    _category_locks = StripedLock() if enabled else None
+
+
+def _product_lock(prod: "Product") -> ContextManager[Any]:
+    locks = _product_locks
+    return locks.get(prod) if locks is not None else _NO_LOCK
+
+
+def _category_lock(category: "Category") -> ContextManager[Any]:
+    locks = _category_locks
+    return locks.get(category) if locks is not None else _NO_LOCK
+
+
+class _WeakListener:
+    """
+    Подписчик продукта, ссылающийся на метод объекта через weakref.WeakMethod.
+
+    Подписка не продлевает жизнь объекта: после его удаления вызов ничего не делает и отписывает
+    подписчика от продукта, а Product.subscribe убирает такие подписчики при следующей подписке.
+    """
+
+    __slots__ = ("_method",)
+
+    def __init__(self, method: ProductListener) -> None:
+        self._method = weakref.WeakMethod(method)
+
+    @property
+    def alive(self) -> bool:
+        return self._method() is not None
+
+    def __call__(self, prod: "Product", field: str, old: Any, new: Any) -> None:
+        method = self._method()
+        if method is None:
+            prod.unsubscribe(self)
+        else:
+            method(prod, field, old, new)
 
 
 class Product:
@@ -11,8 +91,71 @@ class Product:
         description (str): Описание продукта.
         _price (float): Цена продукта (хранится во внутреннем атрибуте).
         _quantity (int): Количество товара в наличии (хранится во внутреннем атрибуте).
+
+    Экземпляры хранят атрибуты в __slots__, без словаря __dict__, что уменьшает расход памяти на товар.
+
+    Изменения названия, цены и количества через сеттеры (и set_price / set_quantity) сообщаются подписчикам,
+    зарегистрированным через subscribe: listener(product, field, old, new).
+
+    Строковые представления (__str__ и render_line) кэшируются и сбрасываются при изменении
+    названия, цены или количества.
     """
 
+    __slots__ = ("_name", "description", "_price", "_quantity", "_listeners", "_str_cache", "_line_cache")
+
+    _types: Dict[str, Type["Product"]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Регистрирует класс-наследник по имени класса для Product.type_for."""
+        super().__init_subclass__(**kwargs)
+        Product._types[cls.__name__] = cls
+
+    @classmethod
+    def type_for(cls, type_name: str) -> Type["Product"]:
+        """
+        Возвращает класс продукта по имени класса ("Product", "Smartphone", "LawnGrass", ...).
+
+        Args:
+            type_name (str): Имя класса.
+
+        Raises:
+            ValueError: Если класс с таким именем не зарегистрирован.
+        """
+        try:
+            return cls._types[type_name]
+        except KeyError:
+            raise ValueError(f"Неизвестный тип товара: {type_name}") from None
+
+    @classmethod
+    def split_type(cls, data: Dict[str, Any]) -> Tuple[Type["Product"], Dict[str, Any]]:
+        """
+        Выбирает класс продукта по полю "type" словаря (имя класса, см. type_for).
+
+        Так читаются словари с полем "type", записанные src.exporter, src.journal и src.sharding.
+
+        Args:
+            data (Dict[str, Any]): Словарь параметров продукта с необязательным полем "type".
+
+        Returns:
+            Tuple[Type[Product], Dict[str, Any]]: Класс и параметры без поля "type". Если поля нет,
+                возвращаются класс, у которого вызван метод, и сам словарь.
+
+        Raises:
+            ValueError: Если класс с таким именем не зарегистрирован.
+        """
+        if "type" not in data:
+            return cls, data
+        params = dict(data)
+        return Product.type_for(params.pop("type")), params
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Возвращает параметры конструктора продукта в виде словаря.
+
+        Наследники дополняют словарь своими атрибутами, так что cls(**product.to_dict()) создает копию продукта.
+        """
+        return {"name": self._name, "description": self.description, "price": self._price, "quantity": self._quantity}
+
     def __init__(self, name: str, description: str, price: float, quantity: int) -> None:
         """
         Инициализирует объект продукта с указанными параметрами.
@@ -23,10 +166,72 @@ class Product:
             price (float): Цена продукта.
             quantity (int): Количество продукта в наличии.
         """
-        self.name: str = name
+        self._name: str = name
         self.description: str = description
         self._price: float = price
         self._quantity: int = quantity
+        # Один подписчик хранится напрямую, список создается только для второго (см. subscribe).
+        self._listeners: Union[None, ProductListener, List[ProductListener]] = None
+        self._str_cache: Optional[str] = None
+        self._line_cache: Optional[str] = None
+
+    def subscribe(self, listener: ProductListener) -> None:
+        """
+        Подписывает функцию на изменения продукта.
+
+        Args:
+            listener (ProductListener): Функция listener(product, field, old, new),
+                field — "name", "price" или "quantity".
+        """
+        with _product_lock(self):
+            current = self._listeners
+            if current is None:
+                self._listeners = listener
+                return
+            # Подписчики удаленных категорий (_WeakListener) убираются, чтобы подписки не накапливались.
+            alive = [f for f in self._subscribers() if not isinstance(f, _WeakListener) or f.alive]
+            alive.append(listener)
+            self._listeners = alive if len(alive) > 1 else listener
+
+    def unsubscribe(self, listener: ProductListener) -> None:
+        """
+        Отписывает функцию от изменений продукта. Неизвестные подписчики игнорируются.
+
+        Args:
+            listener (ProductListener): Ранее подписанная функция.
+        """
+        with _product_lock(self):
+            current = self._listeners
+            if not isinstance(current, list):
+                if current is not None and (current is listener or current == listener):
+                    self._listeners = None
+                return
+            if listener in current:
+                rest = list(current)
+                rest.remove(listener)
+                self._listeners = rest if len(rest) > 1 else rest[0]
+
+    def _subscribers(self) -> Tuple[ProductListener, ...]:
+        """Возвращает подписчиков продукта."""
+        current = self._listeners
+        if current is None:
+            return ()
+        if isinstance(current, list):
+            return tuple(current)
+        return (current,)
+
+    def _notify(self, field: str, old: Any, new: Any) -> None:
+        """Сбрасывает кэш строковых представлений и сообщает подписчикам об изменении поля."""
+        self._str_cache = None
+        self._line_cache = None
+        current = self._listeners
+        if current is None:
+            return
+        if isinstance(current, list):
+            for listener in tuple(current):
+                listener(self, field, old, new)
+        else:
+            current(self, field, old, new)
 
     def __str__(self) -> str:
         """
@@ -36,7 +241,38 @@ class Product:
             "Название продукта, цена руб. Остаток: количество шт."
         (без двоеточия после названия)
         """
-        return f"{self.name}, {self._price:.2f} руб. Остаток: {self._quantity} шт."
+        if self._str_cache is None:
+            self._str_cache = f"{self._name}, {self._price:.2f} руб. Остаток: {self._quantity} шт."
+        return self._str_cache
+
+    def render_line(self) -> str:
+        """
+        Возвращает строку продукта для списка товаров категории (Category.products).
+
+        В отличие от __str__, цена выводится без форматирования знаков после запятой.
+        Результат кэшируется на продукте и переиспользуется всеми категориями, в которые он входит.
+        """
+        if self._line_cache is None:
+            self._line_cache = f"{self._name}, {self._price} руб. Остаток: {self._quantity} шт."
+        return self._line_cache
+
+    @property
+    def name(self) -> str:
+        """Возвращает название продукта."""
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        """
+        Устанавливает название продукта.
+
+        Args:
+            value (str): Новое название.
+        """
+        with _product_lock(self):
+            old = self._name
+            self._name = value
+            self._notify("name", old, value)
 
     def __add__(self, other: "Product") -> float:
         """
@@ -52,6 +288,17 @@ class Product:
             raise TypeError("Можно складывать только объекты одного класса")
         return (self._price * self._quantity) + (other._price * other._quantity)
 
+    def __radd__(self, other: Union[int, float]) -> float:
+        """
+        Прибавляет стоимость товара (цена * количество) к числу.
+
+        Позволяет продолжать сумму после сложения двух продуктов (a + b + c) и использовать sum() по товарам.
+        Проверка класса в этом случае не выполняется: для нее см. src.valuation.
+        """
+        if isinstance(other, (int, float)) and not isinstance(other, bool):
+            return other + self._price * self._quantity
+        return NotImplemented
+
     @property
     def price(self) -> float:
         """Возвращает цену продукта."""
@@ -72,13 +319,32 @@ class Product:
             print(f"Цена не должна быть нулевой или отрицательной (попытка установить {value}).")
             return
 
-        if value < self._price:
-            answer = input(f"Вы уверены, что хотите понизить цену с {self._price} до {value}? (y/n): ")
-            if answer.lower() != "y":
-                print("Изменение цены отменено.")
-                return
+        if not self.set_price(value, _confirm_from_stdin):
+            print("Изменение цены отменено.")
 
-        self._price = value
+    def set_price(self, value: float, confirm: Optional[Callable[["Product", float], bool]] = None) -> bool:
+        """
+        Устанавливает цену без ввода-вывода.
+
+        Нулевая или отрицательная цена отклоняется. Понижение цены применяется, только если
+        функция подтверждения confirm(product, new_price) вернула True; без confirm понижение разрешено.
+
+        Args:
+            value (float): Новая цена.
+            confirm (Optional[Callable[[Product, float], bool]]): Функция подтверждения понижения цены.
+
+        Returns:
+            bool: True, если цена изменена.
+        """
+        if value <= 0:
+            return False
+        with _product_lock(self):
+            old = self._price
+            if value < old and confirm is not None and not confirm(self, value):
+                return False
+            self._price = value
+            self._notify("price", old, value)
+        return True
 
     @property
     def quantity(self) -> int:
@@ -94,14 +360,32 @@ class Product:
         Args:
             value (int): Новое количество.
         """
-        if value < 0:
+        if not self.set_quantity(value):
             print(f"Количество не может быть меньше 0. Попытка установить {value}).")
-            return
-        self._quantity = value
+
+    def set_quantity(self, value: int) -> bool:
+        """
+        Устанавливает количество без ввода-вывода.
+
+        Args:
+            value (int): Новое количество.
+
+        Returns:
+            bool: True, если количество изменено (значение не меньше 0).
+        """
+        if value < 0:
+            return False
+        with _product_lock(self):
+            old = self._quantity
+            self._quantity = value
+            self._notify("quantity", old, value)
+        return True
 
     @classmethod
     def new_product(
-        cls, prod: Dict[str, Any], existing_products: Optional[List["Product"]] = None
+        cls,
+        prod: Dict[str, Any],
+        existing_products: Optional[Union[List["Product"], "ProductRegistry"]] = None,
     ) -> Optional["Product"]:
         """
         Создает новый продукт из словаря параметров.
@@ -109,7 +393,8 @@ class Product:
         Args:
             prod (Dict[str, Any]): Словарь с параметрами продукта.
                 Обязательные ключи: "name", "description", "price", "quantity".
-            existing_products (Optional[List[Product]]): Список существующих продуктов для проверки дубликатов.
+            existing_products (Optional[Union[List[Product], ProductRegistry]]): Список существующих продуктов
+                или реестр ProductRegistry для проверки дубликатов. С реестром поиск дубликата выполняется за O(1).
 
         Returns:
             Optional[Product]: Созданный или обновленный объект продукта, или None, если валидация не прошла.
@@ -124,17 +409,42 @@ class Product:
         if prod["price"] < 0 or prod["quantity"] < 0:
             return None
 
+        if isinstance(existing_products, ProductRegistry):
+            found = existing_products.get(prod["name"], cls)
+            if found is not None:
+                found.merge(prod["price"], prod["quantity"])
+                return found
+            new_prod = cls(**prod)
+            existing_products.add(new_prod)
+            return new_prod
+
         if existing_products is not None:
             for p in existing_products:
                 if p.name == prod["name"]:
-                    p.quantity += prod["quantity"]
-                    p.price = max(p.price, prod["price"])
+                    p.merge(prod["price"], prod["quantity"])
                     return p
         new_prod = cls(**prod)
         if existing_products is not None:
             existing_products.append(new_prod)
         return new_prod
 
+    def merge(self, price: float, quantity: int) -> None:
+        """
+        Объединяет продукт с дубликатом: количество суммируется, цена становится максимальной из двух.
+
+        Args:
+            price (float): Цена дубликата.
+            quantity (int): Количество дубликата.
+        """
+        self.quantity += quantity
+        self.price = max(self.price, price)
+
+
+def _confirm_from_stdin(product: Product, value: float) -> bool:
+    """Запрашивает у пользователя подтверждение понижения цены."""
+    answer = input(f"Вы уверены, что хотите понизить цену с {product.price} до {value}? (y/n): ")
+    return answer.lower() == "y"
+
 
 class Smartphone(Product):
     """
@@ -145,15 +455,25 @@ class Smartphone(Product):
         model (str): Модель смартфона.
         memory (int): Объем встроенной памяти.
         color (str): Цвет смартфона.
+
+    Повторяющиеся строки model и color интернируются через sys.intern и разделяются между экземплярами.
     """
 
+    __slots__ = ("efficiency", "model", "memory", "color")
+
     def __init__(self, name: str, description: str, price: float, quantity: int,
                  efficiency: float, model: str, memory: int, color: str) -> None:
         super().__init__(name, description, price, quantity)
         self.efficiency: float = efficiency
-        self.model: str = model
+        self.model: str = sys.intern(model)
         self.memory: int = memory
-        self.color: str = color
+        self.color: str = sys.intern(color)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает параметры конструктора смартфона в виде словаря."""
+        data = super().to_dict()
+        data.update(efficiency=self.efficiency, model=self.model, memory=self.memory, color=self.color)
+        return data
 
 
 class LawnGrass(Product):
@@ -164,17 +484,262 @@ class LawnGrass(Product):
         country (str): Страна-производитель.
         germination_period (str): Срок прорастания.
         color (str): Цвет травы.
+
+    Повторяющиеся строки country, germination_period и color интернируются через sys.intern.
     """
 
+    __slots__ = ("country", "germination_period", "color")
+
     def __init__(self, name: str, description: str, price: float, quantity: int,
                  country: str, germination_period: str, color: str) -> None:
         super().__init__(name, description, price, quantity)
-        self.country: str = country
-        self.germination_period: str = germination_period
-        self.color: str = color
+        self.country: str = sys.intern(country)
+        self.germination_period: str = sys.intern(germination_period)
+        self.color: str = sys.intern(color)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает параметры конструктора газонной травы в виде словаря."""
+        data = super().to_dict()
+        data.update(country=self.country, germination_period=self.germination_period, color=self.color)
+        return data
+
 
+Product._types[Product.__name__] = Product
 
-class Category:
+
+class ProductRegistry:
+    """
+    Реестр продуктов с доступом по ключу за O(1).
+
+    Заменяет линейный поиск дубликатов в Product.new_product. Ключом служит название продукта,
+    а при by_class=True — пара (класс, название), так что одноименные товары разных классов не объединяются.
+    При совпадении ключа действуют правила new_product: количество суммируется, цена становится максимальной.
+
+    Атрибуты:
+        by_class (bool): Учитывать ли класс продукта в ключе.
+    """
+
+    def __init__(self, products: Iterable[Product] = (), by_class: bool = False) -> None:
+        """
+        Инициализирует реестр и добавляет в него переданные продукты.
+
+        Args:
+            products (Iterable[Product]): Начальный набор продуктов.
+            by_class (bool): Учитывать ли класс продукта в ключе.
+        """
+        self.by_class: bool = by_class
+        self._items: Dict[Hashable, Product] = {}
+        for p in products:
+            self.add(p)
+
+    def _key(self, name: str, cls: Type[Product]) -> Hashable:
+        return (cls, name) if self.by_class else name
+
+    def get(self, name: str, cls: Type[Product] = Product) -> Optional[Product]:
+        """
+        Возвращает продукт по названию (и классу, если by_class=True) или None.
+
+        Args:
+            name (str): Название продукта.
+            cls (Type[Product]): Класс продукта, учитывается только при by_class=True.
+        """
+        return self._items.get(self._key(name, cls))
+
+    def add(self, prod: Product) -> Product:
+        """
+        Добавляет готовый объект продукта в реестр, объединяя его с дубликатом при наличии.
+
+        Args:
+            prod (Product): Объект продукта.
+
+        Returns:
+            Product: Продукт, хранящийся в реестре (существующий или переданный).
+
+        Raises:
+            TypeError: Если переданный аргумент не является экземпляром Product.
+        """
+        if not isinstance(prod, Product):
+            raise TypeError("Можно добавлять только объекты класса Product")
+        key = self._key(prod.name, type(prod))
+        found = self._items.get(key)
+        if found is None:
+            self._items[key] = prod
+            return prod
+        if found is not prod:
+            found.merge(prod.price, prod.quantity)
+        return found
+
+    def upsert(self, prod: Dict[str, Any], cls: Type[Product] = Product) -> Optional[Product]:
+        """
+        Создает продукт из словаря или обновляет существующий за O(1).
+
+        Args:
+            prod (Dict[str, Any]): Словарь с параметрами продукта (как в Product.new_product).
+            cls (Type[Product]): Класс создаваемого продукта.
+
+        Returns:
+            Optional[Product]: Созданный или обновленный продукт, или None, если валидация не прошла.
+
+        Raises:
+            ValueError: Если отсутствуют обязательные ключи в словаре.
+        """
+        return cls.new_product(prod, self)
+
+    def upsert_many(self, prods: Iterable[Dict[str, Any]], cls: Type[Product] = Product) -> List[Product]:
+        """
+        Выполняет upsert для каждого словаря из набора.
+
+        Args:
+            prods (Iterable[Dict[str, Any]]): Словари с параметрами продуктов.
+            cls (Type[Product]): Класс создаваемых продуктов.
+
+        Returns:
+            List[Product]: Продукты, затронутые операцией, в порядке входных данных (без не прошедших валидацию).
+        """
+        result = []
+        for prod in prods:
+            p = cls.new_product(prod, self)
+            if p is not None:
+                result.append(p)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Product]:
+        return iter(self._items.values())
+
+    def __contains__(self, name: object) -> bool:
+        if self.by_class:
+            return any(key[1] == name for key in self._items)  # type: ignore[index]
+        return name in self._items
+
+
+class CategoryVersion:
+    """
+    Неизменяемая версия списка товаров категории.
+
+    Товары хранятся кортежами-блоками по CHUNK элементов. Новая версия после add_product переиспользует
+    все заполненные блоки предыдущей и копирует только последний неполный блок, поэтому версии
+    разделяют сами блоки. Кортеж ссылок на блоки копируется целиком, так что построение новой версии
+    стоит O(n / CHUNK + CHUNK + k), где n — размер версии, k — число добавленных товаров; при CHUNK = 256
+    копирование ссылок на блоки заметно только на категориях из миллионов товаров.
+
+    Версия фиксирует состав категории; сами объекты Product общие, и изменения их цены или количества
+    видны во всех версиях.
+
+    Атрибуты:
+        version (int): Номер версии категории (растет с каждым изменением состава).
+    """
+
+    __slots__ = ("version", "_chunks", "_length")
+
+    CHUNK = 256
+
+    def __init__(self, version: int = 0, chunks: Tuple[Tuple[Any, ...], ...] = (), length: int = 0) -> None:
+        self.version = version
+        self._chunks = chunks
+        self._length = length
+
+    def extend(self, items: Sequence[Any], version: int) -> "CategoryVersion":
+        """
+        Возвращает новую версию с добавленными в конец элементами. Текущая версия не изменяется.
+
+        Заполненные блоки разделяются с текущей версией, копируются кортеж ссылок на блоки
+        и последний неполный блок.
+
+        Args:
+            items (Sequence[Any]): Добавляемые элементы.
+            version (int): Номер новой версии.
+        """
+        chunks = list(self._chunks)
+        pending = list(chunks.pop()) if chunks and len(chunks[-1]) < self.CHUNK else []
+        pending.extend(items)
+        for start in range(0, len(pending), self.CHUNK):
+            chunks.append(tuple(pending[start : start + self.CHUNK]))
+        return CategoryVersion(version, tuple(chunks), self._length + len(items))
+
+    def replace(self, items: Dict[int, Any], version: int) -> "CategoryVersion":
+        """
+        Возвращает новую версию, в которой элементы с указанными индексами заменены. Текущая версия
+        не изменяется.
+
+        Копируются только блоки с заменами и кортеж ссылок на блоки, остальные блоки разделяются.
+
+        Args:
+            items (Dict[int, Any]): Новые элементы по индексам.
+            version (int): Номер новой версии.
+
+        Raises:
+            IndexError: Если индекс за пределами версии.
+        """
+        by_chunk: Dict[int, List[Tuple[int, Any]]] = {}
+        for index, item in items.items():
+            if not 0 <= index < self._length:
+                raise IndexError("Индекс за пределами версии категории")
+            by_chunk.setdefault(index // self.CHUNK, []).append((index % self.CHUNK, item))
+        chunks = list(self._chunks)
+        for number, replacements in by_chunk.items():
+            chunk = list(chunks[number])
+            for offset, item in replacements:
+                chunk[offset] = item
+            chunks[number] = tuple(chunk)
+        return CategoryVersion(version, tuple(chunks), self._length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self._chunks)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Индекс за пределами версии категории")
+        return self._chunks[index // self.CHUNK][index % self.CHUNK]
+
+
+_category_counter = ShardedCounter()
+_product_counter = ShardedCounter()
+
+
+class _CounterAttribute:
+    """Счетчик ShardedCounter, доступный для чтения из экземпляров Category (класс читает его через метакласс)."""
+
+    def __init__(self, counter: ShardedCounter) -> None:
+        self._counter = counter
+
+    def __get__(self, obj: Any, owner: Any = None) -> int:
+        return self._counter.value
+
+    def __set__(self, obj: Any, value: int) -> None:
+        raise AttributeError("Счетчик изменяется только через класс Category")
+
+
+class _CategoryMeta(type):
+    """Метакласс Category: счетчики category_count и product_count хранятся в ShardedCounter."""
+
+    @property
+    def category_count(cls) -> int:
+        return _category_counter.value
+
+    @category_count.setter
+    def category_count(cls, value: int) -> None:
+        _category_counter.reset(value)
+
+    @property
+    def product_count(cls) -> int:
+        return _product_counter.value
+
+    @product_count.setter
+    def product_count(cls, value: int) -> None:
+        _product_counter.reset(value)
+
+
+class Category(metaclass=_CategoryMeta):
     """
     Класс для представления категории товаров.
 
@@ -184,10 +749,24 @@ class Category:
         __products (List[Any]): Приватный список товаров.
         category_count (int): Общее количество созданных категорий.
         product_count (int): Общее количество товаров во всех категориях.
+
+    Категория поддерживает агрегаты по своим товарам (item_count, total_quantity, stock_value,
+    min_price, max_price). Они обновляются за O(1) при add_product и при изменении цены или количества
+    товара через его сеттеры, поэтому чтение не требует обхода списка товаров.
+
+    Строка products кэшируется до следующего изменения состава категории или ее товаров.
+
+    Читатели работают с неизменяемыми версиями состава категории (snapshot, CategoryVersion): итератор,
+    products, iter_product_lines и products_page не видят товаров, добавленных после начала обхода,
+    и не требуют блокировок на время обхода.
+
+    Счетчики category_count и product_count разделены по потокам (ShardedCounter) и не теряют обновлений
+    при одновременном создании категорий и добавлении товаров. Они читаются и из класса, и из экземпляров,
+    а сбрасываются присваиванием атрибуту класса. См. также set_thread_safe.
     """
 
-    category_count: int = 0
-    product_count: int = 0
+    category_count = _CounterAttribute(_category_counter)
+    product_count = _CounterAttribute(_product_counter)
 
     def __init__(self, name: str, description: str, products: List[Any]) -> None:
         """
@@ -201,8 +780,69 @@ class Category:
         self.__name: str = name
         self.__description: str = description
         self.__products: List[Any] = products
-        Category.category_count += 1
-        Category.product_count += len(products)
+        self._listeners: List[CategoryListener] = []
+        # Товары ссылаются на категорию слабо: подписка не удерживает удаленную категорию в памяти.
+        self._product_listener = _WeakListener(self._on_product_changed)
+        # Версия 0 пуста, поэтому первый вызов snapshot построит версию из переданного списка.
+        self._version: int = 1
+        self._changes: int = 0
+        self._snapshot: CategoryVersion = CategoryVersion()
+        self._reset_aggregates()
+        _category_counter.add(1)
+        _product_counter.add(len(products))
+
+    def _reset_aggregates(self) -> None:
+        """Пересчитывает агрегаты по текущему списку товаров и подписывается на изменения товаров."""
+        self._item_count: int = 0
+        self._total_quantity: int = 0
+        self._stock_value: float = 0.0
+        self._price_counts: Dict[float, int] = {}
+        self._min_price: Optional[float] = None
+        self._max_price: Optional[float] = None
+        # Кэш products хранится вместе с версией состава и счетчиком изменений товаров, по которым построен.
+        self._products_cache: Optional[Tuple[int, int, str]] = None
+        for p in self.__products:
+            if isinstance(p, Product):
+                self._track(p)
+
+    def _track(self, prod: Product) -> None:
+        """Учитывает товар в агрегатах и подписывается на его изменения."""
+        self._item_count += 1
+        self._total_quantity += prod.quantity
+        self._stock_value += prod.price * prod.quantity
+        self._count_price(prod.price)
+        prod.subscribe(self._product_listener)
+
+    def _count_price(self, price: float) -> None:
+        self._price_counts[price] = self._price_counts.get(price, 0) + 1
+        if self._min_price is not None and price < self._min_price:
+            self._min_price = price
+        if self._max_price is not None and price > self._max_price:
+            self._max_price = price
+
+    def _uncount_price(self, price: float) -> None:
+        left = self._price_counts[price] - 1
+        if left:
+            self._price_counts[price] = left
+            return
+        del self._price_counts[price]
+        # Крайние значения пересчитываются лениво при следующем чтении.
+        if price == self._min_price:
+            self._min_price = None
+        if price == self._max_price:
+            self._max_price = None
+
+    def _on_product_changed(self, prod: Product, field: str, old: Any, new: Any) -> None:
+        """Обновляет агрегаты и сбрасывает кэш списка при изменении товара категории."""
+        with _category_lock(self):
+            self._changes += 1
+            if field == "price":
+                self._stock_value += (new - old) * prod.quantity
+                self._uncount_price(old)
+                self._count_price(new)
+            elif field == "quantity":
+                self._total_quantity += new - old
+                self._stock_value += (new - old) * prod.price
 
     def parser_json(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -223,7 +863,7 @@ class Category:
                 for item in data:
                     self.__name = item["name"]
                     self.__description = item["description"]
-                    self.__products = item["products"]
+                    self._replace_products(item["products"])
                 return data
         except (FileNotFoundError, json.JSONDecodeError):
             return []
@@ -240,8 +880,116 @@ class Category:
         """
         if not isinstance(prod, Product):
             raise TypeError("Можно добавлять только объекты класса Product")
-        self.__products.append(prod)
-        Category.product_count += 1
+        with _product_lock(prod), _category_lock(self):
+            self.__products.append(prod)
+            self._version += 1
+            self._track(prod)
+        _product_counter.add(1)
+        for listener in tuple(self._listeners):
+            listener(self, prod)
+
+    def subscribe(self, listener: CategoryListener) -> None:
+        """
+        Подписывает функцию на добавление товаров в категорию.
+
+        Args:
+            listener (CategoryListener): Функция listener(category, product), вызывается после add_product.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: CategoryListener) -> None:
+        """
+        Отписывает функцию от добавления товаров. Неизвестные подписчики игнорируются.
+
+        Args:
+            listener (CategoryListener): Ранее подписанная функция.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def detach(self) -> None:
+        """
+        Отписывает категорию от изменений ее товаров.
+
+        Нужен, когда товары переходят в другую категорию, а эта больше не используется:
+        агрегаты и кэш products категории после вызова не обновляются.
+        """
+        for p in self.__products:
+            if isinstance(p, Product):
+                p.unsubscribe(self._product_listener)
+
+    def _replace_products(self, products: List[Any]) -> None:
+        """Заменяет список товаров и пересчитывает агрегаты."""
+        self.detach()
+        with _category_lock(self):
+            self.__products = products
+            self._version += 1
+            self._snapshot = CategoryVersion()
+        self._reset_aggregates()
+
+    def snapshot(self) -> CategoryVersion:
+        """
+        Возвращает неизменяемую версию текущего состава категории.
+
+        Версия строится лениво из предыдущей: добавляются только товары, появившиеся после нее.
+        Пока состав не меняется, повторные вызовы возвращают тот же объект без блокировок.
+
+        Returns:
+            CategoryVersion: Версия списка товаров.
+        """
+        current = self._snapshot
+        if current.version == self._version:
+            return current
+        with _category_lock(self):
+            # Номер версии читается до среза: add_product сначала добавляет товар, затем увеличивает номер,
+            # поэтому товар, добавленный между чтениями, попадет в срез, а версия останется устаревшей
+            # и будет достроена при следующем вызове.
+            version = self._version
+            current = self._snapshot
+            products = self.__products
+            current = current.extend(products[len(current) :], version)
+            if products is self.__products:
+                self._snapshot = current
+            return current
+
+    @property
+    def item_count(self) -> int:
+        """Возвращает количество товаров (объектов Product) в категории."""
+        return self._item_count
+
+    @property
+    def total_quantity(self) -> int:
+        """Возвращает суммарное количество единиц товара в категории."""
+        return self._total_quantity
+
+    @property
+    def stock_value(self) -> float:
+        """Возвращает суммарную стоимость остатков (цена * количество) в категории."""
+        return self._stock_value
+
+    @property
+    def min_price(self) -> Optional[float]:
+        """Возвращает минимальную цену товара в категории или None, если товаров нет."""
+        if self._min_price is None and self._price_counts:
+            self._min_price = min(self._price_counts)
+        return self._min_price
+
+    @property
+    def max_price(self) -> Optional[float]:
+        """Возвращает максимальную цену товара в категории или None, если товаров нет."""
+        if self._max_price is None and self._price_counts:
+            self._max_price = max(self._price_counts)
+        return self._max_price
+
+    @property
+    def name(self) -> str:
+        """Возвращает название категории."""
+        return self.__name
+
+    @property
+    def description(self) -> str:
+        """Возвращает описание категории."""
+        return self.__description
 
     @property
     def products(self) -> str:
@@ -255,38 +1003,75 @@ class Category:
         Returns:
             str: Строка с описанием каждого продукта или сообщение об отсутствии товаров.
         """
-        if not self.__products:
-            return "В категории нет товаров."
-        formatted = []
-        for p in self.__products:
-            if hasattr(p, "name") and hasattr(p, "price") and hasattr(p, "quantity"):
-                formatted.append(f"{p.name}, {p.price} руб. Остаток: {p.quantity} шт.")
-            else:
-                formatted.append(str(p))
-        return "\n".join(formatted)
+        cache = self._products_cache
+        if cache is not None and cache[0] == self._version and cache[1] == self._changes:
+            return cache[2]
+        # Счетчик изменений читается до построения: изменение товара во время построения сделает кэш устаревшим.
+        changes = self._changes
+        version = self.snapshot()
+        text = "\n".join(map(_render_item, version)) if version else "В категории нет товаров."
+        self._products_cache = (version.version, changes, text)
+        return text
+
+    def iter_product_lines(self) -> Iterator[str]:
+        """
+        Лениво выдает строки товаров в формате products, не собирая их в одну строку.
+
+        Строки объектов Product берутся из кэша продукта (Product.render_line). Обход идет по версии
+        состава на момент вызова (см. snapshot).
+        """
+        for p in self.snapshot():
+            yield _render_item(p)
+
+    def products_page(self, page: int, per_page: int = 50) -> List[str]:
+        """
+        Возвращает одну страницу строк товаров в формате products.
+
+        Args:
+            page (int): Номер страницы, начиная с 1.
+            per_page (int): Количество товаров на странице.
+
+        Returns:
+            List[str]: Строки товаров страницы (пустой список за пределами каталога).
+
+        Raises:
+            ValueError: Если page или per_page меньше 1.
+        """
+        if page < 1 or per_page < 1:
+            raise ValueError("Номер страницы и размер страницы должны быть не меньше 1")
+        start = (page - 1) * per_page
+        return [_render_item(p) for p in self.snapshot()[start : start + per_page]]
 
     def __iter__(self) -> "CategoryIterator":
         """Возвращает итератор для перебора товаров категории."""
         return CategoryIterator(self)
 
 
+def _render_item(item: Any) -> str:
+    """Форматирует элемент списка товаров категории."""
+    if isinstance(item, Product):
+        return item.render_line()
+    if hasattr(item, "name") and hasattr(item, "price") and hasattr(item, "quantity"):
+        return f"{item.name}, {item.price} руб. Остаток: {item.quantity} шт."
+    return str(item)
+
+
 class CategoryIterator:
     """
     Вспомогательный класс для итерации по товарам категории.
 
     Принимает объект класса Category и позволяет перебирать товары в цикле for.
+    Перебирается версия состава категории на момент создания итератора (Category.snapshot),
+    поэтому одновременные add_product не влияют на обход.
     """
 
+    __slots__ = ("_items",)
+
     def __init__(self, category: Category) -> None:
-        self._products: List[Any] = cast(List[Any], getattr(category, "_Category__products"))
-        self._index: int = 0
+        self._items: Iterator[Any] = iter(category.snapshot())
 
     def __iter__(self) -> "CategoryIterator":
         return self
 
     def __next__(self) -> Any:
-        if self._index >= len(self._products):
-            raise StopIteration
-        result = self._products[self._index]
-        self._index += 1
-        return result
+        return next(self._items)
@@ -0,0 +1,314 @@
+import threading
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from src.model import Category, Product, _WeakListener
+
+_INF = float("inf")
+_MISSING = object()
+
+Key = Tuple[Any, int]
+# Граница диапазона: (значение, -1) или (значение, inf), не совпадает ни с одним ключом.
+Bound = Tuple[Any, float]
+
+
+class _SortedKeys:
+    """
+    Отсортированный набор ключей (значение, seq), разбитый на блоки длиной не больше 2 * LOAD.
+
+    Вставка и удаление находят блок бинарным поиском по максимумам блоков и сдвигают элементы только
+    внутри него: O(log n + LOAD) вместо O(n) у insort в один список. Позиция ключа (для оценки
+    размера диапазона) считается за O(n / LOAD).
+    """
+
+    LOAD = 512
+
+    def __init__(self) -> None:
+        self._blocks: List[List[Key]] = []
+        self._maxes: List[Key] = []
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def add(self, key: Key) -> None:
+        blocks, maxes = self._blocks, self._maxes
+        self._len += 1
+        if not blocks:
+            blocks.append([key])
+            maxes.append(key)
+            return
+        i = bisect_left(maxes, key)
+        if i == len(maxes):
+            i -= 1
+            blocks[i].append(key)
+            maxes[i] = key
+        else:
+            insort(blocks[i], key)
+        block = blocks[i]
+        if len(block) > 2 * self.LOAD:
+            blocks.insert(i + 1, block[self.LOAD :])
+            del block[self.LOAD :]
+            maxes.insert(i, block[-1])
+
+    def remove(self, key: Key) -> None:
+        """
+        Удаляет ключ.
+
+        Raises:
+            ValueError: Если ключа нет.
+        """
+        i = bisect_left(self._maxes, key)
+        block = self._blocks[i] if i < len(self._blocks) else []
+        pos = bisect_left(block, key)
+        if pos == len(block) or block[pos] != key:
+            raise ValueError(f"Ключ {key!r} не найден")
+        del block[pos]
+        self._len -= 1
+        if block:
+            self._maxes[i] = block[-1]
+        else:
+            del self._blocks[i]
+            del self._maxes[i]
+
+    def _position(self, key: Bound) -> int:
+        """Возвращает число ключей меньше key."""
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return self._len
+        return sum(map(len, islice(self._blocks, i))) + bisect_left(self._blocks[i], key)
+
+    def count(self, low: Optional[Any], high: Optional[Any]) -> int:
+        """Возвращает число ключей со значением в диапазоне [low, high] (None — открытая граница)."""
+        start = 0 if low is None else self._position((low, -1))
+        end = self._len if high is None else self._position((high, _INF))
+        return end - start
+
+    def between(self, low: Optional[Any], high: Optional[Any]) -> List[Key]:
+        """Возвращает ключи со значением в диапазоне [low, high] по возрастанию."""
+        lo: Optional[Bound] = None if low is None else (low, -1)
+        hi: Optional[Bound] = None if high is None else (high, _INF)
+        first = 0 if lo is None else bisect_left(self._maxes, lo)
+        result: List[Key] = []
+        for block in islice(self._blocks, first, None):
+            start = 0 if lo is None else bisect_left(block, lo)
+            lo = None
+            if hi is not None and block[-1] > hi:
+                result.extend(block[start : bisect_left(block, hi)])
+                break
+            result.extend(block[start:])
+        return result
+
+
+class CatalogIndex:
+    """
+    Вторичные индексы по товарам категорий и API запросов к ним.
+
+    Поддерживаются:
+        - отсортированный индекс цен для запросов по диапазону цен;
+        - индекс по классу товара (Product, Smartphone, LawnGrass, ...);
+        - индексы по атрибутам (например, memory, color, country): точное совпадение по значению
+          и отсортированный индекс для диапазонов по числовым значениям.
+
+    Индекс подписывается на добавление товаров в категории и на изменение цены товаров, поэтому
+    остается актуальным без перестроения. Значения атрибутов фиксируются при добавлении товара.
+
+    Атрибуты:
+        attributes (Tuple[str, ...]): Индексируемые атрибуты.
+    """
+
+    def __init__(
+        self, categories: Iterable[Category] = (), attributes: Iterable[str] = ("memory", "color", "country")
+    ) -> None:
+        """
+        Инициализирует индекс и добавляет в него товары категорий.
+
+        Args:
+            categories (Iterable[Category]): Категории для индексации.
+            attributes (Iterable[str]): Индексируемые атрибуты товаров.
+        """
+        self.attributes: Tuple[str, ...] = tuple(attributes)
+        self._lock = threading.RLock()
+        self._seq = 0
+        self._entries: Dict[Product, Tuple[int, float]] = {}
+        self._prices = _SortedKeys()
+        self._products: Dict[int, Product] = {}
+        self._by_type: Dict[type, Dict[Product, None]] = {}
+        self._by_value: Dict[str, Dict[Any, Dict[Product, None]]] = {attr: {} for attr in self.attributes}
+        self._sorted: Dict[str, _SortedKeys] = {attr: _SortedKeys() for attr in self.attributes}
+        # Товары ссылаются на индекс слабо: подписки не удерживают удаленный индекс в памяти.
+        self._product_listener = _WeakListener(self._on_product_changed)
+        for category in categories:
+            self.add_category(category)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add_category(self, category: Category) -> None:
+        """
+        Индексирует товары категории и подписывается на добавление новых.
+
+        Args:
+            category (Category): Категория товаров.
+        """
+        category.subscribe(self._on_product_added)
+        for prod in category:
+            if isinstance(prod, Product):
+                self.add(prod)
+
+    def _on_product_added(self, category: Category, prod: Product) -> None:
+        self.add(prod)
+
+    def add(self, prod: Product) -> None:
+        """
+        Добавляет товар в индексы. Повторное добавление того же объекта игнорируется.
+
+        Args:
+            prod (Product): Товар.
+        """
+        if prod in self._entries:
+            return
+        prod.subscribe(self._product_listener)
+        with self._lock:
+            if prod in self._entries:
+                return
+            self._seq += 1
+            seq = self._seq
+            price = prod.price
+            self._entries[prod] = (seq, price)
+            self._products[seq] = prod
+            self._prices.add((price, seq))
+            self._by_type.setdefault(type(prod), {})[prod] = None
+            for attr in self.attributes:
+                value = getattr(prod, attr, _MISSING)
+                if value is _MISSING:
+                    continue
+                self._by_value[attr].setdefault(value, {})[prod] = None
+                if isinstance(value, (int, float)):
+                    self._sorted[attr].add((value, seq))
+
+    def _on_product_changed(self, prod: Product, field: str, old: Any, new: Any) -> None:
+        if field != "price":
+            return
+        with self._lock:
+            entry = self._entries.get(prod)
+            if entry is None:
+                return
+            seq, indexed_price = entry
+            self._prices.remove((indexed_price, seq))
+            self._prices.add((new, seq))
+            self._entries[prod] = (seq, new)
+
+    def price_range(self, min_price: Optional[float] = None, max_price: Optional[float] = None) -> List[Product]:
+        """
+        Возвращает товары с ценой в диапазоне [min_price, max_price], упорядоченные по цене.
+
+        Args:
+            min_price (Optional[float]): Нижняя граница или None.
+            max_price (Optional[float]): Верхняя граница или None.
+        """
+        with self._lock:
+            return [self._products[seq] for _, seq in self._prices.between(min_price, max_price)]
+
+    def of_type(self, cls: Type[Product], exact: bool = False) -> List[Product]:
+        """
+        Возвращает товары указанного класса.
+
+        Args:
+            cls (Type[Product]): Класс товара.
+            exact (bool): Если False, учитываются и наследники cls.
+        """
+        with self._lock:
+            if exact:
+                return list(self._by_type.get(cls, ()))
+            return [p for t, members in self._by_type.items() if issubclass(t, cls) for p in members]
+
+    def where(self, attr: str, value: Any) -> List[Product]:
+        """
+        Возвращает товары, у которых атрибут attr равен value.
+
+        Raises:
+            KeyError: Если атрибут не индексируется.
+        """
+        with self._lock:
+            return list(self._by_value[attr].get(value, ()))
+
+    def attribute_range(self, attr: str, low: Optional[Any] = None, high: Optional[Any] = None) -> List[Product]:
+        """
+        Возвращает товары с числовым значением атрибута в диапазоне [low, high], упорядоченные по значению.
+
+        Raises:
+            KeyError: Если атрибут не индексируется.
+        """
+        with self._lock:
+            return [self._products[seq] for _, seq in self._sorted[attr].between(low, high)]
+
+    def search(
+        self,
+        product_type: Optional[Type[Product]] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        **conditions: Any,
+    ) -> List[Product]:
+        """
+        Ищет товары по сочетанию условий и возвращает их упорядоченными по цене.
+
+        Для каждого условия размер выборки оценивается по индексу (для диапазонов — бинарным поиском),
+        затем из индекса извлекается только самая маленькая выборка, а остальные условия проверяются
+        на ее элементах. Условие на атрибут — точное значение либо кортеж (low, high) с None вместо
+        открытой границы, например search(Smartphone, max_price=200000, memory=(512, None)).
+
+        Args:
+            product_type (Optional[Type[Product]]): Класс товара (с наследниками).
+            min_price (Optional[float]): Нижняя граница цены.
+            max_price (Optional[float]): Верхняя граница цены.
+            **conditions (Any): Условия на индексируемые атрибуты.
+
+        Raises:
+            KeyError: Если атрибут из conditions не индексируется.
+        """
+        with self._lock:
+            plans: List[Tuple[int, Callable[[], List[Product]], Callable[[Product], bool]]] = []
+            if min_price is not None or max_price is not None:
+                plans.append(
+                    (
+                        self._prices.count(min_price, max_price),
+                        lambda: self.price_range(min_price, max_price),
+                        lambda p: _within(self._entries[p][1], min_price, max_price),
+                    )
+                )
+            if product_type is not None:
+                cls = product_type
+                size = sum(len(members) for t, members in self._by_type.items() if issubclass(t, cls))
+                plans.append((size, lambda: self.of_type(cls), lambda p: isinstance(p, cls)))
+            for attr, condition in conditions.items():
+                plans.append(self._attribute_plan(attr, condition))
+            if not plans:
+                return self.price_range()
+            plans.sort(key=lambda plan: plan[0])
+            checks = [plan[2] for plan in plans[1:]]
+            result = [p for p in plans[0][1]() if all(check(p) for check in checks)]
+            result.sort(key=lambda p: self._entries[p][::-1])
+            return result
+
+    def _attribute_plan(
+        self, attr: str, condition: Any
+    ) -> Tuple[int, Callable[[], List[Product]], Callable[[Product], bool]]:
+        """Возвращает (размер выборки, извлечение выборки, проверка товара) для условия на атрибут."""
+        if isinstance(condition, tuple):
+            low, high = condition
+            return (
+                self._sorted[attr].count(low, high),
+                lambda: self.attribute_range(attr, low, high),
+                lambda p: _within(getattr(p, attr, None), low, high),
+            )
+        members = self._by_value[attr].get(condition, {})
+        return len(members), lambda: list(members), lambda p: p in members
+
+
+def _within(value: Any, low: Optional[Any], high: Optional[Any]) -> bool:
+    """Проверяет, что числовое значение лежит в диапазоне [low, high] (None — открытая граница)."""
+    if not isinstance(value, (int, float)):
+        return False
+    return (low is None or value >= low) and (high is None or value <= high)
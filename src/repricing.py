@@ -0,0 +1,111 @@
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional
+
+from src.model import Product
+
+ConfirmPolicy = Callable[[Product, float], bool]
+
+
+def auto_approve(product: Product, new_price: float) -> bool:
+    """Политика подтверждения: любое понижение цены разрешено."""
+    return True
+
+
+def reject_decrease(product: Product, new_price: float) -> bool:
+    """Политика подтверждения: любое понижение цены отклоняется."""
+    return False
+
+
+def max_discount(ratio: float) -> ConfirmPolicy:
+    """
+    Возвращает политику, разрешающую понижение цены не более чем на долю ratio от текущей.
+
+    Args:
+        ratio (float): Максимальная доля скидки, например 0.2 для 20%.
+    """
+
+    def policy(product: Product, new_price: float) -> bool:
+        return new_price >= product.price * (1 - ratio)
+
+    return policy
+
+
+@dataclass(frozen=True)
+class PriceChange:
+    """
+    Изменение цены и/или количества одного продукта.
+
+    Атрибуты:
+        product (Product): Изменяемый продукт.
+        price (Optional[float]): Новая цена или None, если цена не меняется.
+        quantity (Optional[int]): Новое количество или None, если количество не меняется.
+    """
+
+    product: Product
+    price: Optional[float] = None
+    quantity: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Rejection:
+    """
+    Отклоненное изменение с причиной отказа.
+
+    Атрибуты:
+        change (PriceChange): Отклоненное изменение.
+        reason (str): Причина отказа.
+    """
+
+    change: PriceChange
+    reason: str
+
+
+@dataclass
+class RepricingResult:
+    """
+    Результат пакетного изменения цен.
+
+    Атрибуты:
+        applied (List[PriceChange]): Примененные изменения.
+        rejected (List[Rejection]): Отклоненные изменения с причинами.
+    """
+
+    applied: List[PriceChange] = field(default_factory=list)
+    rejected: List[Rejection] = field(default_factory=list)
+
+
+def apply_changes(changes: Iterable[PriceChange], policy: ConfirmPolicy = reject_decrease) -> RepricingResult:
+    """
+    Применяет пакет изменений цен и количества без обращения к stdin и без print.
+
+    Каждое изменение применяется целиком или не применяется вовсе: сначала проверяются оба значения
+    (цена должна быть положительной, количество — не меньше 0, понижение цены должно одобрить policy),
+    затем значения устанавливаются через Product.set_price и Product.set_quantity.
+
+    Args:
+        changes (Iterable[PriceChange]): Изменения для применения.
+        policy (ConfirmPolicy): Политика подтверждения понижения цены, вызывается как policy(product, new_price).
+
+    Returns:
+        RepricingResult: Списки примененных и отклоненных изменений.
+    """
+    result = RepricingResult()
+    for change in changes:
+        prod = change.product
+        reason = None
+        if change.price is not None:
+            if change.price <= 0:
+                reason = f"Цена не должна быть нулевой или отрицательной ({change.price})"
+            elif change.price < prod.price and not policy(prod, change.price):
+                reason = f"Понижение цены с {prod.price} до {change.price} не подтверждено"
+        if reason is None and change.quantity is not None and change.quantity < 0:
+            reason = f"Количество не может быть меньше 0 ({change.quantity})"
+        if reason is not None:
+            result.rejected.append(Rejection(change, reason))
+            continue
+        if change.price is not None:
+            prod.set_price(change.price)
+        if change.quantity is not None:
+            prod.set_quantity(change.quantity)
+        result.applied.append(change)
+    return result
@@ -0,0 +1,353 @@
+import re
+import threading
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.model import Category, Product, _WeakListener
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """
+    Приводит текст к виду для поиска: casefold, «ё» заменяется на «е», пробелы схлопываются.
+
+    Args:
+        text (str): Исходный текст.
+    """
+    return " ".join(_WORD.findall(text.casefold().replace("ё", "е")))
+
+
+def tokenize(text: str) -> List[str]:
+    """Разбивает текст на нормализованные слова (кириллица, латиница, цифры)."""
+    return _WORD.findall(text.casefold().replace("ё", "е"))
+
+
+def ngrams(text: str, n: int = 3) -> Set[str]:
+    """
+    Возвращает множество n-грамм нормализованной строки, дополненной пробелами по краям.
+
+    Args:
+        text (str): Нормализованная строка.
+        n (int): Длина n-граммы.
+    """
+    padded = f" {text} "
+    return {padded[i : i + n] for i in range(max(1, len(padded) - n + 1))}
+
+
+def levenshtein(a: str, b: str, limit: Optional[int] = None) -> int:
+    """
+    Возвращает расстояние Левенштейна между строками.
+
+    Args:
+        a (str): Первая строка.
+        b (str): Вторая строка.
+        limit (Optional[int]): Если задан, расчет прекращается, как только расстояние заведомо больше limit;
+            в этом случае возвращается limit + 1.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class SearchIndex:
+    """
+    Полнотекстовый и нечеткий поиск по названиям и описаниям товаров.
+
+    Поддерживаются:
+        - инвертированный индекс слов названия и описания (search);
+        - индекс триграмм названий для поиска по расстоянию Левенштейна (fuzzy, likely_duplicates).
+
+    Текст нормализуется функцией normalize, поэтому поиск не зависит от регистра и различия «е»/«ё».
+    Кандидаты для нечеткого поиска отбираются по редким триграммам запроса: при расстоянии не больше k
+    название обязано содержать хотя бы одну из n * k + 1 любых различных триграмм запроса и не меньше
+    len(grams) - n * k общих триграмм. Если редкие триграммы все равно частые (короткий запрос, названия
+    с общим префиксом вроде «Товар 1», «Товар 2», ...), различные названия обходятся в отсортированном
+    порядке как неявное префиксное дерево: строки Левенштейна для общего префикса считаются один раз,
+    а все названия с префиксом, уже отстоящим от запроса больше чем на k, пропускаются.
+
+    Индекс подписывается на добавление товаров в категории и на переименование товаров. Описание
+    индексируется при добавлении товара.
+    """
+
+    def __init__(self, categories: Iterable[Category] = (), n: int = 3) -> None:
+        """
+        Инициализирует индекс и добавляет в него товары категорий.
+
+        Args:
+            categories (Iterable[Category]): Категории для индексации.
+            n (int): Длина n-грамм для нечеткого поиска.
+        """
+        self.n = n
+        self._lock = threading.RLock()
+        self._ids: Dict[Product, int] = {}
+        self._products: List[Product] = []
+        self._names: List[str] = []
+        self._words: List[Set[str]] = []
+        self._tokens: Dict[str, Set[int]] = {}
+        self._grams: Dict[str, Set[int]] = {}
+        self._by_name: Dict[str, Set[int]] = {}
+        # Различные названия: отсортированные и еще не вставленные в порядок (сортируются при нечетком поиске).
+        self._sorted_names: List[str] = []
+        self._new_names: Set[str] = set()
+        # Товары ссылаются на индекс слабо: подписки не удерживают удаленный индекс в памяти.
+        self._product_listener = _WeakListener(self._on_product_changed)
+        for category in categories:
+            self.add_category(category)
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def add_category(self, category: Category) -> None:
+        """
+        Индексирует товары категории и подписывается на добавление новых.
+
+        Args:
+            category (Category): Категория товаров.
+        """
+        category.subscribe(self._on_product_added)
+        for prod in category:
+            if isinstance(prod, Product):
+                self.add(prod)
+
+    def _on_product_added(self, category: Category, prod: Product) -> None:
+        self.add(prod)
+
+    def add(self, prod: Product) -> None:
+        """
+        Добавляет товар в индекс. Повторное добавление того же объекта игнорируется.
+
+        Args:
+            prod (Product): Товар.
+        """
+        if prod in self._ids:
+            return
+        prod.subscribe(self._product_listener)
+        with self._lock:
+            if prod in self._ids:
+                return
+            pid = len(self._products)
+            self._ids[prod] = pid
+            self._products.append(prod)
+            self._names.append("")
+            self._words.append(set())
+            self._index(pid, prod.name, prod.description)
+
+    def _index(self, pid: int, name: str, description: str) -> None:
+        normalized = normalize(name)
+        words = set(tokenize(name)) | set(tokenize(description))
+        self._names[pid] = normalized
+        self._words[pid] = words
+        for word in words:
+            self._tokens.setdefault(word, set()).add(pid)
+        for gram in ngrams(normalized, self.n):
+            self._grams.setdefault(gram, set()).add(pid)
+        ids = self._by_name.get(normalized)
+        if ids is None:
+            ids = self._by_name[normalized] = set()
+            self._new_names.add(normalized)
+        ids.add(pid)
+
+    def _unindex(self, pid: int) -> None:
+        normalized = self._names[pid]
+        for word in self._words[pid]:
+            _discard(self._tokens, word, pid)
+        for gram in ngrams(normalized, self.n):
+            _discard(self._grams, gram, pid)
+        _discard(self._by_name, normalized, pid)
+        if normalized in self._by_name:
+            return
+        if normalized in self._new_names:
+            self._new_names.discard(normalized)
+        else:
+            del self._sorted_names[bisect_left(self._sorted_names, normalized)]
+
+    def _on_product_changed(self, prod: Product, field: str, old: Any, new: Any) -> None:
+        if field != "name":
+            return
+        with self._lock:
+            pid = self._ids.get(prod)
+            if pid is None:
+                return
+            self._unindex(pid)
+            self._index(pid, new, prod.description)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Product]:
+        """
+        Возвращает товары, в названии или описании которых есть все слова запроса (в порядке добавления).
+
+        Args:
+            query (str): Поисковый запрос.
+            limit (Optional[int]): Максимальное количество результатов.
+        """
+        words = set(tokenize(query))
+        if not words:
+            return []
+        with self._lock:
+            postings = sorted((self._tokens.get(word, set()) for word in words), key=len)
+            found = set(postings[0]).intersection(*postings[1:])
+            return [self._products[pid] for pid in sorted(found)[:limit]]
+
+    def fuzzy(self, query: str, max_distance: int = 2, limit: Optional[int] = 10) -> List[Tuple[Product, int]]:
+        """
+        Возвращает товары, название которых отличается от запроса не более чем на max_distance правок.
+
+        Args:
+            query (str): Название или его вариант с опечатками.
+            max_distance (int): Максимальное расстояние Левенштейна между нормализованными строками.
+            limit (Optional[int]): Максимальное количество результатов.
+
+        Returns:
+            List[Tuple[Product, int]]: Пары (товар, расстояние), от ближайших к дальним.
+        """
+        target = normalize(query)
+        with self._lock:
+            found = self._gram_matches(target, max_distance)
+            if found is None:
+                found = [
+                    (distance, pid)
+                    for distance, name in self._name_matches(target, max_distance)
+                    for pid in self._by_name[name]
+                ]
+            found.sort()
+            return [(self._products[pid], distance) for distance, pid in found[:limit]]
+
+    def _gram_matches(self, target: str, max_distance: int) -> Optional[List[Tuple[int, int]]]:
+        """
+        Ищет названия через индекс триграмм; возвращает None, если триграммы почти не сужают поиск.
+
+        Returns:
+            Optional[List[Tuple[int, int]]]: Пары (расстояние, номер товара) или None.
+        """
+        grams = sorted(ngrams(target, self.n), key=lambda g: len(self._grams.get(g, ())))
+        allowed_misses = self.n * max_distance
+        if len(grams) <= allowed_misses:
+            # Короткий запрос: общая триграмма не гарантирована.
+            return None
+        postings = [self._grams.get(gram, set()) for gram in grams]
+        if sum(len(ids) for ids in postings[: allowed_misses + 1]) * 8 > len(self._by_name):
+            return None
+        candidates: Set[int] = set()
+        for ids in postings[: allowed_misses + 1]:
+            candidates.update(ids)
+        # Фильтр по длине и по числу общих триграмм (не меньше len(grams) - n * k), затем Левенштейн.
+        lo, hi = len(target) - max_distance, len(target) + max_distance
+        names = self._names
+        found = []
+        for pid in candidates:
+            if not lo <= len(names[pid]) <= hi:
+                continue
+            misses = 0
+            for ids in postings:
+                if pid not in ids:
+                    misses += 1
+                    if misses > allowed_misses:
+                        break
+            else:
+                distance = levenshtein(target, names[pid], max_distance)
+                if distance <= max_distance:
+                    found.append((distance, pid))
+        return found
+
+    def _name_matches(self, target: str, max_distance: int) -> List[Tuple[int, str]]:
+        """
+        Обходит различные названия в отсортированном порядке и возвращает пары (расстояние, название).
+
+        Строка матрицы Левенштейна для префикса длины d хранится в rows[d] и переиспользуется следующим
+        названием с тем же префиксом; считаются только ячейки в полосе шириной 2 * max_distance + 1.
+        Если минимум строки больше max_distance, все названия с этим префиксом пропускаются.
+        """
+        names = self._ordered_names()
+        width = len(target)
+        cap = max_distance + 1
+        rows = [[min(j, cap) for j in range(width + 1)]]
+        previous = ""
+        found = []
+        i = 0
+        while i < len(names):
+            name = names[i]
+            depth = 0
+            shared = min(len(rows) - 1, len(name))
+            while depth < shared and name[depth] == previous[depth]:
+                depth += 1
+            del rows[depth + 1 :]
+            previous = name
+            alive = True
+            while depth < len(name):
+                char = name[depth]
+                above = rows[depth]
+                depth += 1
+                row = [cap] * (width + 1)
+                row[0] = best = min(depth, cap)
+                for j in range(max(1, depth - max_distance), min(width, depth + max_distance) + 1):
+                    value = above[j - 1] + (target[j - 1] != char)
+                    if above[j] < value:
+                        value = above[j] + 1
+                    if row[j - 1] < value:
+                        value = row[j - 1] + 1
+                    if value > cap:
+                        value = cap
+                    row[j] = value
+                    if value < best:
+                        best = value
+                rows.append(row)
+                if best > max_distance:
+                    alive = False
+                    break
+            if not alive:
+                prefix = name[:depth]
+                i = bisect_left(names, prefix[:-1] + chr(ord(prefix[-1]) + 1), i + 1)
+                continue
+            if rows[-1][width] <= max_distance:
+                found.append((rows[-1][width], name))
+            i += 1
+        return found
+
+    def _ordered_names(self) -> List[str]:
+        """Возвращает различные названия по возрастанию, вставляя добавленные после прошлого поиска."""
+        if self._new_names:
+            if len(self._new_names) < 16:
+                for name in self._new_names:
+                    insort(self._sorted_names, name)
+            else:
+                # Два отсортированных участка: timsort сливает их за линейное время.
+                self._sorted_names.extend(sorted(self._new_names))
+                self._sorted_names.sort()
+            self._new_names.clear()
+        return self._sorted_names
+
+    def likely_duplicates(self, prod: Any, max_distance: int = 2, limit: Optional[int] = 5) -> List[Product]:
+        """
+        Возвращает уже проиндексированные товары с почти таким же названием (вероятные дубликаты).
+
+        Подходит для проверки при импорте: "Samsung Galaxy C23 Ultra" найдет "Samsung Galaxy S23 Ultra".
+
+        Args:
+            prod (Any): Товар или название товара.
+            max_distance (int): Максимальное расстояние Левенштейна между названиями.
+            limit (Optional[int]): Максимальное количество результатов.
+
+        Returns:
+            List[Product]: Похожие товары (сам переданный товар исключается), от ближайших к дальним.
+        """
+        name = prod.name if isinstance(prod, Product) else str(prod)
+        matches = self.fuzzy(name, max_distance, None)
+        return [found for found, _ in matches if found is not prod][:limit]
+
+
+def _discard(index: Dict[Any, Set[int]], key: Any, pid: int) -> None:
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(pid)
+        if not ids:
+            del index[key]
@@ -0,0 +1,296 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.loader import stream_categories
+from src.model import Category, CategoryVersion, Product, ProductRegistry
+from src.repricing import ConfirmPolicy, PriceChange, RepricingResult, apply_changes, reject_decrease
+
+StockChange = Tuple[str, Optional[float], Optional[int]]
+Changes = Dict[str, List[Product]]
+
+
+class ProductRecord(NamedTuple):
+    """Неизменяемая копия полей товара в опубликованном снимке каталога."""
+
+    name: str
+    description: str
+    price: float
+    quantity: int
+    type_name: str
+
+
+class CategoryView(NamedTuple):
+    """
+    Неизменяемый снимок категории: поля категории, копии товаров и номер версии.
+
+    Копии товаров хранятся в CategoryVersion: снимки одной категории разделяют блоки с неизменившимися
+    товарами, поэтому публикация изменения копирует только блоки с измененными и добавленными товарами.
+    """
+
+    name: str
+    description: str
+    products: CategoryVersion
+    version: int
+
+
+def _record(prod: Product) -> ProductRecord:
+    return ProductRecord(prod.name, prod.description, prod.price, prod.quantity, type(prod).__name__)
+
+
+def _next_batch(iterator: Iterator[Category], size: int) -> List[Category]:
+    batch = []
+    for category in iterator:
+        batch.append(category)
+        if len(batch) >= size:
+            break
+    return batch
+
+
+class CatalogService:
+    """
+    Асинхронный фасад над Category и Product для asyncio-приложений.
+
+    Вся блокирующая работа (чтение и разбор файлов, массовые изменения товаров, поиск по каталогу)
+    выполняется в пуле потоков порциями, так что цикл событий не блокируется. Изменения выполняются
+    по одному писателю за раз (asyncio.Lock) и без input() и print(): понижение цены подтверждает политика.
+
+    Читатели работают с опубликованным снимком: словарем неизменяемых CategoryView. После каждой
+    порции изменений писатель публикует новый снимок затронутых категорий заменой ссылки, поэтому
+    читатель, взявший снимок, видит согласованное состояние и не ждет писателей.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, batch_size: int = 100) -> None:
+        """
+        Инициализирует пустой каталог.
+
+        Args:
+            executor (Optional[Executor]): Пул для блокирующей работы (по умолчанию пул цикла событий).
+            batch_size (int): Размер порции категорий при загрузке и записей при upsert.
+        """
+        self._executor = executor
+        self._batch_size = batch_size
+        self._categories: Dict[str, Category] = {}
+        self._registries: Dict[str, ProductRegistry] = {}
+        self._view: Dict[str, CategoryView] = {}
+        # Позиции товаров в записях опубликованных снимков категорий (для замены записей без перестроения).
+        self._positions: Dict[str, Dict[Product, int]] = {}
+        self._version = 0
+        self._write_lock = asyncio.Lock()
+
+    async def _run(self, func: Any, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def snapshot(self) -> Dict[str, CategoryView]:
+        """Возвращает текущий опубликованный снимок каталога (не изменяется после получения)."""
+        return self._view
+
+    def _build_view(self, changes: Changes, version: int) -> Dict[str, CategoryView]:
+        """
+        Строит новый снимок каталога. Для уже опубликованной категории заменяются только записи
+        затронутых товаров, новые товары добавляются в конец; остальные блоки записей разделяются
+        с предыдущим снимком. Новая категория строится целиком.
+        """
+        view = dict(self._view)
+        for name, touched in changes.items():
+            category = self._categories[name]
+            current = view.get(name)
+            positions = self._positions.setdefault(name, {})
+            if current is None:
+                products = [p for p in category.snapshot() if isinstance(p, Product)]
+                positions.clear()
+                positions.update((prod, index) for index, prod in enumerate(products))
+                records = CategoryVersion().extend([_record(p) for p in products], version)
+            else:
+                updates: Dict[int, ProductRecord] = {}
+                added: List[ProductRecord] = []
+                size = len(current.products)
+                for prod in dict.fromkeys(touched):
+                    index = positions.get(prod)
+                    if index is None:
+                        positions[prod] = size + len(added)
+                        added.append(_record(prod))
+                    else:
+                        updates[index] = _record(prod)
+                records = current.products.replace(updates, version)
+                if added:
+                    records = records.extend(added, version)
+            view[name] = CategoryView(name, category.description, records, version)
+        return view
+
+    async def _publish(self, changes: Changes) -> None:
+        """Строит новый снимок затронутых категорий в пуле потоков; в цикле событий только заменяется ссылка."""
+        version = self._version + 1
+        view: Dict[str, CategoryView] = await self._run(self._build_view, changes, version)
+        self._version = version
+        self._view = view
+
+    def _merge(self, category: Category, changes: Changes) -> None:
+        """
+        Вливает категорию в каталог: одноименные товары объединяются по правилам new_product.
+        Добавленные и обновленные товары записываются в changes.
+        """
+        touched = changes.setdefault(category.name, [])
+        existing = self._categories.get(category.name)
+        if existing is None:
+            self._categories[category.name] = category
+            self._registries[category.name] = ProductRegistry(p for p in category if isinstance(p, Product))
+            touched.extend(p for p in category if isinstance(p, Product))
+            return
+        registry = self._registries[category.name]
+        # Временная категория отписывается от товаров, иначе они продолжат обновлять ее агрегаты.
+        category.detach()
+        for prod in category:
+            if isinstance(prod, Product):
+                stored = registry.add(prod)
+                if stored is prod:
+                    existing.add_product(prod)
+                touched.append(stored)
+
+    def _merge_batch(self, batch: List[Category]) -> Changes:
+        changes: Changes = {}
+        for category in batch:
+            self._merge(category, changes)
+        return changes
+
+    async def load(self, file_path: str) -> int:
+        """
+        Загружает файл формата data/products.json.
+
+        Файл читается потоково в пуле потоков порциями по batch_size категорий; после каждой порции
+        категории публикуются, так что первые категории доступны до окончания загрузки.
+
+        Args:
+            file_path (str): Путь к JSON-файлу.
+
+        Returns:
+            int: Количество загруженных категорий.
+
+        Raises:
+            FileNotFoundError: Если файл не найден.
+            json.JSONDecodeError: Если данные некорректны.
+        """
+        iterator = stream_categories(file_path)
+        loaded = 0
+        while True:
+            batch: List[Category] = await self._run(_next_batch, iterator, self._batch_size)
+            if not batch:
+                return loaded
+            async with self._write_lock:
+                changes = await self._run(self._merge_batch, batch)
+                await self._publish(changes)
+            loaded += len(batch)
+
+    async def upsert(
+        self, category_name: str, records: Iterable[Dict[str, Any]], description: str = ""
+    ) -> List[ProductRecord]:
+        """
+        Создает или обновляет товары категории по правилам Product.new_product.
+
+        Записи обрабатываются порциями по batch_size в пуле потоков, снимок публикуется после каждой порции.
+
+        Args:
+            category_name (str): Название категории (создается при отсутствии).
+            records (Iterable[Dict[str, Any]]): Словари товаров.
+            description (str): Описание новой категории.
+
+        Returns:
+            List[ProductRecord]: Состояние затронутых товаров после изменения.
+
+        Raises:
+            ValueError: Если в записи отсутствуют обязательные ключи.
+        """
+        pending = list(records)
+        size = self._batch_size
+        batches = [pending[start : start + size] for start in range(0, len(pending), size)] or [[]]
+        result: List[ProductRecord] = []
+        for batch in batches:
+            async with self._write_lock:
+                touched, states = await self._run(self._upsert_batch, category_name, description, batch)
+                await self._publish({category_name: touched})
+                result.extend(states)
+        return result
+
+    def _upsert_batch(
+        self, category_name: str, description: str, batch: List[Dict[str, Any]]
+    ) -> Tuple[List[Product], List[ProductRecord]]:
+        if category_name not in self._categories:
+            self._merge(Category(category_name, description, []), {})
+        category = self._categories[category_name]
+        registry = self._registries[category_name]
+        touched = []
+        for record in batch:
+            known = len(registry)
+            prod = registry.upsert(record)
+            if prod is None:
+                continue
+            if len(registry) > known:
+                category.add_product(prod)
+            touched.append(prod)
+        return touched, [_record(p) for p in touched]
+
+    async def update_stock(
+        self, category_name: str, changes: Iterable[StockChange], policy: ConfirmPolicy = reject_decrease
+    ) -> RepricingResult:
+        """
+        Изменяет цены и количество товаров категории через src.repricing.apply_changes.
+
+        Args:
+            category_name (str): Название категории.
+            changes (Iterable[StockChange]): Кортежи (название товара, новая цена или None, новое количество или None).
+            policy (ConfirmPolicy): Политика подтверждения понижения цены.
+
+        Returns:
+            RepricingResult: Примененные и отклоненные изменения.
+
+        Raises:
+            KeyError: Если категории или товара нет в каталоге.
+        """
+        async with self._write_lock:
+            registry = self._registries[category_name]
+            price_changes = []
+            for name, price, quantity in changes:
+                prod = registry.get(name)
+                if prod is None:
+                    raise KeyError(name)
+                price_changes.append(PriceChange(prod, price, quantity))
+            result: RepricingResult = await self._run(apply_changes, price_changes, policy)
+            await self._publish({category_name: [change.product for change in price_changes]})
+        return result
+
+    async def get_category(self, name: str) -> Optional[CategoryView]:
+        """Возвращает снимок категории или None."""
+        return self._view.get(name)
+
+    async def category_names(self) -> List[str]:
+        """Возвращает названия категорий опубликованного снимка."""
+        return list(self._view)
+
+    async def find(
+        self, min_price: Optional[float] = None, max_price: Optional[float] = None, in_stock: bool = False
+    ) -> List[Tuple[str, ProductRecord]]:
+        """
+        Ищет товары по опубликованному снимку; обход каталога выполняется в пуле потоков.
+
+        Args:
+            min_price (Optional[float]): Нижняя граница цены.
+            max_price (Optional[float]): Верхняя граница цены.
+            in_stock (bool): Только товары с ненулевым остатком.
+
+        Returns:
+            List[Tuple[str, ProductRecord]]: Пары (название категории, товар).
+        """
+        view = self._view
+
+        def scan() -> List[Tuple[str, ProductRecord]]:
+            return [
+                (name, record)
+                for name, category in view.items()
+                for record in category.products
+                if (min_price is None or record.price >= min_price)
+                and (max_price is None or record.price <= max_price)
+                and (not in_stock or record.quantity > 0)
+            ]
+
+        result: List[Tuple[str, ProductRecord]] = await self._run(scan)
+        return result
@@ -0,0 +1,276 @@
+import multiprocessing
+import os
+import zlib
+from decimal import Decimal
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from src.exporter import product_record
+from src.model import Category, Product, ProductRegistry
+from src.valuation import Amount, Valuation, value_catalog
+
+ProductData = Union[Product, Dict[str, Any]]
+
+
+class _Shard:
+    """Часть каталога в процессе-исполнителе: категории с товарами этого шарда."""
+
+    def __init__(self) -> None:
+        self.categories: Dict[str, Category] = {}
+        self.registries: Dict[str, ProductRegistry] = {}
+
+    def add_products(self, category_name: str, description: str, records: List[Dict[str, Any]]) -> int:
+        category = self.categories.get(category_name)
+        if category is None:
+            category = self.categories[category_name] = Category(category_name, description, [])
+            self.registries[category_name] = ProductRegistry()
+        registry = self.registries[category_name]
+        added = 0
+        for record in records:
+            cls, params = Product.split_type(record)
+            known = len(registry)
+            prod = registry.upsert(params, cls)
+            if prod is not None and len(registry) > known:
+                category.add_product(prod)
+                added += 1
+        return added
+
+    def get(self, category_name: str, name: str) -> Optional[Dict[str, Any]]:
+        registry = self.registries.get(category_name)
+        prod = registry.get(name) if registry is not None else None
+        return product_record(prod) if prod is not None else None
+
+    def products(self, category_name: str) -> List[Dict[str, Any]]:
+        category = self.categories.get(category_name)
+        if category is None:
+            return []
+        return [product_record(p) for p in category if isinstance(p, Product)]
+
+    def value(self, exact: bool) -> Valuation:
+        return value_catalog(self.categories.values(), exact)
+
+    def product_count(self) -> int:
+        # Счетчики Category в процессе-исполнителе учитывают только товары этого шарда.
+        return Category.product_count
+
+
+def _serve(conn: Connection) -> None:
+    """Цикл процесса-исполнителя: выполняет команды координатора до команды stop."""
+    # При запуске через fork процесс наследует значения счетчиков Category координатора.
+    Category.category_count = 0
+    Category.product_count = 0
+    shard = _Shard()
+    while True:
+        command, args = conn.recv()
+        if command == "stop":
+            conn.close()
+            return
+        try:
+            conn.send((True, getattr(shard, command)(*args)))
+        except Exception as exc:
+            conn.send((False, exc))
+
+
+class ShardedCatalog:
+    """
+    Каталог, разделенный между несколькими локальными процессами (шардами) с координатором.
+
+    Товар хранится в шарде zlib.crc32("категория\\0название") % shards, поэтому большие категории
+    распределяются по всем шардам, а одноименные товары категории попадают в один шард и объединяются
+    по правилам Product.new_product. Координатор (этот объект) отправляет команды шардам через каналы
+    multiprocessing и объединяет результаты: состав категорий, поиск товаров и оценку стоимости.
+    Пакетные команды рассылаются всем шардам до ожидания ответов, так что шарды работают параллельно.
+
+    Между процессами передаются словари товаров с полем "type" (src.exporter.product_record), объекты
+    Product создаются заново на стороне получателя.
+
+    Атрибуты:
+        shards (int): Количество шардов.
+    """
+
+    def __init__(self, shards: Optional[int] = None, start_method: Optional[str] = None) -> None:
+        """
+        Запускает процессы шардов.
+
+        Args:
+            shards (Optional[int]): Количество шардов (по умолчанию число процессоров).
+            start_method (Optional[str]): Способ запуска процессов multiprocessing ("fork", "spawn", ...).
+
+        Raises:
+            ValueError: Если shards меньше 1.
+        """
+        if shards is None:
+            shards = os.cpu_count() or 1
+        if shards < 1:
+            raise ValueError("Количество шардов должно быть не меньше 1")
+        self.shards = shards
+        # get_context объявлен как возвращающий BaseContext, у которого в stubs нет Process.
+        context: Any = multiprocessing.get_context(start_method)
+        self._descriptions: Dict[str, str] = {}
+        self._connections: List[Connection] = []
+        self._processes: List[Any] = []
+        for _ in range(self.shards):
+            parent, child = context.Pipe()
+            process = context.Process(target=_serve, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def shard_of(self, category_name: str, product_name: str) -> int:
+        """Возвращает номер шарда, в котором хранится товар категории."""
+        return zlib.crc32(f"{category_name}\0{product_name}".encode("utf-8")) % self.shards
+
+    def _send(self, shard: int, command: str, *args: Any) -> None:
+        self._connections[shard].send((command, args))
+
+    def _receive(self, shard: int) -> Any:
+        ok, result = self._connections[shard].recv()
+        if not ok:
+            raise result
+        return result
+
+    def _broadcast(self, command: str, *args: Any) -> List[Any]:
+        for shard in range(self.shards):
+            self._send(shard, command, *args)
+        return [self._receive(shard) for shard in range(self.shards)]
+
+    def add_category(self, name: str, description: str = "") -> None:
+        """
+        Регистрирует категорию (без товаров).
+
+        Args:
+            name (str): Название категории.
+            description (str): Описание категории.
+        """
+        self._descriptions.setdefault(name, description)
+
+    def add_products(self, category_name: str, products: Iterable[ProductData]) -> int:
+        """
+        Добавляет товары в категорию, распределяя их по шардам.
+
+        Args:
+            category_name (str): Название категории (создается при отсутствии).
+            products (Iterable[ProductData]): Объекты Product или словари товаров (с необязательным полем "type").
+
+        Returns:
+            int: Количество новых товаров (без объединенных с дубликатами и не прошедших проверку).
+
+        Raises:
+            ValueError: Если у товара отсутствуют обязательные ключи или тип товара неизвестен.
+        """
+        description = self._descriptions.setdefault(category_name, "")
+        batches: Dict[int, List[Dict[str, Any]]] = {}
+        for prod in products:
+            record = product_record(prod) if isinstance(prod, Product) else prod
+            if "name" not in record:
+                raise ValueError("Отсутствуют обязательные ключи")
+            batches.setdefault(self.shard_of(category_name, record["name"]), []).append(record)
+        for shard, records in batches.items():
+            self._send(shard, "add_products", category_name, description, records)
+        added = 0
+        errors = []
+        for shard in batches:
+            try:
+                added += self._receive(shard)
+            except Exception as exc:
+                errors.append(exc)
+        if errors:
+            raise errors[0]
+        return added
+
+    def add_product(self, category_name: str, prod: ProductData) -> None:
+        """
+        Добавляет один товар в категорию.
+
+        Raises:
+            ValueError: Если у товара отсутствуют обязательные ключи или тип товара неизвестен.
+        """
+        self.add_products(category_name, [prod])
+
+    def load(self, categories: Iterable[Category]) -> int:
+        """
+        Добавляет в каталог категории с товарами.
+
+        Returns:
+            int: Количество новых товаров.
+        """
+        added = 0
+        for category in categories:
+            self.add_category(category.name, category.description)
+            added += self.add_products(category.name, (p for p in category if isinstance(p, Product)))
+        return added
+
+    def get(self, category_name: str, name: str) -> Optional[Product]:
+        """Возвращает копию товара категории по названию или None."""
+        shard = self.shard_of(category_name, name)
+        self._send(shard, "get", category_name, name)
+        record = self._receive(shard)
+        if record is None:
+            return None
+        cls, params = Product.split_type(record)
+        return cls(**params)
+
+    def category(self, name: str) -> Optional[Category]:
+        """
+        Собирает категорию со всех шардов (копии товаров в порядке шардов) или возвращает None.
+        """
+        if name not in self._descriptions:
+            return None
+        products = []
+        for records in self._broadcast("products", name):
+            for record in records:
+                cls, params = Product.split_type(record)
+                products.append(cls(**params))
+        return Category(name, self._descriptions[name], products)
+
+    def category_names(self) -> List[str]:
+        """Возвращает названия категорий в порядке добавления."""
+        return list(self._descriptions)
+
+    @property
+    def category_count(self) -> int:
+        """Количество категорий каталога."""
+        return len(self._descriptions)
+
+    @property
+    def product_count(self) -> int:
+        """Количество товаров во всех шардах."""
+        return sum(self._broadcast("product_count"))
+
+    def value(self, exact: bool = False) -> Valuation:
+        """
+        Оценивает каталог (см. src.valuation.value_catalog): шарды считают свои части параллельно,
+        координатор складывает итоги по категориям и классам товаров.
+
+        Args:
+            exact (bool): Считать в целых копейках; суммы возвращаются как Decimal.
+        """
+        zero: Amount = Decimal(0) if exact else 0.0
+        merged = Valuation(zero)
+        for part in self._broadcast("value", exact):
+            merged.total += part.total  # type: ignore[operator]
+            merged.quantity += part.quantity
+            for target, source in ((merged.by_category, part.by_category), (merged.by_type, part.by_type)):
+                for key, amount in source.items():
+                    target[key] = target.get(key, zero) + amount  # type: ignore[operator]
+        return merged
+
+    def close(self) -> None:
+        """Останавливает процессы шардов."""
+        for connection in self._connections:
+            try:
+                connection.send(("stop", ()))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    def __enter__(self) -> "ShardedCatalog":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
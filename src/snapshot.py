@@ -0,0 +1,290 @@
+import json
+import math
+import mmap
+import operator
+import struct
+import sys
+from array import array
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.loader import iter_events
+from src.model import Category, Product, ProductRegistry
+
+MAGIC = b"CSNP"
+VERSION = 1
+
+# magic, версия, порядок байт (0 — little, 1 — big), число строк, категорий, товаров, размер блока строк.
+_HEADER = struct.Struct("<4sHHQQQQ")
+_BYTEORDER = 0 if sys.byteorder == "little" else 1
+
+# Колонки файла в порядке записи: (имя, typecode array, число элементов как функция от (строк, категорий, товаров)).
+_COLUMNS: List[Tuple[str, str, Any]] = [
+    ("string_offsets", "Q", lambda s, c, p: s + 1),
+    ("category_names", "I", lambda s, c, p: c),
+    ("category_descriptions", "I", lambda s, c, p: c),
+    ("category_starts", "Q", lambda s, c, p: c + 1),
+    ("prices", "d", lambda s, c, p: p),
+    ("quantities", "q", lambda s, c, p: p),
+    ("names", "I", lambda s, c, p: p),
+    ("descriptions", "I", lambda s, c, p: p),
+    ("types", "I", lambda s, c, p: p),
+    ("extras", "I", lambda s, c, p: p),
+]
+
+
+def _padding(size: int) -> int:
+    return -size % 8
+
+
+class SnapshotWriter:
+    """
+    Построитель бинарного снимка каталога.
+
+    Формат: заголовок, затем колонки фиксированной ширины (выравнены по 8 байт) и таблица строк UTF-8.
+    Повторяющиеся строки (названия типов, цвета, страны) хранятся в таблице один раз.
+    Атрибуты наследников Product сохраняются как JSON-строка в таблице строк.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустой снимок."""
+        self._strings: Dict[str, int] = {}
+        self._blob = bytearray()
+        self._columns: Dict[str, array] = {name: array(code) for name, code, _ in _COLUMNS}
+        self._columns["string_offsets"].append(0)
+        self._columns["category_starts"].append(0)
+        self._intern("")
+
+    def _intern(self, value: str) -> int:
+        index = self._strings.get(value)
+        if index is None:
+            index = len(self._strings)
+            self._strings[value] = index
+            self._blob += value.encode("utf-8")
+            self._columns["string_offsets"].append(len(self._blob))
+        return index
+
+    def add_category(self, name: str, description: str, products: Iterable[Product]) -> None:
+        """
+        Добавляет категорию с товарами. Элементы, не являющиеся Product, пропускаются.
+
+        Args:
+            name (str): Название категории.
+            description (str): Описание категории.
+            products (Iterable[Product]): Товары категории.
+        """
+        columns = self._columns
+        columns["category_names"].append(self._intern(name))
+        columns["category_descriptions"].append(self._intern(description))
+        for prod in products:
+            if not isinstance(prod, Product):
+                continue
+            data = prod.to_dict()
+            columns["prices"].append(data.pop("price"))
+            columns["quantities"].append(data.pop("quantity"))
+            columns["names"].append(self._intern(data.pop("name")))
+            columns["descriptions"].append(self._intern(data.pop("description")))
+            columns["types"].append(self._intern(type(prod).__name__))
+            columns["extras"].append(self._intern(json.dumps(data, ensure_ascii=False)) if data else 0)
+        columns["category_starts"].append(len(columns["prices"]))
+
+    def write(self, file_path: str) -> None:
+        """
+        Записывает снимок в файл.
+
+        Args:
+            file_path (str): Путь к файлу снимка.
+        """
+        counts = (len(self._strings), len(self._columns["category_names"]), len(self._columns["prices"]))
+        with open(file_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, _BYTEORDER, *counts, len(self._blob)))
+            f.write(b"\0" * _padding(_HEADER.size))
+            for name, _, _ in _COLUMNS:
+                _write_column(f, self._columns[name])
+            f.write(self._blob)
+
+
+def _write_column(f: IO[bytes], column: array) -> None:
+    column.tofile(f)
+    f.write(b"\0" * _padding(len(column) * column.itemsize))
+
+
+def write_snapshot(categories: Iterable[Category], file_path: str) -> None:
+    """
+    Записывает категории в бинарный снимок.
+
+    Args:
+        categories (Iterable[Category]): Категории с товарами.
+        file_path (str): Путь к файлу снимка.
+    """
+    writer = SnapshotWriter()
+    for category in categories:
+        writer.add_category(category.name, category.description, category)
+    writer.write(file_path)
+
+
+def convert_json(json_path: str, snapshot_path: str) -> None:
+    """
+    Преобразует файл формата data/products.json в бинарный снимок, читая JSON потоково.
+
+    Дубликаты внутри категории объединяются по правилам Product.new_product, как в src.loader.
+
+    Args:
+        json_path (str): Путь к JSON-файлу.
+        snapshot_path (str): Путь к файлу снимка.
+
+    Raises:
+        FileNotFoundError: Если JSON-файл не найден.
+        json.JSONDecodeError: Если данные некорректны.
+        ValueError: Если у товара отсутствуют обязательные ключи.
+    """
+    writer = SnapshotWriter()
+    registry = ProductRegistry()
+    for kind, payload in iter_events(json_path):
+        if kind == "product":
+            cls, params = Product.split_type(payload)
+            registry.upsert(params, cls)
+        else:
+            writer.add_category(payload.get("name", ""), payload.get("description", ""), registry)
+            registry = ProductRegistry()
+    writer.write(snapshot_path)
+
+
+class CatalogSnapshot:
+    """
+    Каталог, загруженный из бинарного снимка через mmap.
+
+    Числовые колонки доступны как memoryview поверх отображенного файла без копирования и разбора,
+    строки декодируются только при обращении. Объекты Product и Category создаются по требованию.
+
+    Атрибуты:
+        prices (memoryview): Цены товаров.
+        quantities (memoryview): Количество товаров.
+        category_starts (memoryview): Индекс первого товара каждой категории (и общее число товаров в конце).
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Открывает снимок.
+
+        Args:
+            file_path (str): Путь к файлу снимка.
+
+        Raises:
+            ValueError: Если файл не является снимком каталога или записан с другим порядком байт.
+        """
+        with open(file_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._views: List[memoryview] = []
+            self._open()
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self) -> None:
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError("Файл не является снимком каталога")
+        magic, version, byteorder, n_strings, n_categories, n_products, blob_size = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Файл не является снимком каталога поддерживаемой версии")
+        if byteorder != _BYTEORDER:
+            raise ValueError("Снимок записан с другим порядком байт")
+        base = memoryview(self._mmap)
+        self._views.append(base)
+        offset = _HEADER.size + _padding(_HEADER.size)
+        columns: Dict[str, memoryview] = {}
+        for name, code, count in _COLUMNS:
+            size = count(n_strings, n_categories, n_products) * array(code).itemsize
+            # Код типа колонки известен только во время выполнения, а stubs memoryview.cast требуют Literal.
+            view = base[offset : offset + size].cast(code)  # type: ignore[call-overload]
+            self._views.append(view)
+            columns[name] = view
+            offset += size + _padding(size)
+        self._blob = base[offset : offset + blob_size]
+        self._views.append(self._blob)
+        self._offsets = columns["string_offsets"]
+        self._category_names = columns["category_names"]
+        self._category_descriptions = columns["category_descriptions"]
+        self._names = columns["names"]
+        self._descriptions = columns["descriptions"]
+        self._types = columns["types"]
+        self._extras = columns["extras"]
+        self.category_starts = columns["category_starts"]
+        self.prices = columns["prices"]
+        self.quantities = columns["quantities"]
+
+    def close(self) -> None:
+        """Освобождает отображение файла. Созданные ранее объекты Product и Category остаются рабочими."""
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> "CatalogSnapshot":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def string(self, index: int) -> str:
+        """Возвращает строку из таблицы строк по индексу."""
+        return str(self._blob[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+
+    @property
+    def category_count(self) -> int:
+        """Возвращает количество категорий в снимке."""
+        return len(self._category_names)
+
+    def category_names(self) -> List[str]:
+        """Возвращает названия категорий."""
+        return [self.string(i) for i in self._category_names]
+
+    def find_category(self, name: str) -> Optional[int]:
+        """Возвращает индекс категории по названию или None."""
+        for i, string_index in enumerate(self._category_names):
+            if self.string(string_index) == name:
+                return i
+        return None
+
+    def product(self, index: int) -> Product:
+        """
+        Создает объект продукта по индексу строки.
+
+        Raises:
+            ValueError: Если класс товара из снимка не зарегистрирован.
+        """
+        params: Dict[str, Any] = {
+            "name": self.string(self._names[index]),
+            "description": self.string(self._descriptions[index]),
+            "price": self.prices[index],
+            "quantity": self.quantities[index],
+        }
+        extra = self._extras[index]
+        if extra:
+            params.update(json.loads(self.string(extra)))
+        return Product.type_for(self.string(self._types[index]))(**params)
+
+    def products_of(self, category_index: int) -> Iterator[Product]:
+        """Лениво создает объекты продуктов категории."""
+        for i in range(self.category_starts[category_index], self.category_starts[category_index + 1]):
+            yield self.product(i)
+
+    def category(self, index: int) -> Category:
+        """Создает объект Category с товарами по индексу категории."""
+        return Category(
+            self.string(self._category_names[index]),
+            self.string(self._category_descriptions[index]),
+            list(self.products_of(index)),
+        )
+
+    def total_value(self) -> float:
+        """Возвращает стоимость всех остатков, не создавая объектов Product."""
+        return math.fsum(map(operator.mul, self.prices, self.quantities))
+
+    def category_value(self, index: int) -> float:
+        """Возвращает стоимость остатков категории, не создавая объектов Product."""
+        start, end = self.category_starts[index], self.category_starts[index + 1]
+        return math.fsum(map(operator.mul, self.prices[start:end], self.quantities[start:end]))
@@ -0,0 +1,131 @@
+import math
+import operator
+from dataclasses import dataclass, field
+from decimal import ROUND_HALF_UP, Decimal
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Union
+
+from src.model import Category, Product
+
+Amount = Union[float, Decimal]
+
+_price = attrgetter("price")
+_quantity = attrgetter("quantity")
+
+
+@dataclass
+class Valuation:
+    """
+    Стоимость остатков каталога.
+
+    Атрибуты:
+        total (Amount): Стоимость всех товаров каталога.
+        by_category (Dict[str, Amount]): Стоимость по названиям категорий.
+        by_type (Dict[str, Amount]): Стоимость по именам классов товаров (Product, Smartphone, LawnGrass).
+        quantity (int): Суммарное количество единиц товара.
+    """
+
+    total: Amount
+    by_category: Dict[str, Amount] = field(default_factory=dict)
+    by_type: Dict[str, Amount] = field(default_factory=dict)
+    quantity: int = 0
+
+
+class _Kopecks:
+    """Перевод цен в целые копейки с кэшем по значению цены (цены в каталоге часто повторяются)."""
+
+    def __init__(self) -> None:
+        self._cache: Dict[float, int] = {}
+
+    def __call__(self, price: float) -> int:
+        kopecks = self._cache.get(price)
+        if kopecks is None:
+            # Цена берется в десятичной записи (repr), чтобы 1.005 округлялось до 101 копейки, а не до 100.
+            kopecks = int(Decimal(repr(price)).scaleb(2).quantize(Decimal(1), ROUND_HALF_UP))
+            self._cache[price] = kopecks
+        return kopecks
+
+
+def _value(prices: Sequence[float], quantities: Sequence[int], kopecks: Optional[_Kopecks]) -> Amount:
+    """Стоимость по колонкам цен и количеств: fsum в float или точная сумма в копейках."""
+    if kopecks is None:
+        return math.fsum(map(operator.mul, prices, quantities))
+    return Decimal(sum(map(operator.mul, map(kopecks, prices), quantities))).scaleb(-2)
+
+
+def _products(category: Category, same_class: bool) -> List[Product]:
+    products = [p for p in category.snapshot() if isinstance(p, Product)]
+    if same_class and len({type(p) for p in products}) > 1:
+        raise TypeError(f"В категории {category.name} товары разных классов")
+    return products
+
+
+def category_value(category: Category, exact: bool = False, same_class: bool = False) -> Amount:
+    """
+    Возвращает стоимость остатков категории (цена * количество) одним проходом по ее версии состава.
+
+    Args:
+        category (Category): Категория.
+        exact (bool): Считать в целых копейках и вернуть Decimal (для бухгалтерии) вместо float.
+        same_class (bool): Требовать, чтобы все товары категории были одного класса (как в Product.__add__).
+
+    Returns:
+        Amount: Стоимость остатков.
+
+    Raises:
+        TypeError: Если same_class=True и в категории есть товары разных классов.
+    """
+    products = _products(category, same_class)
+    return _value(list(map(_price, products)), list(map(_quantity, products)), _Kopecks() if exact else None)
+
+
+def value_catalog(categories: Iterable[Category], exact: bool = False, same_class: bool = False) -> Valuation:
+    """
+    Оценивает каталог: общая стоимость, стоимость по категориям и по классам товаров.
+
+    Цены и количества собираются в колонки за один проход по категориям, суммы считаются на уровне C
+    (map и fsum, либо целочисленная сумма в копейках при exact=True). Товар, входящий в несколько категорий,
+    учитывается в каждой из них, но в общей стоимости и по классам — один раз.
+
+    Args:
+        categories (Iterable[Category]): Категории каталога.
+        exact (bool): Считать в целых копейках; все суммы возвращаются как Decimal.
+        same_class (bool): Требовать, чтобы товары каждой категории были одного класса.
+
+    Returns:
+        Valuation: Результат оценки.
+
+    Raises:
+        TypeError: Если same_class=True и в категории есть товары разных классов.
+    """
+    kopecks = _Kopecks() if exact else None
+    zero: Amount = Decimal(0) if exact else 0.0
+    seen: Set[int] = set()
+    by_category: Dict[str, Amount] = {}
+    type_prices: Dict[str, List[float]] = {}
+    type_quantities: Dict[str, List[int]] = {}
+    for category in categories:
+        products = _products(category, same_class)
+        prices = list(map(_price, products))
+        quantities = list(map(_quantity, products))
+        value = _value(prices, quantities, kopecks)
+        # Все суммы одного вызова одного типа (float или Decimal), mypy не выводит это из Union.
+        by_category[category.name] = by_category.get(category.name, zero) + value  # type: ignore[operator]
+        for prod, price, quantity in zip(products, prices, quantities):
+            if id(prod) in seen:
+                continue
+            seen.add(id(prod))
+            type_name = type(prod).__name__
+            if type_name not in type_prices:
+                type_prices[type_name] = []
+                type_quantities[type_name] = []
+            type_prices[type_name].append(price)
+            type_quantities[type_name].append(quantity)
+    by_type = {name: _value(prices, type_quantities[name], kopecks) for name, prices in type_prices.items()}
+    total: Amount
+    if exact:
+        total = sum(by_type.values(), Decimal(0))
+    else:
+        total = math.fsum(by_type.values())  # type: ignore[arg-type]
+    quantity = sum(sum(quantities) for quantities in type_quantities.values())
+    return Valuation(total, by_category, by_type, quantity)
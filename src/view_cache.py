@@ -0,0 +1,318 @@
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
+
+from src.model import Category, Product, _WeakListener
+
+ViewBuilder = Callable[..., Any]
+ChangeFilter = Callable[[str, Any, Any], bool]
+ViewKey = Tuple[Category, str, Tuple[Tuple[str, Hashable], ...]]
+
+ALL_FIELDS: FrozenSet[str] = frozenset({"name", "price", "quantity"})
+
+
+def by_price(category: Category, descending: bool = False) -> List[Product]:
+    """Товары категории, упорядоченные по цене."""
+    products = [p for p in category.snapshot() if isinstance(p, Product)]
+    products.sort(key=lambda p: p.price, reverse=descending)
+    return products
+
+
+def in_stock(category: Category) -> List[Product]:
+    """Товары категории с ненулевым остатком."""
+    return [p for p in category.snapshot() if isinstance(p, Product) and p.quantity > 0]
+
+
+def stock_changed(field: str, old: Any, new: Any) -> bool:
+    """Изменение товара влияет на in_stock, только если остаток становится нулевым или перестает им быть."""
+    return bool((old > 0) != (new > 0))
+
+
+def page_lines(category: Category, page: int = 1, per_page: int = 50) -> List[str]:
+    """Строки одной страницы Category.products (см. Category.products_page)."""
+    return category.products_page(page, per_page)
+
+
+@dataclass
+class CacheStats:
+    """
+    Статистика кэша представлений.
+
+    Атрибуты:
+        hits (int): Обращения, обслуженные из кэша.
+        misses (int): Обращения, потребовавшие построения представления.
+        evictions (int): Записи, вытесненные из-за ограничения памяти.
+        invalidations (int): Записи, сброшенные из-за изменения категории или товара.
+        entries (int): Текущее число записей.
+        size_bytes (int): Оценка памяти, занятой записями.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Доля обращений, обслуженных из кэша."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _sizeof(value: Any) -> int:
+    """
+    Оценивает память, занятую представлением.
+
+    Учитываются контейнер и принадлежащие ему строки; объекты Product принадлежат каталогу
+    и считаются только ссылками внутри контейнера.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        size += sum(sys.getsizeof(item) for item in value if isinstance(item, str))
+    return size
+
+
+class _CategoryState:
+    """Записи категории, отслеживаемые товары, поколение (число сбросов) и число идущих построений."""
+
+    __slots__ = ("keys", "products", "generation", "builds")
+
+    def __init__(self) -> None:
+        self.keys: Set[ViewKey] = set()
+        self.products: Set[Product] = set()
+        self.generation = 0
+        self.builds = 0
+
+
+class ViewCache:
+    """
+    Кэш производных представлений категорий (сортировки, фильтры, страницы products) с вытеснением LRU.
+
+    Ключ записи — категория, имя представления и его параметры. Суммарный размер записей ограничен
+    max_bytes: при превышении вытесняются давно не использованные записи. Представление, которое само
+    больше бюджета, возвращается без сохранения.
+
+    Кэш подписывается на категории, для которых хранит записи, и на их товары. add_product сбрасывает
+    все представления категории, а изменение товара — только представления, зависящие от измененного
+    поля (fields при регистрации), во всех категориях, где есть этот товар. Представление, во время
+    построения которого изменилась его категория или ее товар, не сохраняется; изменения других
+    категорий на него не влияют.
+
+    Когда у категории не остается записей и построений (сброс, вытеснение, clear), кэш отписывается
+    от нее и ее товаров и больше на них не ссылается. Товары ссылаются на кэш слабо.
+
+    Встроенные представления: "by_price" (descending), "in_stock", "page" (page, per_page).
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Инициализирует пустой кэш.
+
+        Args:
+            max_bytes (int): Бюджет памяти на записи кэша в байтах.
+
+        Raises:
+            ValueError: Если max_bytes меньше 1.
+        """
+        if max_bytes < 1:
+            raise ValueError("Бюджет памяти кэша должен быть положительным")
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._views: Dict[str, Tuple[ViewBuilder, FrozenSet[str], Optional[ChangeFilter]]] = {}
+        self._entries: "OrderedDict[ViewKey, Tuple[Any, int]]" = OrderedDict()
+        self._states: Dict[Category, _CategoryState] = {}
+        self._memberships: Dict[Product, Set[Category]] = {}
+        # Категории без записей и построений; отписка от них выполняется вне блокировки кэша (_release).
+        self._idle: Set[Category] = set()
+        self._stats = CacheStats()
+        self._product_listener = _WeakListener(self._on_product_changed)
+        self.register("by_price", by_price, {"price"})
+        self.register("in_stock", in_stock, {"quantity"}, stock_changed)
+        self.register("page", page_lines, ALL_FIELDS)
+
+    def register(
+        self,
+        name: str,
+        builder: ViewBuilder,
+        fields: Iterable[str] = ALL_FIELDS,
+        changed: Optional[ChangeFilter] = None,
+    ) -> None:
+        """
+        Регистрирует представление.
+
+        Args:
+            name (str): Имя представления.
+            builder (ViewBuilder): Функция builder(category, **params), строящая представление.
+            fields (Iterable[str]): Поля товара ("name", "price", "quantity"), при изменении которых
+                представление устаревает.
+            changed (Optional[ChangeFilter]): Уточняющая проверка changed(field, old, new): представление
+                сбрасывается, только если она возвращает True.
+        """
+        self._views[name] = (builder, frozenset(fields), changed)
+
+    def get(self, category: Category, view: str, **params: Hashable) -> Any:
+        """
+        Возвращает представление категории из кэша или строит его.
+
+        Args:
+            category (Category): Категория.
+            view (str): Имя зарегистрированного представления.
+            **params (Hashable): Параметры представления.
+
+        Raises:
+            ValueError: Если представление не зарегистрировано.
+        """
+        if view not in self._views:
+            raise ValueError(f"Неизвестное представление: {view}")
+        key: ViewKey = (category, view, tuple(sorted(params.items())))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry[0]
+            self._stats.misses += 1
+            state = self._states.get(category)
+            watch = state is None
+            if state is None:
+                state = self._states[category] = _CategoryState()
+            state.builds += 1
+            generation = state.generation
+        # Представление строится вне блокировки кэша: построение берет блокировки категории и товаров.
+        try:
+            if watch:
+                self._watch(category)
+            value = self._views[view][0](category, **params)
+        except BaseException:
+            with self._lock:
+                self._finish(category, state)
+            self._release()
+            raise
+        size = _sizeof(value)
+        with self._lock:
+            # Если за время построения категория или ее товар изменились, результат мог устареть и не сохраняется.
+            if size <= self.max_bytes and generation == state.generation and key not in self._entries:
+                self._entries[key] = (value, size)
+                state.keys.add(key)
+                self._stats.size_bytes += size
+                self._evict()
+            self._finish(category, state)
+        self._release()
+        return value
+
+    @property
+    def stats(self) -> CacheStats:
+        """Возвращает копию статистики кэша."""
+        with self._lock:
+            return CacheStats(
+                self._stats.hits,
+                self._stats.misses,
+                self._stats.evictions,
+                self._stats.invalidations,
+                len(self._entries),
+                self._stats.size_bytes,
+            )
+
+    def invalidate(self, category: Category) -> None:
+        """Сбрасывает все представления категории."""
+        with self._lock:
+            state = self._states.get(category)
+            if state is None:
+                return
+            state.generation += 1
+            for key in list(state.keys):
+                self._drop(key)
+                self._stats.invalidations += 1
+        self._release()
+
+    def clear(self) -> None:
+        """Сбрасывает все записи (статистика обращений сохраняется)."""
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+        self._release()
+
+    def _evict(self) -> None:
+        while self._stats.size_bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def _drop(self, key: ViewKey) -> None:
+        _, size = self._entries.pop(key)
+        self._stats.size_bytes -= size
+        state = self._states[key[0]]
+        state.keys.discard(key)
+        if not state.keys and not state.builds:
+            self._idle.add(key[0])
+
+    def _finish(self, category: Category, state: _CategoryState) -> None:
+        state.builds -= 1
+        if not state.keys and not state.builds:
+            self._idle.add(category)
+
+    def _watch(self, category: Category) -> None:
+        category.subscribe(self._on_product_added)
+        self._track(category, category.snapshot())
+
+    def _track(self, category: Category, products: Iterable[Any]) -> None:
+        subscribe = []
+        with self._lock:
+            state = self._states.get(category)
+            if state is None:
+                return
+            for prod in products:
+                if not isinstance(prod, Product) or prod in state.products:
+                    continue
+                state.products.add(prod)
+                categories = self._memberships.get(prod)
+                if categories is None:
+                    categories = self._memberships[prod] = set()
+                    subscribe.append(prod)
+                categories.add(category)
+        # Подписка берет блокировку товара; под блокировкой кэша это нарушило бы порядок «товар, затем кэш».
+        for prod in subscribe:
+            prod.subscribe(self._product_listener)
+
+    def _release(self) -> None:
+        """Отписывается от категорий без записей и построений и от товаров, не входящих в другие категории."""
+        categories = []
+        products = []
+        with self._lock:
+            while self._idle:
+                category = self._idle.pop()
+                state = self._states.get(category)
+                if state is None or state.keys or state.builds:
+                    continue
+                del self._states[category]
+                categories.append(category)
+                for prod in state.products:
+                    memberships = self._memberships[prod]
+                    memberships.discard(category)
+                    if not memberships:
+                        del self._memberships[prod]
+                        products.append(prod)
+        for category in categories:
+            category.unsubscribe(self._on_product_added)
+        for prod in products:
+            prod.unsubscribe(self._product_listener)
+
+    def _on_product_added(self, category: Category, prod: Product) -> None:
+        self._track(category, (prod,))
+        self.invalidate(category)
+
+    def _on_product_changed(self, prod: Product, field: str, old: Any, new: Any) -> None:
+        # Вызывается под блокировкой товара, поэтому отписка (_release) откладывается до следующего get,
+        # invalidate или clear: здесь она брала бы блокировки других товаров.
+        with self._lock:
+            for category in self._memberships.get(prod, ()):
+                state = self._states[category]
+                state.generation += 1
+                for key in list(state.keys):
+                    _, fields, changed = self._views[key[1]]
+                    if field in fields and (changed is None or changed(field, old, new)):
+                        self._drop(key)
+                        self._stats.invalidations += 1
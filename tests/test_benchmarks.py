@@ -0,0 +1,15 @@
+from benchmarks.model_bench import CASES, compare, run_suite
+
+
+def test_run_suite_small():
+    report = run_suite([20], repeat=1, memory=False)
+    assert set(report["results"]) == set(CASES)
+    for by_size in report["results"].values():
+        assert by_size["20"]["ops_per_sec"] > 0
+
+
+def test_compare_detects_regression():
+    baseline = {"results": {"iterator": {"1000": {"ops_per_sec": 100.0}}}}
+    current = {"results": {"iterator": {"1000": {"ops_per_sec": 70.0}}, "other": {"1000": {"ops_per_sec": 1.0}}}}
+    assert len(compare(current, baseline, threshold=0.2)) == 1
+    assert compare(current, baseline, threshold=0.5) == []
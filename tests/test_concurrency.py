@@ -0,0 +1,88 @@
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.concurrency import ShardedCounter, StripedLock
+from src.model import Category, Product, set_thread_safe
+
+THREADS = 8
+PER_THREAD = 2000
+
+
+@pytest.fixture
+def thread_safe():
+    set_thread_safe(True)
+    yield
+    set_thread_safe(False)
+
+
+def test_sharded_counter_under_contention():
+    counter = ShardedCounter(5)
+    barrier = threading.Barrier(THREADS)
+
+    def worker():
+        barrier.wait()
+        for _ in range(PER_THREAD):
+            counter.add()
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert counter.value == 5 + THREADS * PER_THREAD
+    counter.reset()
+    assert counter.value == 0
+
+
+def test_sharded_counter_retires_dead_threads():
+    counter = ShardedCounter()
+    counter.add()
+
+    def worker():
+        counter.add(2)
+
+    for _ in range(200):
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+    gc.collect()
+    assert counter.value == 1 + 200 * 2
+    assert len(counter._cells) == 1
+
+
+def test_striped_lock_is_stable():
+    locks = StripedLock(4)
+    obj = object()
+    assert locks.get(obj) is locks.get(obj)
+    with pytest.raises(ValueError):
+        StripedLock(0)
+
+
+def test_concurrent_add_product_and_setters(thread_safe):
+    categories = [Category(f"Cat{i}", "Desc", []) for i in range(3)]
+    shared = Product("Shared", "Desc", 1.0, 0)
+    categories[0].add_product(shared)
+    categories[1].add_product(shared)
+    before = Category.product_count
+    barrier = threading.Barrier(THREADS)
+
+    def worker(n):
+        barrier.wait()
+        for i in range(PER_THREAD):
+            categories[i % 3].add_product(Product(f"P{n}-{i}", "Desc", 2.0, 1))
+            shared.set_price(float(n + i + 1))
+            shared.set_quantity(n * i)
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        list(pool.map(worker, range(THREADS)))
+
+    assert Category.product_count - before == THREADS * PER_THREAD
+    assert sum(c.item_count for c in categories) == THREADS * PER_THREAD + 2
+    for category in categories:
+        products = [p for p in category]
+        assert category.total_quantity == sum(p.quantity for p in products)
+        assert category.stock_value == pytest.approx(sum(p.price * p.quantity for p in products))
+        assert category.max_price == max(p.price for p in products)
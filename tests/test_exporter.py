@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from src.exporter import export_json, export_jsonl
+from src.loader import stream_categories, stream_categories_jsonl
+from src.model import Category, LawnGrass, Product, Smartphone
+
+
+@pytest.fixture
+def categories():
+    phones = Category(
+        "Смартфоны",
+        "Описание \"в кавычках\"",
+        [Smartphone("Phone", "Desc", 100.0, 1, 90.0, "A1", 128, "Синий"), Product("Чехол", "Desc", 5.0, 3)],
+    )
+    garden = Category("Сад", "", [LawnGrass("Трава", "Desc", 1.5, 3, "Россия", "7 дней", "Зеленый")])
+    return [phones, Category("Пустая", "", []), garden]
+
+
+def records(categories):
+    return [(c.name, c.description, [(type(p), p.to_dict()) for p in c]) for c in categories]
+
+
+def test_export_json_round_trip(tmp_path, categories):
+    path = tmp_path / "catalog.json"
+    assert export_json(categories, str(path), chunk_size=1) == 3
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data[0]["products"][0]["type"] == "Smartphone"
+    assert data[1]["products"] == []
+    assert records(stream_categories(str(path))) == records(categories)
+
+
+def test_export_jsonl_round_trip(tmp_path, categories):
+    path = tmp_path / "catalog.jsonl"
+    assert export_jsonl(categories, str(path), chunk_size=1) == 3
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 6
+    assert records(stream_categories_jsonl(str(path))) == records(categories)
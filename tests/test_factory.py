@@ -0,0 +1,59 @@
+import gc
+
+import pytest
+
+from src.factory import ProductFactory, ProductSchema
+from src.model import LawnGrass, Product, ProductRegistry, Smartphone
+
+
+def test_schema_fields():
+    schema = ProductSchema(Smartphone)
+    assert schema.fields == ("name", "description", "price", "quantity", "efficiency", "model", "memory", "color")
+    with pytest.raises(TypeError):
+        ProductSchema(dict)  # type: ignore[arg-type]
+
+
+def test_build_many_dispatches_and_merges():
+    phone = Smartphone("Phone", "Desc", 100.0, 1, 90.0, "A1", 128, "Blue")
+    records = [
+        {"name": "Tea", "description": "Desc", "price": 5.0, "quantity": 2},
+        {"type": "Smartphone", **phone.to_dict()},
+        {"type": "LawnGrass", **LawnGrass("Grass", "Desc", 1.0, 3, "Россия", "7 дней", "Зеленый").to_dict()},
+        {"name": "Bad", "description": "Desc", "price": -1.0, "quantity": 1},
+        {"name": "Tea", "description": "Desc", "price": 7.0, "quantity": 1},
+    ]
+    registry = ProductRegistry()
+    built = ProductFactory().build_many(records, registry)
+    assert [type(p) for p in built] == [Product, Smartphone, LawnGrass, Product]
+    assert built[0] is built[3] and built[0].price == 7.0 and built[0].quantity == 3
+    assert built[1].to_dict() == phone.to_dict()
+    assert gc.isenabled()
+    assert len(registry) == 3
+
+    with pytest.raises(ValueError):
+        ProductFactory().build_many([{"name": "X"}])
+    with pytest.raises(ValueError):
+        ProductFactory().build({"type": "Unknown", "name": "X"})
+
+
+def test_build_rows():
+    factory = ProductFactory()
+    built = factory.build_rows([("A", "Desc", 1.0, 1), ("B", "Desc", 2.0, -1)])
+    assert [p.name for p in built] == ["A"]
+    with pytest.raises(ValueError):
+        factory.build_rows([("A", "Desc", 1.0)])
+
+
+def test_gc_pause_is_opt_in():
+    states = []
+
+    def records():
+        for i in range(2):
+            states.append(gc.isenabled())
+            yield {"name": f"P{i}", "description": "Desc", "price": 1.0, "quantity": 1}
+
+    factory = ProductFactory()
+    factory.build_many(records())
+    factory.build_many(records(), pause_gc=True)
+    assert states == [True, True, False, False]
+    assert gc.isenabled()
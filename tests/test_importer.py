@@ -0,0 +1,93 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.exporter import export_json
+from src.importer import import_catalogs, parse_file
+from src.model import Category, Product, Smartphone
+
+
+def _write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_text(data if isinstance(data, str) else json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def files(tmp_path):
+    first = _write(
+        tmp_path,
+        "a.json",
+        [
+            {
+                "name": "Смартфоны",
+                "description": "Телефоны",
+                "products": [{"name": "Iphone 15", "description": "512GB", "price": 210000.0, "quantity": 8}],
+            }
+        ],
+    )
+    second = _write(
+        tmp_path,
+        "b.json",
+        [
+            {
+                "name": "Смартфоны",
+                "description": "Телефоны",
+                "products": [
+                    {"name": "Iphone 15", "description": "512GB", "price": 220000.0, "quantity": 2},
+                    {"name": "Xiaomi", "description": "1024GB", "price": 31000.0, "quantity": 14},
+                ],
+            },
+            {"name": "Телевизоры", "description": "ТВ", "products": []},
+        ],
+    )
+    broken = _write(tmp_path, "broken.json", '[{"name": "Смартфоны", "products": [')
+    return [first, second, broken, str(tmp_path / "missing.json")]
+
+
+def test_parse_file_reports_errors(files):
+    path, parsed, error = parse_file(files[2])
+    assert path == files[2]
+    assert parsed == []
+    assert error.startswith("JSONDecodeError")
+
+
+def test_non_object_product_is_reported_per_file(tmp_path, files):
+    bad = _write(tmp_path, "strings.json", [{"name": "Разное", "description": "", "products": ["prod1"]}])
+    _, parsed, error = parse_file(bad)
+    assert parsed == [] and error.startswith("TypeError")
+    result = import_catalogs([files[0], bad], executor=ThreadPoolExecutor(2))
+    assert list(result.errors) == [bad]
+    assert result.imported_files == [files[0]]
+
+
+def test_parse_file_keeps_exported_types(tmp_path):
+    phone = Smartphone("Iphone 15", "512GB", 210000.0, 8, 98.2, "15", 512, "Gray space")
+    path = str(tmp_path / "export.json")
+    export_json([Category("Смартфоны", "Телефоны", [phone, Product("Чехол", "Силикон", 990.0, 30)])], path)
+    _, parsed, error = parse_file(path)
+    assert error is None
+    products = parsed[0][2]
+    assert [type(p) for p in products] == [Smartphone, Product]
+    assert products[0].to_dict() == phone.to_dict()
+
+
+def test_import_catalogs_merges_across_files(files):
+    result = import_catalogs(files, max_workers=2)
+    assert result.imported_files == files[:2]
+    assert set(result.errors) == set(files[2:])
+    assert "FileNotFoundError" in result.errors[files[3]]
+    categories = {c.name: c for c in result.categories}
+    assert set(categories) == {"Смартфоны", "Телевизоры"}
+    phones = {p.name: p for p in categories["Смартфоны"]}
+    assert phones["Iphone 15"].quantity == 10
+    assert phones["Iphone 15"].price == 220000.0
+    assert categories["Смартфоны"].stock_value == 220000.0 * 10 + 31000.0 * 14
+
+
+def test_import_catalogs_with_custom_executor(files):
+    with ThreadPoolExecutor(2) as pool:
+        result = import_catalogs(files[:2], executor=pool)
+    assert not result.errors
+    assert len(result.categories) == 2
@@ -0,0 +1,50 @@
+import pytest
+
+from src.instrumentation import Instrumentation
+from src.model import Category, LawnGrass, Product, ProductRegistry, Smartphone
+
+
+def test_disabled_leaves_model_untouched():
+    original = Category.__dict__["add_product"]
+    inst = Instrumentation()
+    with inst:
+        assert Category.__dict__["add_product"] is not original
+        assert inst.enabled
+    assert Category.__dict__["add_product"] is original
+    assert not inst.enabled
+
+
+def test_records_calls_and_items():
+    with Instrumentation() as inst:
+        registry = ProductRegistry()
+        registry.upsert({"name": "A", "description": "Desc", "price": 1.0, "quantity": 1})
+        phone = {"name": "S", "description": "D", "price": 1.0, "quantity": 1}
+        Smartphone.new_product({**phone, "efficiency": 1.0, "model": "M", "memory": 1, "color": "C"})
+        grass = LawnGrass("G", "D", 10.0, 1, "Россия", "7 дней", "Зеленый")
+        category = Category("Cat", "Desc", [])
+        category.add_product(grass)
+        grass.quantity = 5
+        grass.price = 20.0
+        _ = category.products
+    snapshot = inst.snapshot()
+    assert snapshot["new_product"]["calls"] == 2
+    assert snapshot["add_product"]["items"] == 1
+    assert snapshot["set_quantity"]["calls"] == 1
+    assert snapshot["set_price"]["calls"] == 1
+    assert snapshot["render_products"]["items"] == 1
+    assert sum(count for _, count in snapshot["add_product"]["histogram"]) == 1
+    # После выключения вызовы не учитываются.
+    category.add_product(Product("B", "Desc", 1.0, 1))
+    assert inst.snapshot()["add_product"]["calls"] == 1
+
+
+def test_prometheus_export_and_single_active():
+    inst = Instrumentation(buckets=(0.5,))
+    with inst:
+        Category("Cat", "Desc", []).add_product(Product("A", "Desc", 1.0, 1))
+        with pytest.raises(RuntimeError):
+            Instrumentation().enable()
+    text = inst.to_prometheus()
+    assert 'candy_shop_calls_total{op="add_product"} 1' in text
+    assert 'candy_shop_duration_seconds_bucket{op="add_product",le="+Inf"} 1' in text
+    assert 'candy_shop_duration_seconds_count{op="add_product"} 1' in text
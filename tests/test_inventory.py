@@ -0,0 +1,51 @@
+import pytest
+
+from src.inventory import InventoryStore
+from src.model import Category, Product, Smartphone
+
+
+@pytest.fixture
+def store():
+    phones = Category(
+        "Смартфоны",
+        "Телефоны",
+        [
+            Smartphone("Iphone 15", "512GB", 210000.0, 8, 98.2, "15", 512, "Gray space"),
+            Smartphone("Xiaomi", "1024GB", 31000.0, 2, 90.3, "Note 11", 1024, "Синий"),
+        ],
+    )
+    tv = Category("Телевизоры", "ТВ", [Product("QLED", "4K", 123000.0, 7)])
+    return InventoryStore.from_categories([phones, tv])
+
+
+def test_from_categories(store):
+    assert len(store) == 3
+    assert list(store.category_ids) == [0, 0, 1]
+    assert store.categories == [("Смартфоны", "Телефоны"), ("Телевизоры", "ТВ")]
+
+
+def test_valuation(store):
+    assert store.total_value() == 210000.0 * 8 + 31000.0 * 2 + 123000.0 * 7
+    assert store.total_quantity() == 17
+    assert store.value_by_category() == {"Смартфоны": 210000.0 * 8 + 31000.0 * 2, "Телевизоры": 123000.0 * 7}
+    store.add_product(Product("OLED", "4K", 100.0, 1), store.add_category("Телевизоры", "Еще ТВ"))
+    assert store.value_by_category()["Телевизоры"] == 123000.0 * 7 + 100.0
+    assert list(store.category_values) == [210000.0 * 8 + 31000.0 * 2, 123000.0 * 7, 100.0]
+
+
+def test_filters(store):
+    assert store.low_stock(5) == [1]
+    assert store.filter_price(100000, 200000) == [2]
+    assert store.filter_price(max_price=50000) == [1]
+
+
+def test_round_trip(store):
+    categories = store.to_categories()
+    assert [c.name for c in categories] == ["Смартфоны", "Телевизоры"]
+    assert [p.name for p in categories[0]] == ["Iphone 15", "Xiaomi"]
+    assert store.product(2).price == 123000.0
+
+
+def test_add_unknown_category():
+    with pytest.raises(IndexError):
+        InventoryStore().add("A", "B", 1.0, 1, 0)
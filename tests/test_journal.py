@@ -0,0 +1,87 @@
+import threading
+
+import pytest
+
+from src.journal import ChangeJournal, JournalFollower, rebuild
+from src.model import Category, Product, ProductRegistry, Smartphone, set_thread_safe
+
+
+def _state(categories):
+    return {c.name: sorted((type(p).__name__, tuple(sorted(p.to_dict().items()))) for p in c) for c in categories}
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "journal.jsonl"), str(tmp_path / "snapshot.json")
+
+
+def test_rebuild_from_journal(paths):
+    journal_path, snapshot_path = paths
+    phone = Smartphone("Iphone 15", "512GB", 210000.0, 8, 98.2, "15", 512, "Gray space")
+    category = Category("Смартфоны", "Телефоны", [phone])
+    with ChangeJournal(journal_path) as journal:
+        journal.watch(category)
+        category.add_product(Product("Чехол", "Силикон", 990.0, 30))
+        phone.set_price(200000.0)
+        phone.quantity = 3
+        phone.name = "Iphone 15 Pro"
+        registry = ProductRegistry(category)
+        registry.upsert({"name": "Чехол", "description": "Силикон", "price": 1200.0, "quantity": 5})
+    restored = rebuild(None, journal_path)
+    assert _state(restored) == _state([category])
+    assert isinstance(list(restored[0])[0], Smartphone)
+
+
+def test_compaction_and_follower(paths):
+    journal_path, snapshot_path = paths
+    category = Category("Товары", "Описание", [])
+    journal = ChangeJournal(journal_path, snapshot_path, compact_every=3)
+    journal.watch(category)
+    follower = JournalFollower(journal_path, snapshot_path)
+    for i in range(4):
+        category.add_product(Product(f"P{i}", "Desc", 10.0, i))
+    # Часть записей попала только в снимок: реплика перезагружается из него.
+    follower.poll()
+    assert _state(follower.categories.values()) == _state([category])
+    list(category)[0].quantity = 100
+    list(category)[1].quantity = 200
+    follower.poll()
+    assert _state(follower.categories.values()) == _state([category])
+    journal.close()
+    assert _state(rebuild(snapshot_path, journal_path)) == _state([category])
+    reopened = ChangeJournal(journal_path, snapshot_path)
+    assert reopened.seq == journal.seq
+    reopened.close()
+
+
+def test_compact_requires_snapshot(paths):
+    journal_path, _ = paths
+    with pytest.raises(ValueError):
+        ChangeJournal(journal_path, compact_every=10)
+
+
+def test_watch_concurrent_with_product_changes(paths):
+    journal_path, _ = paths
+    products = [Product(f"P{i}", "Desc", 10.0, 1) for i in range(50)]
+    set_thread_safe(True)
+    try:
+        with ChangeJournal(journal_path) as journal:
+            journal.watch(Category("Первая", "Описание", list(products)))
+
+            def change():
+                for i in range(2, 200):
+                    products[i % len(products)].quantity = i
+
+            def watch():
+                for i in range(20):
+                    journal.watch(Category(f"Категория {i}", "Описание", list(products)))
+
+            threads = [threading.Thread(target=change), threading.Thread(target=watch)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(10)
+            assert not any(t.is_alive() for t in threads)
+            assert all(p._subscribers().count(journal._on_product_changed) == 1 for p in products)
+    finally:
+        set_thread_safe(False)
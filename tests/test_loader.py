@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from src.loader import iter_events, stream_categories, stream_products
+from src.model import Category, Product
+
+CATALOG = [
+    {
+        "name": "Смартфоны",
+        "description": "Смартфоны для жизни",
+        "products": [
+            {"name": "Iphone 15", "description": "512GB, Gray space", "price": 210000.0, "quantity": 8},
+            {"name": "Xiaomi Redmi Note 11", "description": "1024GB, Синий", "price": 31000.0, "quantity": 14},
+            {"name": "Iphone 15", "description": "512GB, Gray space", "price": 200000.0, "quantity": 2},
+        ],
+    },
+    {"name": "Пустая", "description": "Без товаров", "products": []},
+    {
+        "name": "Телевизоры",
+        "description": "Современные телевизоры",
+        "products": [{"name": "55\" QLED 4K", "description": "Фоновая подсветка", "price": 123000, "quantity": 7}],
+    },
+]
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    path = tmp_path / "products.json"
+    path.write_text(json.dumps(CATALOG, ensure_ascii=False, indent=2), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_iter_events_matches_json_load(catalog_file, chunk_size):
+    events = list(iter_events(catalog_file, chunk_size))
+    products = [payload for kind, payload in events if kind == "product"]
+    categories = [payload for kind, payload in events if kind == "category"]
+    assert products == [p for c in CATALOG for p in c["products"]]
+    assert categories == [{"name": c["name"], "description": c["description"]} for c in CATALOG]
+    assert products[-1]["price"] == 123000
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 9, 27, 43, 129])
+def test_iter_events_numbers_across_chunks(tmp_path, chunk_size):
+    data = [{"name": "Cat", "rating": 1.5e-3, "weight": 12.25, "products": [], "description": "D"}]
+    path = tmp_path / "numbers.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    events = list(iter_events(str(path), chunk_size))
+    assert events == [("category", {"name": "Cat", "rating": 1.5e-3, "weight": 12.25, "description": "D"})]
+
+
+def test_stream_categories_builds_objects(catalog_file):
+    categories = list(stream_categories(catalog_file, chunk_size=16))
+    assert [c._Category__name for c in categories] == ["Смартфоны", "Пустая", "Телевизоры"]
+    phones = list(categories[0])
+    assert all(isinstance(p, Product) for p in phones)
+    assert len(phones) == 2
+    assert phones[0].quantity == 10
+    assert phones[0].price == 210000.0
+    assert categories[1].products == "В категории нет товаров."
+
+
+def test_stream_categories_is_lazy(catalog_file):
+    before = Category.category_count
+    stream = stream_categories(catalog_file)
+    first = next(stream)
+    assert first._Category__name == "Смартфоны"
+    assert Category.category_count == before + 1
+
+
+def test_stream_products(catalog_file):
+    names = [p.name for p in stream_products(catalog_file, chunk_size=3)]
+    assert names == ["Iphone 15", "Xiaomi Redmi Note 11", "Iphone 15", "55\" QLED 4K"]
+
+
+def test_iter_events_invalid_json(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text('[{"name": "A", "products": [{"name": ', encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_events(str(path)))
@@ -1,10 +1,12 @@
+import gc
 import json
+import weakref
 from io import StringIO
 from unittest.mock import patch
 
 import pytest
 
-from src.model import Category, Product, Smartphone, LawnGrass
+from src.model import Category, CategoryVersion, Product, ProductRegistry, Smartphone, LawnGrass
 
 
 @pytest.fixture
@@ -32,6 +34,18 @@ def test_init_count(category_coffee):
     assert category_coffee.products == expected
     assert Category.category_count >= 1
     assert Category.product_count >= 1
+    assert category_coffee.category_count == Category.category_count
+    assert category_coffee.product_count == Category.product_count
+
+
+def test_counters_reset_through_class():
+    category = Category("Cat", "Desc", [Product("Prod", "Desc", 1.0, 1)])
+    Category.category_count = 0
+    assert category.category_count == 0
+    Category("Other", "Desc", [])
+    assert category.category_count == Category.category_count == 1
+    with pytest.raises(AttributeError):
+        category.product_count = 5
 
 
 def test_parser_json_valid_data():
@@ -184,3 +198,225 @@ def test_category_add_valid_product(category_coffee):
 def test_category_add_invalid_product(category_coffee):
     with pytest.raises(TypeError):
         category_coffee.add_product("Not a product")
+
+
+def test_registry_upsert_merges_duplicates():
+    registry = ProductRegistry()
+    p1 = registry.upsert({"name": "TestProd", "description": "Desc", "price": 100.0, "quantity": 5})
+    p2 = registry.upsert({"name": "TestProd", "description": "Desc", "price": 120.0, "quantity": 3})
+    assert p1 is p2
+    assert p1.quantity == 8
+    assert p1.price == 120.0
+    assert len(registry) == 1
+    assert "TestProd" in registry
+
+
+def test_registry_upsert_many_and_new_product():
+    registry = ProductRegistry()
+    result = registry.upsert_many(
+        [
+            {"name": "A", "description": "Desc", "price": 10.0, "quantity": 1},
+            {"name": "B", "description": "Desc", "price": -1.0, "quantity": 1},
+            {"name": "A", "description": "Desc", "price": 5.0, "quantity": 2},
+        ]
+    )
+    assert len(result) == 2
+    assert result[0] is result[1]
+    assert result[0].quantity == 3
+    assert result[0].price == 10.0
+    p = Product.new_product({"name": "C", "description": "Desc", "price": 1.0, "quantity": 1}, registry)
+    assert registry.get("C") is p
+
+
+def test_registry_by_class():
+    registry = ProductRegistry(by_class=True)
+    s = Smartphone("Same", "Desc", 100.0, 1, 90.0, "A1", 128, "Blue")
+    g = LawnGrass("Same", "Desc", 50.0, 2, "Россия", "7 дней", "Зеленый")
+    assert registry.add(s) is s
+    assert registry.add(g) is g
+    assert len(registry) == 2
+    assert registry.get("Same", LawnGrass) is g
+    assert registry.add(Smartphone("Same", "Desc", 120.0, 3, 90.0, "A1", 128, "Blue")) is s
+    assert s.quantity == 4
+    assert s.price == 120.0
+
+
+def test_products_use_slots():
+    s = Smartphone("Phone", "Desc", 100.0, 1, 90.0, "A1", 128, "".join(["Bl", "ue"]))
+    g = LawnGrass("Grass", "Desc", 50.0, 2, "Россия", "7 дней", "Зеленый")
+    for obj in (Product("Prod", "Desc", 1.0, 1), s, g):
+        assert not hasattr(obj, "__dict__")
+    assert s.color is Smartphone("Other", "Desc", 1.0, 1, 1.0, "A1", 1, "Blue").color
+
+
+def test_category_aggregates_follow_changes():
+    p1 = Product("Prod1", "Desc", 100.0, 10)
+    p2 = Product("Prod2", "Desc", 200.0, 5)
+    category = Category("TestCat", "Category Desc", [p1])
+    category.add_product(p2)
+    assert category.item_count == 2
+    assert category.total_quantity == 15
+    assert category.stock_value == 2000.0
+    assert (category.min_price, category.max_price) == (100.0, 200.0)
+    p1.quantity = 20
+    p2.price = 300.0
+    assert category.total_quantity == 25
+    assert category.stock_value == 100.0 * 20 + 300.0 * 5
+    assert (category.min_price, category.max_price) == (100.0, 300.0)
+    p1.set_price(50.0)
+    assert category.min_price == 50.0
+
+
+def test_category_aggregates_empty():
+    category = Category("Empty", "Desc", [])
+    assert category.item_count == 0
+    assert category.stock_value == 0.0
+    assert category.min_price is None
+    assert category.max_price is None
+
+
+def test_product_unsubscribe():
+    p = Product("Prod", "Desc", 100.0, 1)
+    events = []
+
+    def listener(prod, field, old, new):
+        events.append((field, old, new))
+
+    p.subscribe(listener)
+    p.quantity = 3
+    p.unsubscribe(listener)
+    p.quantity = 4
+    assert events == [("quantity", 1, 3)]
+
+
+def test_single_listener_is_stored_without_list():
+    p = Product("Prod", "Desc", 100.0, 1)
+    events = []
+
+    def first(prod, field, old, new):
+        events.append("first")
+
+    def second(prod, field, old, new):
+        events.append("second")
+
+    p.subscribe(first)
+    assert p._listeners is first
+    p.subscribe(second)
+    assert p._subscribers() == (first, second)
+    p.quantity = 2
+    p.unsubscribe(first)
+    assert p._listeners is second
+    p.quantity = 3
+    p.unsubscribe(second)
+    assert p._listeners is None
+    assert events == ["first", "second", "second"]
+
+
+def test_category_does_not_outlive_references():
+    p = Product("Prod", "Desc", 100.0, 1)
+    category = Category("Cat", "Desc", [p])
+    ref = weakref.ref(category)
+    del category
+    gc.collect()
+    assert ref() is None
+    p.quantity = 2
+    assert not p._subscribers()
+    for _ in range(100):
+        Category("Tmp", "Desc", [p])
+    assert len(p._subscribers()) <= 2
+    kept = Category("Kept", "Desc", [p])
+    p.quantity = 5
+    assert kept.total_quantity == 5
+
+
+def test_render_cache_invalidation():
+    p = Product("Prod", "Desc", 100.0, 1)
+    category = Category("Cat", "Desc", [p])
+    assert category.products == "Prod, 100.0 руб. Остаток: 1 шт."
+    assert str(p) == "Prod, 100.00 руб. Остаток: 1 шт."
+    p.name = "Renamed"
+    p.quantity = 2
+    assert category.products == "Renamed, 100.0 руб. Остаток: 2 шт."
+    assert str(p) == "Renamed, 100.00 руб. Остаток: 2 шт."
+    category.add_product(Product("Other", "Desc", 5.0, 3))
+    assert category.products.splitlines()[1] == "Other, 5.0 руб. Остаток: 3 шт."
+
+
+def test_products_cache_from_older_version_is_dropped():
+    category = Category("Cat", "Desc", [Product("Prod", "Desc", 100.0, 1)])
+    # Строка, построенная по предыдущей версии состава (например, при гонке с add_product).
+    category._products_cache = (category._version - 1, category._changes, "stale")
+    assert category.products == "Prod, 100.0 руб. Остаток: 1 шт."
+    category._products_cache = (category._version, category._changes - 1, "stale")
+    assert category.products == "Prod, 100.0 руб. Остаток: 1 шт."
+
+
+def test_products_paging():
+    category = Category("Cat", "Desc", [Product(f"P{i}", "Desc", 1.0, i) for i in range(5)])
+    assert list(category.iter_product_lines()) == category.products.splitlines()
+    assert category.products_page(2, per_page=2) == ["P2, 1.0 руб. Остаток: 2 шт.", "P3, 1.0 руб. Остаток: 3 шт."]
+    assert category.products_page(4, per_page=2) == []
+    with pytest.raises(ValueError):
+        category.products_page(0)
+
+
+def test_to_dict_and_type_for():
+    s = Smartphone("Phone", "Desc", 100.0, 1, 90.0, "A1", 128, "Blue")
+    data = s.to_dict()
+    assert data["memory"] == 128
+    copy = Product.type_for("Smartphone")(**data)
+    assert copy.to_dict() == data
+    assert Product.type_for("Product") is Product
+    with pytest.raises(ValueError):
+        Product.type_for("Unknown")
+
+
+def test_category_snapshot_versions():
+    products = [Product(f"P{i}", "Desc", 1.0, 1) for i in range(CategoryVersion.CHUNK + 10)]
+    category = Category("Cat", "Desc", list(products))
+    first = category.snapshot()
+    assert category.snapshot() is first
+    reader = iter(category)
+    next(reader)
+    extra = Product("Extra", "Desc", 2.0, 1)
+    category.add_product(extra)
+    assert len(list(reader)) == len(products) - 1
+    second = category.snapshot()
+    assert len(first) == len(products) and len(second) == len(products) + 1
+    assert second[-1] is extra and second[0] is products[0]
+    assert second._chunks[0] is first._chunks[0]
+    assert list(category)[-1] is extra
+
+
+def test_snapshot_sees_product_added_during_build():
+    class Interleaved(list):
+        """Список товаров, в который другой писатель добавляет товар во время построения среза."""
+
+        hook = None
+
+        def __getitem__(self, index):
+            result = super().__getitem__(index)
+            if isinstance(index, slice) and self.hook is not None:
+                hook, self.hook = self.hook, None
+                hook()
+            return result
+
+    products = Interleaved([Product("A", "Desc", 1.0, 1)])
+    category = Category("Cat", "Desc", products)
+    late = Product("B", "Desc", 2.0, 1)
+    products.hook = lambda: category.add_product(late)
+    first = category.snapshot()
+    assert [p.name for p in first] == ["A"]
+    assert [p.name for p in category] == ["A", "B"]
+    assert category.products.splitlines()[-1].startswith("B")
+
+
+def test_category_version_replace():
+    size = CategoryVersion.CHUNK * 2 + 5
+    version = CategoryVersion().extend(list(range(size)), 1)
+    replaced = version.replace({3: "a", size - 1: "b"}, 2)
+    assert (replaced[3], replaced[-1], version[3]) == ("a", "b", 3)
+    assert replaced._chunks[1] is version._chunks[1]
+    assert list(replaced)[4:10] == list(range(4, 10))
+    with pytest.raises(IndexError):
+        version.replace({size: 0}, 3)
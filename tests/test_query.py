@@ -0,0 +1,90 @@
+import gc
+import random
+import weakref
+
+import pytest
+
+from src.model import Category, LawnGrass, Product, Smartphone
+from src.query import CatalogIndex, _SortedKeys
+
+
+@pytest.fixture
+def catalog():
+    phones = Category(
+        "Смартфоны",
+        "Телефоны",
+        [
+            Smartphone("Samsung Galaxy S23 Ultra", "256GB", 180000.0, 5, 95.5, "S23 Ultra", 256, "Серый"),
+            Smartphone("Iphone 15", "512GB", 210000.0, 8, 98.2, "15", 512, "Gray space"),
+            Smartphone("Xiaomi Redmi Note 11", "1024GB", 31000.0, 14, 90.3, "Note 11", 1024, "Синий"),
+        ],
+    )
+    grass = Category(
+        "Газонная трава", "Трава", [LawnGrass("Газонная трава", "Элитная", 500.0, 20, "Россия", "7 дней", "Зеленый")]
+    )
+    return phones, grass, CatalogIndex([phones, grass])
+
+
+def test_price_and_type_queries(catalog):
+    phones, grass, index = catalog
+    assert len(index) == 4
+    assert [p.name for p in index.price_range(1000, 200000)] == ["Xiaomi Redmi Note 11", "Samsung Galaxy S23 Ultra"]
+    assert [p.name for p in index.of_type(LawnGrass)] == ["Газонная трава"]
+    assert len(index.of_type(Product)) == 4
+    assert index.of_type(Product, exact=True) == []
+
+
+def test_attribute_queries(catalog):
+    phones, grass, index = catalog
+    assert [p.name for p in index.where("country", "Россия")] == ["Газонная трава"]
+    assert [p.memory for p in index.attribute_range("memory", 512)] == [512, 1024]
+    result = index.search(Smartphone, max_price=200000, memory=(512, None))
+    assert [p.name for p in result] == ["Xiaomi Redmi Note 11"]
+    assert index.search(color="Серый", min_price=200000) == []
+    with pytest.raises(KeyError):
+        index.where("efficiency", 95.5)
+
+
+def test_index_follows_updates(catalog):
+    phones, grass, index = catalog
+    new_phone = Smartphone("Pixel 9", "512GB", 90000.0, 3, 97.0, "9", 512, "Черный")
+    phones.add_product(new_phone)
+    iphone = index.where("color", "Gray space")[0]
+    iphone.set_price(150000.0)
+    result = index.search(Smartphone, max_price=200000, memory=(512, None))
+    assert [p.name for p in result] == ["Xiaomi Redmi Note 11", "Pixel 9", "Iphone 15"]
+    assert index.price_range(200000) == []
+
+
+def test_sorted_keys_blocks(monkeypatch):
+    monkeypatch.setattr(_SortedKeys, "LOAD", 4)
+    keys = _SortedKeys()
+    rng = random.Random(7)
+    reference = []
+    for seq in range(300):
+        key = (rng.randint(0, 50), seq)
+        keys.add(key)
+        reference.append(key)
+    for key in rng.sample(reference, 150):
+        keys.remove(key)
+        reference.remove(key)
+    reference.sort()
+    assert len(keys) == len(reference) and len(keys._blocks) > 1
+    assert keys.between(None, None) == reference
+    expected = [k for k in reference if 10 <= k[0] <= 30]
+    assert keys.between(10, 30) == expected
+    assert keys.count(10, 30) == len(expected)
+    assert keys.count(None, 5) == len([k for k in reference if k[0] <= 5])
+    with pytest.raises(ValueError):
+        keys.remove((1000, 0))
+
+
+def test_index_is_not_kept_alive_by_products(catalog):
+    phones, grass, _ = catalog
+    index = CatalogIndex([grass])
+    ref = weakref.ref(index)
+    grass.unsubscribe(index._on_product_added)
+    del index
+    gc.collect()
+    assert ref() is None
+    list(grass)[0].set_price(100.0)
@@ -0,0 +1,51 @@
+from src.model import Product
+from src.repricing import PriceChange, apply_changes, auto_approve, max_discount
+
+
+def _fail_input(prompt):
+    raise AssertionError("input() не должен вызываться")
+
+
+def test_apply_changes_default_rejects_decrease(monkeypatch):
+    monkeypatch.setattr("builtins.input", _fail_input)
+    a = Product("A", "Desc", 100.0, 1)
+    b = Product("B", "Desc", 100.0, 1)
+    result = apply_changes([PriceChange(a, price=120.0, quantity=5), PriceChange(b, price=80.0, quantity=5)])
+    assert [c.product for c in result.applied] == [a]
+    assert [r.change.product for r in result.rejected] == [b]
+    assert (a.price, a.quantity) == (120.0, 5)
+    assert (b.price, b.quantity) == (100.0, 1)
+
+
+def test_apply_changes_policies():
+    a = Product("A", "Desc", 100.0, 1)
+    b = Product("B", "Desc", 100.0, 1)
+    result = apply_changes([PriceChange(a, price=90.0), PriceChange(b, price=50.0)], max_discount(0.2))
+    assert a.price == 90.0
+    assert b.price == 100.0
+    assert len(result.rejected) == 1
+    result = apply_changes([PriceChange(b, price=50.0)], auto_approve)
+    assert b.price == 50.0
+    assert not result.rejected
+
+
+def test_apply_changes_invalid_values(capsys):
+    a = Product("A", "Desc", 100.0, 1)
+    result = apply_changes([PriceChange(a, price=-1.0), PriceChange(a, quantity=-1), PriceChange(a, quantity=3)])
+    assert len(result.rejected) == 2
+    assert a.quantity == 3
+    assert capsys.readouterr().out == ""
+
+
+def test_set_price_callback():
+    a = Product("A", "Desc", 100.0, 1)
+    seen = []
+
+    def decline(product, value):
+        seen.append((product, value))
+        return False
+
+    assert not a.set_price(50.0, decline)
+    assert seen == [(a, 50.0)]
+    assert a.set_price(50.0)
+    assert a.price == 50.0
@@ -0,0 +1,67 @@
+import gc
+import weakref
+
+from src.model import Category, Product
+from src.search import SearchIndex, levenshtein, normalize
+
+
+def test_normalize_and_levenshtein():
+    assert normalize("  Ёлка   ЗЕЛЁНАЯ! ") == "елка зеленая"
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("kitten", "sitting", limit=1) == 2
+
+
+def test_search_and_fuzzy():
+    s23 = Product("Samsung Galaxy S23 Ultra", "Смартфон, черный", 180000.0, 5)
+    tea = Product("Чай зелёный", "Листовой", 300.0, 10)
+    category = Category("Cat", "Desc", [s23, tea])
+    index = SearchIndex([category])
+    assert index.search("ЗЕЛЕНЫЙ чай") == [tea]
+    assert index.search("смартфон samsung") == [s23]
+    assert index.search("чай кофе") == []
+    assert index.fuzzy("samsung galaxy s 23 ultra") == [(s23, 1)]
+    assert index.fuzzy("чаи зеленыи", max_distance=2) == [(tea, 2)]
+
+    near = Product("Samsung Galaxy C23 Ultra", "Смартфон", 170000.0, 1)
+    assert index.likely_duplicates(near) == [s23]
+    category.add_product(near)
+    assert index.likely_duplicates(near) == [s23]
+    assert index.likely_duplicates(s23) == [near]
+
+    tea.name = "Кофе"
+    assert index.search("чай") == []
+    assert index.search("кофе") == [tea]
+    assert index.fuzzy("кофэ", max_distance=1) == [(tea, 1)]
+
+
+def test_index_is_not_kept_alive_by_products():
+    prod = Product("Samsung Galaxy S23 Ultra", "256GB", 180000.0, 5)
+    index = SearchIndex()
+    index.add(prod)
+    ref = weakref.ref(index)
+    del index
+    gc.collect()
+    assert ref() is None
+    prod.name = "Samsung Galaxy S24"
+    assert prod._listeners is None
+
+
+def test_fuzzy_names_with_common_prefix():
+    products = [Product(f"Товар {i}", "", 1.0, 1) for i in range(2000)]
+    index = SearchIndex([Category("Cat", "Desc", products)])
+    for query in ("Товар 1711", "Тавар 171", "Товар", "Т"):
+        expected = sorted(
+            (levenshtein(normalize(query), normalize(prod.name)), products.index(prod))
+            for prod in products
+            if levenshtein(normalize(query), normalize(prod.name)) <= 2
+        )
+        found = [(distance, products.index(prod)) for prod, distance in index.fuzzy(query, limit=None)]
+        assert found == expected
+
+    products[1711].name = "Товар без номера"
+    assert index.fuzzy("Товар 1711", max_distance=0) == []
+    assert index.fuzzy("товар без номера", max_distance=0) == [(products[1711], 0)]
+    extra = Product("Товар 1711", "", 1.0, 1)
+    index.add(extra)
+    assert index.fuzzy("Товар 1711", max_distance=0) == [(extra, 0)]
+    assert index._ordered_names() == sorted(index._by_name)
@@ -0,0 +1,113 @@
+import asyncio
+import json
+
+from src.repricing import auto_approve
+from src.service import CatalogService
+
+
+def _write(tmp_path):
+    data = [
+        {
+            "name": f"Категория {i}",
+            "description": "Описание",
+            "products": [{"name": f"Товар {i}", "description": "Desc", "price": 100.0 * (i + 1), "quantity": i}],
+        }
+        for i in range(5)
+    ]
+    path = tmp_path / "products.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+def test_load_and_query(tmp_path):
+    async def scenario():
+        service = CatalogService(batch_size=2)
+        assert await service.load(_write(tmp_path)) == 5
+        assert len(await service.category_names()) == 5
+        view = await service.get_category("Категория 2")
+        assert view.products[0].price == 300.0
+        found = await service.find(min_price=200.0, max_price=400.0, in_stock=True)
+        return sorted(record.name for _, record in found)
+
+    assert asyncio.run(scenario()) == ["Товар 1", "Товар 2", "Товар 3"]
+
+
+def test_writers_publish_consistent_snapshots():
+    async def scenario():
+        service = CatalogService(batch_size=10)
+        records = [{"name": f"P{i}", "description": "D", "price": 10.0, "quantity": 1} for i in range(50)]
+        await service.upsert("Товары", records, "Описание")
+        before = service.snapshot()
+        await asyncio.gather(
+            service.upsert("Товары", [{"name": "P0", "description": "D", "price": 20.0, "quantity": 4}]),
+            service.update_stock("Товары", [("P1", 5.0, 0)], auto_approve),
+            *(service.find(max_price=15.0) for _ in range(20)),
+        )
+        after = service.snapshot()
+        return before, after
+
+    before, after = asyncio.run(scenario())
+    old = {r.name: r for r in before["Товары"].products}
+    new = {r.name: r for r in after["Товары"].products}
+    assert len(old) == len(new) == 50
+    assert (old["P0"].price, old["P0"].quantity) == (10.0, 1)
+    assert (new["P0"].price, new["P0"].quantity) == (20.0, 5)
+    assert (new["P1"].price, new["P1"].quantity) == (5.0, 0)
+    assert after["Товары"].version > before["Товары"].version
+
+
+def test_update_stock_rejects_decrease_without_policy():
+    async def scenario():
+        service = CatalogService()
+        await service.upsert("Товары", [{"name": "P", "description": "D", "price": 10.0, "quantity": 1}])
+        result = await service.update_stock("Товары", [("P", 5.0, None)])
+        return result, await service.get_category("Товары")
+
+    result, view = asyncio.run(scenario())
+    assert len(result.rejected) == 1
+    assert view.products[0].price == 10.0
+
+
+def test_merged_category_is_detached(tmp_path):
+    products = [{"name": "A", "description": "", "price": 1.0, "quantity": 1}]
+    data = [
+        {"name": "Товары", "description": "", "products": products},
+        {"name": "Товары", "description": "", "products": [{**products[0], "name": "B", "quantity": 2}]},
+        {"name": "Товары", "description": "", "products": [{**products[0], "price": 3.0}]},
+    ]
+    path = tmp_path / "products.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    async def scenario():
+        service = CatalogService(batch_size=1)
+        await service.load(str(path))
+        return service
+
+    service = asyncio.run(scenario())
+    category = service._categories["Товары"]
+    added = service._registries["Товары"].get("B")
+    assert len(added._subscribers()) == 1
+    assert [(r.name, r.price, r.quantity) for r in service.snapshot()["Товары"].products] == [
+        ("A", 3.0, 2),
+        ("B", 1.0, 2),
+    ]
+    added.quantity = 5
+    assert category.total_quantity == 7
+
+
+def test_publish_shares_unchanged_records():
+    async def scenario():
+        service = CatalogService(batch_size=500)
+        records = [{"name": f"P{i}", "description": "D", "price": 10.0, "quantity": 1} for i in range(1000)]
+        await service.upsert("Товары", records)
+        before = service.snapshot()["Товары"].products
+        await service.update_stock("Товары", [("P3", 12.0, 2)], auto_approve)
+        await service.upsert("Товары", [{"name": "New", "description": "D", "price": 1.0, "quantity": 1}])
+        return before, service.snapshot()["Товары"].products
+
+    before, after = asyncio.run(scenario())
+    assert (before[3].price, after[3].price, after[3].quantity) == (10.0, 12.0, 2)
+    assert len(before) == 1000 and len(after) == 1001 and after[-1].name == "New"
+    assert after._chunks[1] is before._chunks[1]
+    assert after._chunks[0] is not before._chunks[0]
+    assert [r.name for r in after][:5] == ["P0", "P1", "P2", "P3", "P4"]
@@ -0,0 +1,50 @@
+from decimal import Decimal
+
+import pytest
+
+from src.model import Category, Product, Smartphone
+from src.sharding import ShardedCatalog
+
+
+@pytest.fixture
+def catalog():
+    with ShardedCatalog(shards=3) as sharded:
+        yield sharded
+
+
+def test_routing_and_merge(catalog):
+    phone = Smartphone("Phone", "Desc", 100.0, 1, 90.0, "A1", 128, "Blue")
+    products = [Product(f"P{i}", "Desc", 1.0, 1) for i in range(30)]
+    assert catalog.load([Category("Phones", "Смартфоны", [phone]), Category("Misc", "Разное", products)]) == 31
+    assert {catalog.shard_of("Misc", p.name) for p in products} == {0, 1, 2}
+
+    assert catalog.add_products("Misc", [{"name": "P1", "description": "Desc", "price": 2.0, "quantity": 4}]) == 0
+    merged = catalog.get("Misc", "P1")
+    assert (merged.price, merged.quantity) == (2.0, 5)
+    copy = catalog.get("Phones", "Phone")
+    assert isinstance(copy, Smartphone) and copy.to_dict() == phone.to_dict()
+    assert catalog.get("Misc", "Unknown") is None
+
+    misc = catalog.category("Misc")
+    assert misc.description == "Разное" and misc.item_count == 30
+    assert catalog.category("Unknown") is None
+    assert catalog.category_names() == ["Phones", "Misc"]
+    assert (catalog.category_count, catalog.product_count) == (2, 31)
+
+    valuation = catalog.value(exact=True)
+    assert valuation.by_category == {"Phones": Decimal("100.00"), "Misc": Decimal("39.00")}
+    assert valuation.by_type["Smartphone"] == Decimal("100.00")
+    assert valuation.total == Decimal("139.00") and valuation.quantity == 35
+
+
+def test_errors_are_raised_in_coordinator(catalog):
+    with pytest.raises(ValueError):
+        catalog.add_product("Misc", {"name": "X", "type": "Unknown"})
+    with pytest.raises(ValueError):
+        catalog.add_product("Misc", {"price": 1.0})
+
+
+@pytest.mark.parametrize("shards", [0, -1])
+def test_invalid_shard_count(shards):
+    with pytest.raises(ValueError):
+        ShardedCatalog(shards)
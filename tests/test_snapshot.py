@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from src.exporter import export_json
+from src.model import Category, LawnGrass, Product, Smartphone
+from src.snapshot import CatalogSnapshot, convert_json, write_snapshot
+
+
+@pytest.fixture
+def categories():
+    phones = Category(
+        "Смартфоны",
+        "Телефоны",
+        [
+            Smartphone("Iphone 15", "512GB", 210000.0, 8, 98.2, "15", 512, "Gray space"),
+            Product("Чехол", "Силикон", 990.0, 30),
+        ],
+    )
+    grass = Category(
+        "Газонная трава", "Трава", [LawnGrass("Газон", "Элитная", 500.0, 20, "Россия", "7 дней", "Зеленый")]
+    )
+    empty = Category("Пустая", "", [])
+    return [phones, grass, empty]
+
+
+def test_round_trip(tmp_path, categories):
+    path = str(tmp_path / "catalog.bin")
+    write_snapshot(categories, path)
+    with CatalogSnapshot(path) as snapshot:
+        assert len(snapshot) == 3
+        assert snapshot.category_names() == ["Смартфоны", "Газонная трава", "Пустая"]
+        assert list(snapshot.prices) == [210000.0, 990.0, 500.0]
+        phone = snapshot.product(0)
+        assert isinstance(phone, Smartphone)
+        assert phone.to_dict() == list(categories[0])[0].to_dict()
+        grass = snapshot.category(snapshot.find_category("Газонная трава"))
+        assert [p.country for p in grass] == ["Россия"]
+        assert snapshot.category(2).products == "В категории нет товаров."
+        assert snapshot.total_value() == sum(c.stock_value for c in categories)
+        assert snapshot.category_value(0) == categories[0].stock_value
+    assert phone.price == 210000.0
+
+
+def test_convert_json(tmp_path):
+    data = [
+        {
+            "name": "Телевизоры",
+            "description": "ТВ",
+            "products": [
+                {"name": "QLED", "description": "4K", "price": 123000.0, "quantity": 7},
+                {"name": "QLED", "description": "4K", "price": 120000.0, "quantity": 1},
+            ],
+        }
+    ]
+    json_path = tmp_path / "products.json"
+    json_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    snapshot_path = str(tmp_path / "products.bin")
+    convert_json(str(json_path), snapshot_path)
+    with CatalogSnapshot(snapshot_path) as snapshot:
+        assert snapshot.category_count == 1
+        assert [str(p) for p in snapshot.products_of(0)] == ["QLED, 123000.00 руб. Остаток: 8 шт."]
+
+
+def test_convert_exported_json(tmp_path, categories):
+    json_path = str(tmp_path / "export.json")
+    export_json(categories, json_path)
+    snapshot_path = str(tmp_path / "export.bin")
+    convert_json(json_path, snapshot_path)
+    with CatalogSnapshot(snapshot_path) as snapshot:
+        phone = snapshot.product(0)
+        assert isinstance(phone, Smartphone)
+        assert phone.to_dict() == list(categories[0])[0].to_dict()
+        assert isinstance(snapshot.product(2), LawnGrass)
+
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"not a snapshot at all, just some bytes")
+    with pytest.raises(ValueError):
+        CatalogSnapshot(str(path))
@@ -0,0 +1,40 @@
+from decimal import Decimal
+
+import pytest
+
+from src.model import Category, LawnGrass, Product, Smartphone
+from src.valuation import category_value, value_catalog
+
+
+def test_product_sum_and_chained_add():
+    a = Product("A", "Desc", 10.0, 2)
+    b = Product("B", "Desc", 5.0, 4)
+    c = Product("C", "Desc", 1.5, 2)
+    assert a + b + c == 43.0
+    assert sum([a, b, c]) == 43.0
+    with pytest.raises(TypeError):
+        a + "x"  # type: ignore[operator]
+
+
+def test_value_catalog_groups_and_exact():
+    phone = Smartphone("Phone", "Desc", 1.005, 100, 90.0, "A1", 128, "Blue")
+    grass = LawnGrass("Grass", "Desc", 0.1, 3, "Россия", "7 дней", "Зеленый")
+    shared = Product("Shared", "Desc", 0.2, 1)
+    phones = Category("Phones", "Desc", [phone, shared])
+    garden = Category("Garden", "Desc", [grass, shared])
+
+    result = value_catalog([phones, garden], exact=True)
+    assert result.by_category == {"Phones": Decimal("101.20"), "Garden": Decimal("0.50")}
+    assert result.by_type == {
+        "Smartphone": Decimal("101.00"),
+        "LawnGrass": Decimal("0.30"),
+        "Product": Decimal("0.20"),
+    }
+    assert result.total == Decimal("101.50")
+    assert result.quantity == 104
+
+    approx = value_catalog([phones, garden])
+    assert approx.total == pytest.approx(101.0)
+    assert category_value(garden) == pytest.approx(0.5)
+    with pytest.raises(TypeError):
+        category_value(garden, same_class=True)
@@ -0,0 +1,89 @@
+import gc
+import weakref
+
+import pytest
+
+from src.model import Category, Product
+from src.view_cache import ViewCache
+
+
+def make_category() -> Category:
+    return Category("Cat", "Desc", [Product("A", "Desc", 30.0, 1), Product("B", "Desc", 10.0, 0)])
+
+
+def test_hits_and_invalidation():
+    category = make_category()
+    a, b = list(category)
+    cache = ViewCache()
+    assert cache.get(category, "by_price") == [b, a]
+    assert cache.get(category, "by_price") == [b, a]
+    assert cache.get(category, "in_stock") == [a]
+    assert cache.get(category, "page", page=1, per_page=1) == ["A, 30.0 руб. Остаток: 1 шт."]
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.entries) == (1, 3, 3)
+
+    a.quantity = 5
+    assert cache.stats.entries == 2
+    b.set_price(40.0)
+    assert cache.stats.entries == 1
+    assert cache.get(category, "by_price") == [a, b]
+    b.quantity = 2
+    assert cache.get(category, "in_stock") == [a, b]
+
+    c = Product("C", "Desc", 1.0, 1)
+    category.add_product(c)
+    assert cache.stats.entries == 0
+    assert cache.get(category, "by_price")[0] is c
+    with pytest.raises(ValueError):
+        cache.get(category, "unknown")
+
+
+def test_memory_budget_eviction():
+    categories = [make_category() for _ in range(3)]
+    probe = ViewCache()
+    probe.get(categories[0], "page")
+    budget = probe.stats.size_bytes * 2
+    cache = ViewCache(max_bytes=budget)
+    for category in categories:
+        cache.get(category, "page")
+    stats = cache.stats
+    assert stats.evictions == 1 and stats.entries == 2 and stats.size_bytes <= budget
+    assert categories[0] not in cache._states and cache._on_product_added not in categories[0]._listeners
+    cache.get(categories[-1], "page")
+    assert cache.stats.hits == 1
+
+
+def test_released_categories_are_not_referenced():
+    category = make_category()
+    cache = ViewCache(max_bytes=1)
+    assert cache.get(category, "by_price") == sorted(category, key=lambda p: p.price)
+    assert cache._states == {} and cache._memberships == {}
+    assert category._listeners == [] and all(p._subscribers() == (category._product_listener,) for p in category)
+    ref = weakref.ref(category)
+    del category
+    gc.collect()
+    assert ref() is None
+
+    other = make_category()
+    cache = ViewCache()
+    cache.get(other, "page")
+    cache.get(other, "in_stock")
+    cache.clear()
+    assert cache._states == {} and cache._memberships == {}
+    assert other._listeners == [] and all(p._subscribers() == (other._product_listener,) for p in other)
+
+
+def test_unrelated_change_keeps_build_in_flight():
+    first, second = make_category(), make_category()
+    cache = ViewCache()
+    cache.get(second, "page")
+    far, near = next(iter(second)), next(iter(first))
+
+    def build(category: Category, prod: Product) -> str:
+        prod.quantity += 1
+        return str(category)
+
+    cache.register("touch", build, ())
+    cache.get(first, "touch", prod=far)
+    cache.get(first, "touch", prod=near)
+    assert (first, "touch", (("prod", far),)) in cache._entries
+    assert (first, "touch", (("prod", near),)) not in cache._entries